@@ -1,149 +1,80 @@
+import sms_timing # 가장 먼저 불러와 시작 시간 측정 기준으로 사용
+from sms_timing import importing
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-import requests
-from bs4 import BeautifulSoup
-import csv
 import os
 import datetime
-import time
 import threading
-from plyer import notification
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.dates as mdates
-from matplotlib import font_manager, rc
 import sys
-import schedule
-import winreg # For Windows registry access
+if sys.platform == 'win32':
+    import winreg # For Windows registry access
 import getpass # For getting the current user on macOS
 import plistlib # For macOS startup file
 import re # 정규표현식 라이브러리 추가
+from sms_alerts import compile_alert_plan, pct_from_max, pct_from_min
+from sms_core import (catch_up_missed_updates, get_historical_prices_from_csv, get_stock_price, load_initial_history,
+                      log_message, parse_periods, send_notification, update_stock_data)
+from sms_optimizer import SWEEP_METRICS, build_grid, optimize_alert_thresholds, pct_steps, result_to_condition
+import multiprocessing
+from sms_calendar import KRX_CALENDAR
+from sms_polling import AdaptivePoller
+from sms_scheduler import TimerScheduler
+from sms_workers import UpdateWorkerPool
+from sms_ringbuffer import QuoteRingBuffer
+from sms_collector import run_collector_process
+from sms_views import ChartViewCache, data_version
+from sms_dashboard import TickerDashboard, row_values
+from sms_notify import NotificationDispatcher
+from sms_metrics import REGISTRY, start_http_server
+import sms_logging
+# matplotlib(sms_plot)은 시각화 탭을 처음 열 때 불러옴
+
+# 로그 파일 (창 모드 빌드에서는 콘솔이 없으므로 여기에만 남음)
+LOG_FILE = os.path.join(os.path.expanduser('~'), 'Documents', 'sms_logs', 'sms.log')
+
+sms_timing.mark("모듈 로드 완료")
 
 # ====================================================================
 # 프로그램 버전 정의
 # ====================================================================
 __version__ = "1.0.1" # 패치 번호 업데이트 (버그 수정: 컴퓨터 시작 시 자동 실행 설정 관련)
 
-# 폰트 설정 (운영체제에 따라 자동 선택)
-if sys.platform == 'darwin': # macOS
-    rc('font', family='AppleGothic')
-    rc('axes', unicode_minus=False)
-elif sys.platform == 'win32':  # Windows
-    try:
-        font_name = font_manager.FontProperties(fname="c:/Windows/Fonts/malgun.ttf").get_name()
-        rc('font', family=font_name)
-    except:
-        pass # Malgun Gothic 폰트가 없는 경우
+# 설정 항목별로 변경 시 수행할 작업
+# - history: 과거 데이터 확보, reload: 회사명 조회 + 화면 갱신, display: 캐시된 데이터로 화면만 갱신
+# - schedule: 알림 시간/장중 폴링 재예약, period_widgets: 기간 버튼과 기간별 분석 표시 재구성
+SETTING_DEPENDENCIES = {
+    'stock_code': ('history', 'schedule', 'reload'),
+    'file_path': ('history', 'display'),
+    'notification_times': ('schedule',),
+    'intraday': ('schedule',),
+    'periods': ('period_widgets', 'display'),
+    # 알림 조건은 GUI가 컴파일된 계획을 바로 쓰므로, 2-프로세스 모드의 수집기에만 다시 넘겨주면 됨
+    'alert_conditions': ('collector',),
+}
+
+# 시각화 탭 차트 종류 (표시 이름 → sms_plot 스타일)
+CHART_STYLE_LABELS = {'선 차트': 'line', '캔들 차트': 'candle'}
+
+# 종목당 알림 조건 최대 개수 (조건은 컴파일되어 한 번에 평가되므로 수백 개까지 허용)
+MAX_ALERT_CONDITIONS = 300
+
+# 진단 탭의 성능 지표 갱신 주기(ms)
+DIAGNOSTICS_INTERVAL_MS = 2000
+
+# 폰트 설정은 matplotlib과 함께 처음 차트를 만들 때 적용됩니다. (sms_plot.configure_fonts)
+
+def dates_to_x(timestamps):
+    """차트 x좌표 변환 (작업자 스레드에서 호출되므로 matplotlib도 그쪽에서 처음 불러옴)"""
+    with importing('matplotlib'):
+        from sms_plot import dates_to_x as convert
+    return convert(timestamps)
 
 # ====================================================================
 # A. 핵심 로직: 데이터 수집 및 분석
 # ====================================================================
+# 데이터 수집, 저장, 알림 파이프라인은 헤드리스 수집기와 공유하기 위해
+# sms_core.py로 분리되었습니다.
 
-def log_message(level, message):
-    """지정된 형식으로 콘솔에 로그 메시지를 출력합니다."""
-    timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    print(f"[{timestamp}] [{level}] {message}")
-
-def get_stock_price(stock_code):
-    """지정된 주식 코드의 현재 가격을 크롤링하고 회사명을 반환합니다."""
-    url = f"https://finance.naver.com/item/main.naver?code={stock_code}"
-    headers = {'User-Agent': 'Mozilla/5.0'}
-    try:
-        response = requests.get(url, headers=headers)
-        if response.status_code == 200:
-            soup = BeautifulSoup(response.text, 'html.parser')
-            price_element = soup.select_one('.today .blind')
-            name_element = soup.select_one('.wrap_company h2 a')
-            current_price = int(price_element.text.replace(',', '')) if price_element else None
-            company_name = name_element.text if name_element else "Unknown"
-            return current_price, company_name
-    except Exception as e:
-        log_message("ERROR", f"가격 크롤링 실패: {e}")
-    return None, "Unknown"
-
-def get_historical_data_from_naver(stock_code, pages=10):
-    """
-    네이버 금융에서 과거 일별 데이터를 크롤링합니다. (종가 기준)
-    """
-    log_message("INFO", f"과거 데이터 크롤링 시작: {stock_code}")
-    data = []
-    url_base = f"https://finance.naver.com/item/sise_day.naver?code={stock_code}"
-    headers = {'User-Agent': 'Mozilla/5.0'}
-
-    for page in range(1, pages + 1):
-        url = f"{url_base}&page={page}"
-        try:
-            response = requests.get(url, headers=headers)
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                rows = soup.find('table', class_='type2').find_all('tr')
-                
-                for row in rows[2:]: # 헤더와 불필요한 행 제외
-                    cols = row.find_all('td')
-                    if len(cols) > 1:
-                        date_str = cols[0].text.strip()
-                        # 종가(Closing Price)
-                        price_str = cols[1].text.strip().replace(',', '')
-                        
-                        try:
-                            price = int(price_str)
-                            # 일별 데이터이므로, 시간은 00:00으로 통일
-                            timestamp = datetime.datetime.strptime(date_str, '%Y.%m.%d').strftime('%Y-%m-%d 00:00')
-                            data.append({'timestamp': timestamp, 'price': price})
-                        except (ValueError, IndexError):
-                            continue
-            else:
-                log_message("WARNING", f"과거 데이터 크롤링 중 오류: HTTP {response.status_code}")
-                break
-        except Exception as e:
-            log_message("ERROR", f"과거 데이터 크롤링 실패: {e}")
-            break
-            
-    # 날짜 기준 오름차순으로 정렬
-    data.sort(key=lambda x: datetime.datetime.strptime(x['timestamp'], '%Y-%m-%d %H:%M'))
-    log_message("SUCCESS", f"과거 데이터 크롤링 완료: 총 {len(data)}개 데이터 수집")
-    return data
-
-def save_data(file_path, data):
-    """
-    주식 데이터를 CSV 파일에 저장합니다.
-    """
-    headers = ['Timestamp', 'Price']
-    
-    # 디렉토리가 없으면 생성
-    os.makedirs(os.path.dirname(file_path), exist_ok=True)
-    
-    with open(file_path, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow(headers)
-        writer.writerows(data)
-    log_message("INFO", f"데이터 저장 완료: '{file_path}'")
-
-def get_historical_prices_from_csv(file_path):
-    """CSV 파일에서 시간별 데이터를 불러옵니다."""
-    data = []
-    if os.path.exists(file_path) and os.stat(file_path).st_size > 0:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            try:
-                # 헤더 건너뛰기
-                next(reader)
-                for row in reader:
-                    try:
-                        timestamp_str = row[0]
-                        price = int(row[1])
-                        data.append({'timestamp': datetime.datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M'), 'price': price})
-                    except (ValueError, IndexError):
-                        continue
-            except StopIteration:
-                pass
-    return data
-
-def send_notification(title, message):
-    """데스크톱 알림을 보냅니다."""
-    notification.notify(title=title, message=message, app_name='Stock Notifier', timeout=10)
-    log_message("INFO", f"알림 발송: {title}")
-    
 # ====================================================================
 # 운영체제별 자동 실행 설정 로직
 # ====================================================================
@@ -220,7 +151,7 @@ def remove_from_startup_macos(app_name):
 # ====================================================================
 
 class StockApp(tk.Tk):
-    def __init__(self):
+    def __init__(self, split_mode=False, startup_report=False, metrics_port=None):
         super().__init__()
         self.title("주식 가격 분석 프로그램")
         self.geometry("1000x700")
@@ -233,12 +164,21 @@ class StockApp(tk.Tk):
         default_file_path = os.path.join(os.path.expanduser('~'), 'Documents', 'stock_data.csv')
         self.file_path = tk.StringVar(value=default_file_path)
         self.startup_var = tk.BooleanVar()
+        # 장중 실시간 모드 (정규장 시간에만 N초 간격으로 조회)
+        self.intraday_var = tk.BooleanVar(value=False)
+        self.intraday_interval = tk.StringVar(value='60')
+        self.log_level = tk.StringVar(value=sms_logging.get_level())
         
         # 프로그램 시작 시 자동 실행 상태 확인 및 GUI에 반영
         self.check_startup_status()
         self.company_name = "Unknown"
         self.alert_conditions = []
+        self.alert_plan = compile_alert_plan([])
+        # 알림은 조건이 새로 발동할 때만, 발송기 스레드에서 보냄 (쿨다운/요약 묶음 포함)
+        self.notifier = NotificationDispatcher(send_notification, log=log_message)
         self.alert_frame = None
+        self.alert_list_frame = None
+        self.optimize_metric = tk.StringVar(value='hit_rate')
         
         self.notebook = None
         self.plot_frame = None
@@ -246,11 +186,53 @@ class StockApp(tk.Tk):
         self.last_update_label = None
         
         self.scheduled_jobs = []
+        self.scheduler = TimerScheduler(log=log_message)
+        self.scheduler.on_clock_jump = self._on_clock_jump
+        # 업데이트 작업은 고정 크기 작업자 풀에서 종목 단위로 하나씩만 실행 (관심 종목도 같은 풀에서 처리)
+        self.update_pool = UpdateWorkerPool(max_workers=2, max_queue=32, log=log_message)
+        self.poller = None
+        # 기간별 차트 데이터 캐시 (업데이트 직후 작업자 스레드에서 미리 준비)
+        self.chart_views = ChartViewCache(x_converter=dates_to_x)
+        self.chart = None
+        self.chart_style = tk.StringVar(value='선 차트')
+        # 차트를 작업자 스레드에서 Agg로 그릴지 여부 (sms_render)
+        self.offscreen_render = tk.BooleanVar(value=False)
+        # 대시보드: 현재 종목과 함께 표시할 관심 종목 (쉼표로 구분), 최고가/최저가 기준 기간
+        self.watchlist = tk.StringVar(value='')
+        self.dashboard_period = tk.StringVar()
+        self.dashboard_period_combo = None
+        self.dashboard = None
+        # 진단 탭: 성능 지표 표 (탭이 보이는 동안에만 주기적으로 갱신)
+        self.diagnostics_tree = None
+        self.diagnostics_after_id = None
+        self.startup_report = startup_report
+        # 백그라운드 로드 세대 번호 (설정이 바뀌어 더 새로운 로드가 시작되면 이전 결과는 버림)
+        self.load_generation = 0
+
+        # 2-프로세스 모드: 수집은 별도 프로세스가 맡고, GUI는 링 버퍼로 결과만 받음
+        self.split_mode = split_mode
+        self.ring = None
+        self.ring_seq = 0
+        self.collector_process = None
+        if self.split_mode:
+            self.ring = QuoteRingBuffer.create()
+            self.protocol("WM_DELETE_WINDOW", self.on_close)
         
-        self.load_historical_data()
-        self.create_widgets()
+        # 창을 먼저 띄우고, 과거 데이터 확보/회사명 조회/CSV 로드는 작업자 스레드에서 수행
+        with sms_timing.timed("위젯 생성"):
+            self.create_widgets()
         self.schedule_updates()
-        self.load_and_display_data()
+        self.load_and_display_data(load_history=True, on_done=self._on_initial_load_done)
+        self.after_idle(self._on_first_idle)
+
+        REGISTRY.gauge('sms_update_queue_depth', "대기 중인 업데이트 작업 수").set_function(self.update_pool.queue_depth)
+        self.metrics_server = None
+        if metrics_port:
+            try:
+                self.metrics_server = start_http_server(metrics_port)
+                log_message("SUCCESS", f"성능 지표 제공: http://127.0.0.1:{metrics_port}/metrics")
+            except OSError as e:
+                log_message("WARNING", f"성능 지표 서버를 시작하지 못했습니다: {e}")
         
         # 이전 설정값을 저장할 변수
         self.prev_stock_code = self.stock_code.get()
@@ -258,6 +240,11 @@ class StockApp(tk.Tk):
         self.prev_periods = self.periods.get()
         self.prev_file_path = self.file_path.get()
         self.prev_startup_status = self.startup_var.get()
+        self.prev_intraday = (self.intraday_var.get(), self.intraday_interval.get())
+        self.prev_alert_rules = self.alert_plan.rules
+
+        if self.split_mode:
+            self.after(500, self.poll_ring_buffer)
 
 
     def check_startup_status(self):
@@ -282,34 +269,15 @@ class StockApp(tk.Tk):
             plist_path = os.path.join(plist_dir, f'{app_name}.plist')
             self.startup_var.set(os.path.exists(plist_path))
 
-    def load_historical_data(self):
+    def load_historical_data(self, stock_code, file_path, periods_list):
         """
         프로그램 시작 시, CSV 파일이 없거나 비어 있으면
-        과거 데이터를 미리 저장합니다.
+        과거 데이터를 미리 저장합니다. (작업자 스레드)
+        2-프로세스 모드에서는 수집기 프로세스가 대신 수행합니다.
         """
-        # CSV 파일이 존재하고, 비어 있지 않은지 확인
-        if os.path.exists(self.file_path.get()) and os.stat(self.file_path.get()).st_size > 0:
-            log_message("INFO", "기존 데이터 파일 발견. 과거 데이터 로딩을 건너뜁니다.")
+        if self.split_mode:
             return
-
-        log_message("INFO", "기존 데이터 파일이 없어 과거 종가 데이터를 로드합니다.")
-        try:
-            periods_list = [int(p) for p in self.periods.get().split(',') if p.strip().isdigit()]
-            max_period = max(periods_list) if periods_list else 20
-            
-            # 1페이지당 약 10일치 데이터이므로, 최댓값에 따라 페이지 수 계산
-            pages = (max_period // 10) + 2
-            
-            initial_data = get_historical_data_from_naver(self.stock_code.get(), pages=pages)
-            
-            if initial_data:
-                data_to_save = [[d['timestamp'], d['price']] for d in initial_data]
-                save_data(self.file_path.get(), data_to_save)
-                log_message("SUCCESS", f"과거 데이터 로딩 완료: 총 {len(initial_data)}개의 데이터가 '{self.file_path.get()}'에 저장되었습니다.")
-            else:
-                log_message("ERROR", "과거 데이터 로딩 실패: 과거 데이터를 가져올 수 없습니다.")
-        except Exception as e:
-            log_message("ERROR", f"과거 데이터 로딩 중 오류 발생: {e}")
+        load_initial_history(stock_code, file_path, periods_list)
 
     def create_widgets(self):
         self.notebook = ttk.Notebook(self)
@@ -323,6 +291,16 @@ class StockApp(tk.Tk):
         self.notebook.add(self.plot_frame, text="시각화")
         self.setup_plot_tab(self.plot_frame)
 
+        self.dashboard_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.dashboard_frame, text="대시보드")
+        self.setup_dashboard_tab(self.dashboard_frame)
+
+        self.diagnostics_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.diagnostics_frame, text="진단")
+        self.setup_diagnostics_tab(self.diagnostics_frame)
+        # 차트(matplotlib)는 시각화 탭을 처음 열 때 만듦
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+
         version_label = ttk.Label(self, text=f"v{__version__}", font=("Helvetica", 8))
         version_label.pack(side=tk.BOTTOM, anchor=tk.E, padx=5, pady=2)
 
@@ -349,6 +327,13 @@ class StockApp(tk.Tk):
         # 자동 실행 체크박스 추가
         startup_checkbox = ttk.Checkbutton(input_frame, text="컴퓨터 시작 시 자동 실행", variable=self.startup_var)
         startup_checkbox.grid(row=4, column=0, columnspan=2, sticky='w', padx=5, pady=5)
+
+        # 장중 실시간 모드
+        intraday_frame = ttk.Frame(input_frame)
+        intraday_frame.grid(row=5, column=0, columnspan=3, sticky='w', padx=5, pady=5)
+        ttk.Checkbutton(intraday_frame, text="장중 실시간 모드 (정규장 시간에만 조회)", variable=self.intraday_var).pack(side='left')
+        ttk.Label(intraday_frame, text="조회 간격(초):").pack(side='left', padx=(10, 5))
+        ttk.Entry(intraday_frame, textvariable=self.intraday_interval, width=6).pack(side='left')
         
         input_frame.grid_columnconfigure(1, weight=1)
         
@@ -361,6 +346,24 @@ class StockApp(tk.Tk):
         alert_button_frame.pack(fill='x', padx=5, pady=5)
         ttk.Button(alert_button_frame, text="+ 조건 추가", command=self.add_alert_condition).pack(side='left', padx=5)
         ttk.Button(alert_button_frame, text="- 조건 제거", command=self.remove_alert_condition).pack(side='right', padx=5)
+        ttk.Button(alert_button_frame, text="조건 최적화", command=self.optimize_alert_conditions).pack(side='right', padx=5)
+        ttk.Combobox(alert_button_frame, textvariable=self.optimize_metric, values=list(SWEEP_METRICS),
+                     state="readonly", width=12).pack(side='right', padx=5)
+        ttk.Label(alert_button_frame, text="최적화 지표:").pack(side='right')
+
+        # 조건이 많아져도 설정 탭이 넘치지 않도록 스크롤 가능한 목록에 배치
+        list_container = ttk.Frame(self.alert_frame)
+        list_container.pack(fill='x', padx=5, pady=5)
+        alert_canvas = tk.Canvas(list_container, height=200, highlightthickness=0)
+        alert_scrollbar = ttk.Scrollbar(list_container, orient='vertical', command=alert_canvas.yview)
+        alert_canvas.configure(yscrollcommand=alert_scrollbar.set)
+        alert_scrollbar.pack(side='right', fill='y')
+        alert_canvas.pack(side='left', fill='both', expand=True)
+
+        self.alert_list_frame = ttk.Frame(alert_canvas)
+        list_window = alert_canvas.create_window((0, 0), window=self.alert_list_frame, anchor='nw')
+        self.alert_list_frame.bind('<Configure>', lambda e: alert_canvas.configure(scrollregion=alert_canvas.bbox('all')))
+        alert_canvas.bind('<Configure>', lambda e: alert_canvas.itemconfigure(list_window, width=e.width))
         
         self.add_alert_condition()
         
@@ -376,6 +379,13 @@ class StockApp(tk.Tk):
         self.update_button = ttk.Button(control_frame, text="설정", command=self.update_settings)
         self.update_button.pack(side='right')
 
+        # 로그 수준은 설정 버튼과 관계없이 바로 적용
+        log_level_combo = ttk.Combobox(control_frame, textvariable=self.log_level, values=list(sms_logging.LEVELS),
+                                       state='readonly', width=9)
+        log_level_combo.pack(side='right', padx=10)
+        log_level_combo.bind('<<ComboboxSelected>>', lambda e: sms_logging.set_level(self.log_level.get()))
+        ttk.Label(control_frame, text="로그 수준:").pack(side='right')
+
     def validate_settings(self):
         """설정값 유효성 검사"""
         # 1. 주식 코드 검사 (6자리 숫자로만 구성)
@@ -428,7 +438,14 @@ class StockApp(tk.Tk):
             self.file_path.set(self.prev_file_path)
             return False
 
-        # 5. 알림 조건 검사
+        # 5. 장중 조회 간격 검사 (5초 이상의 정수)
+        interval_str = self.intraday_interval.get().strip()
+        if not interval_str.isdigit() or int(interval_str) < 5:
+            messagebox.showerror("입력 오류", "장중 조회 간격은 5초 이상의 정수여야 합니다.")
+            self.intraday_interval.set(self.prev_intraday[1])
+            return False
+
+        # 6. 알림 조건 검사
         for condition in self.alert_conditions:
             try:
                 period = int(condition['period'].get())
@@ -454,10 +471,12 @@ class StockApp(tk.Tk):
         is_periods_changed = self.periods.get() != self.prev_periods
         is_file_path_changed = self.file_path.get() != self.prev_file_path
         is_startup_changed = self.startup_var.get() != self.prev_startup_status
+        is_intraday_changed = (self.intraday_var.get(), self.intraday_interval.get()) != self.prev_intraday
+        is_alert_changed = self.alert_plan.rules != self.prev_alert_rules
 
         # 데이터 업데이트가 필요한 변경사항이 있는지 확인
-        is_data_update_needed = is_stock_code_changed or is_time_changed or is_periods_changed or is_file_path_changed
-        is_any_changed = is_data_update_needed or is_startup_changed
+        is_data_update_needed = is_stock_code_changed or is_time_changed or is_periods_changed or is_file_path_changed or is_intraday_changed
+        is_any_changed = is_data_update_needed or is_startup_changed or is_alert_changed
         
         if not is_any_changed:
             messagebox.showinfo("설정", "변경된 설정이 없습니다.")
@@ -471,6 +490,7 @@ class StockApp(tk.Tk):
             if is_time_changed: changed_items.append("알림 시간")
             if is_periods_changed: changed_items.append("분석 기간")
             if is_file_path_changed: changed_items.append("CSV 파일 경로")
+            if is_intraday_changed: changed_items.append("장중 실시간 모드")
             
             changed_items_str = ", ".join(changed_items)
             
@@ -484,6 +504,9 @@ class StockApp(tk.Tk):
             else:
                 log_message("INFO", "설정 변경이 취소되었습니다. 이전 설정으로 되돌립니다.")
                 self.revert_settings()
+        elif is_alert_changed:
+            # 알림 조건만 바뀐 경우는 데이터를 다시 받을 필요가 없으므로 확인 없이 반영
+            self._apply_settings()
         
         if is_startup_changed: # 수정된 부분: 독립적인 if 블록으로 변경
             response = messagebox.askyesno(
@@ -504,6 +527,8 @@ class StockApp(tk.Tk):
         self.periods.set(self.prev_periods)
         self.file_path.set(self.prev_file_path)
         self.startup_var.set(self.prev_startup_status)
+        self.intraday_var.set(self.prev_intraday[0])
+        self.intraday_interval.set(self.prev_intraday[1])
         self.update_period_combos()
 
     def _apply_startup_settings(self):
@@ -543,181 +568,432 @@ class StockApp(tk.Tk):
                     messagebox.showerror("오류", "macOS 로그인 항목 제거에 실패했습니다.")
         
     def _apply_settings(self):
-        log_message("INFO", "모든 설정 변경을 반영합니다.")
+        log_message("INFO", "변경된 설정을 반영합니다.")
         
+        # 바뀐 설정 항목 (현재값, 이전값 비교)
+        changed = set()
+        if self.stock_code.get() != self.prev_stock_code: changed.add('stock_code')
+        if self.notification_times.get() != self.prev_notification_times: changed.add('notification_times')
+        if self.periods.get() != self.prev_periods: changed.add('periods')
+        if self.file_path.get() != self.prev_file_path: changed.add('file_path')
+        if (self.intraday_var.get(), self.intraday_interval.get()) != self.prev_intraday: changed.add('intraday')
+        if self.alert_plan.rules != self.prev_alert_rules: changed.add('alert_conditions')
+
         # 현재 설정값을 이전 설정값으로 저장
         self.prev_stock_code = self.stock_code.get()
         self.prev_notification_times = self.notification_times.get()
         self.prev_periods = self.periods.get()
         self.prev_file_path = self.file_path.get()
+        self.prev_intraday = (self.intraday_var.get(), self.intraday_interval.get())
+        self.prev_alert_rules = self.alert_plan.rules
         # self.prev_startup_status = self.startup_var.get()
+
+        # 바뀐 설정에 영향을 받는 작업만 수행 (캐시는 버리지 않음)
+        tasks = set()
+        for setting in changed:
+            tasks.update(SETTING_DEPENDENCIES[setting])
+        if self.split_mode and changed:
+            tasks.add('collector') # 수집기 프로세스는 모든 설정을 넘겨받으므로 다시 시작
+        log_message("INFO", f"변경된 설정: {', '.join(sorted(changed))} → 수행 작업: {', '.join(sorted(tasks))}")
         
-        # 주식 코드나 파일 경로가 변경되면 과거 데이터 다시 로드
-        self.load_historical_data()
-        
-        self.schedule_updates()
-        self.setup_plot_tab(self.plot_frame) # 시각화 탭 UI 업데이트
-        self.load_and_display_data()
+        if self.split_mode:
+            if 'collector' in tasks:
+                self.restart_collector_process()
+        elif 'schedule' in tasks:
+            self.schedule_updates()
+        if 'period_widgets' in tasks:
+            self.build_period_widgets()
+        # 주식 코드나 파일 경로가 변경되면 과거 데이터 확보부터 백그라운드에서 다시 로드
+        if 'history' in tasks or 'reload' in tasks:
+            self.load_and_display_data(load_history='history' in tasks, fetch_name='reload' in tasks)
+        elif 'display' in tasks:
+            self.refresh_display()
         
         # _apply_startup_settings 로직을 이 함수 안에 포함
         # self._apply_startup_settings()
 
 
     def schedule_updates(self):
-        log_message("INFO", "기존 알림 스케줄을 제거합니다.")
-        for job in self.scheduled_jobs:
-            schedule.cancel_job(job)
-        self.scheduled_jobs = []
+        if self.split_mode:
+            self.restart_collector_process()
+            return
 
-        log_message("INFO", "새로운 알림 시간을 예약합니다.")
+        log_message("INFO", "기존 알림 스케줄을 새로운 알림 시간으로 교체합니다.")
         times_str = self.notification_times.get()
         times_list = [t.strip() for t in times_str.split(',') if t.strip()]
 
-        for t in times_list:
-            try:
-                datetime.datetime.strptime(t, '%H:%M')
-                job = schedule.every().day.at(t).do(self.start_threaded_update)
-                self.scheduled_jobs.append(job)
-                log_message("SUCCESS", f"알림 시간이 {t}에 예약되었습니다.")
-            except ValueError:
-                pass
+        # 기존 매일 작업은 교체되고, 대기 중인 스케줄러 스레드는 즉시 깨어나 다음 실행 시각을 다시 계산
+        self.scheduled_jobs = self.scheduler.set_daily_times(times_list, self.on_scheduled_update)
+        for t in self.scheduled_jobs:
+            log_message("SUCCESS", f"알림 시간이 {t}에 예약되었습니다.")
         
         if not self.scheduled_jobs:
             log_message("WARNING", "유효한 알림 시간이 없어 자동 업데이트가 비활성화되었습니다.")
+
+        # 장중 실시간 모드: 종목이나 간격이 바뀔 수 있으므로 폴링 상태를 새로 시작
+        self.scheduler.cancel('intraday')
+        self.poller = None
+        if self.intraday_var.get():
+            interval = int(self.intraday_interval.get())
+            self.poller = AdaptivePoller(base_interval=interval, min_interval=max(5, interval // 4), max_interval=interval * 10)
+            delay = self.poller.next_delay(datetime.datetime.now())
+            self.scheduler.call_later(delay, self.on_intraday_poll, tag='intraday')
+            log_message("SUCCESS", f"장중 실시간 모드 활성화: {interval}초 간격 (첫 조회까지 {delay:.0f}초)")
             
-        if not hasattr(self, 'scheduler_thread') or not self.scheduler_thread.is_alive():
+        if not self.scheduler.is_running():
             log_message("INFO", "스케줄러 스레드를 시작합니다.")
-            self.scheduler_thread = threading.Thread(target=self.run_scheduler, daemon=True)
-            self.scheduler_thread.start()
+            self.scheduler.start()
+
+    # ------------------------------------------------------------------
+    # 2-프로세스 모드
+    # ------------------------------------------------------------------
+    def collector_config(self):
+        """현재 GUI 설정을 수집기 설정(sms_collector.py 형식)으로 변환합니다."""
+        return {
+            'tickers': [{'stock_code': code, 'file_path': path} for code, path in self.watched_tickers()],
+            'notification_times': self.notification_times.get(),
+            'periods': self.periods.get(),
+            'alert_conditions': [[period, max_pct, min_pct] for _, period, max_pct, min_pct in self.alert_plan.rules],
+            'intraday': self.intraday_var.get(),
+            'intraday_interval': int(self.intraday_interval.get()),
+            'desktop_notifications': True,
+        }
 
-    def run_scheduler(self):
-        while True:
-            schedule.run_pending()
-            time.sleep(1)
+    def restart_collector_process(self):
+        """설정이 바뀌면 수집기 프로세스를 새 설정으로 다시 시작합니다."""
+        self.stop_collector_process()
+        self.collector_process = multiprocessing.Process(
+            target=run_collector_process, args=(self.collector_config(), self.ring.name), daemon=True)
+        self.collector_process.start()
+        log_message("SUCCESS", f"수집기 프로세스 시작 (PID {self.collector_process.pid})")
+
+    def stop_collector_process(self):
+        if self.collector_process is not None and self.collector_process.is_alive():
+            self.collector_process.terminate()
+            self.collector_process.join(timeout=5)
+        self.collector_process = None
+
+    def poll_ring_buffer(self):
+        """링 버퍼에 새로 기록된 시세를 읽어 화면을 갱신합니다. (메인 스레드, 0.5초 간격)"""
+        records, self.ring_seq = self.ring.read_since(self.ring_seq)
+        stock_code = self.stock_code.get()
+        latest = None
+        dashboard_period = self.get_dashboard_period()
+        for record in records:
+            if record['stock_code'] == stock_code:
+                latest = record
+            if record['stock_code'] in self.dashboard.rows:
+                self.dashboard.update_row(record['stock_code'], row_values(
+                    record['price'], record['timestamp'], record['stats'], dashboard_period))
+        if latest is not None:
+            self.last_update_label.config(text=f"마지막 업데이트 시간: {latest['timestamp'].strftime('%Y-%m-%d %H:%M')}")
+            self.update_today_info(latest['price'], self.build_periods_analysis(latest['price'], latest['stats']))
+            # 수집기가 CSV를 갱신했으므로 차트 데이터는 작업자 스레드에서 다시 준비한 뒤 그림
+            future = self.update_pool.submit(f"views:{stock_code}", self.chart_views.rebuild,
+                                             stock_code, self.file_path.get(), parse_periods(self.periods.get()))
+            if future is not None:
+                future.add_done_callback(lambda f: self.after(0, lambda: self.update_plot_with_period(None)))
+        self.after(500, self.poll_ring_buffer)
+
+    def on_close(self):
+        if self.metrics_server is not None:
+            self.metrics_server.shutdown()
+        self.stop_collector_process()
+        if self.ring is not None:
+            self.ring.close()
+        self.destroy()
+
+    def on_scheduled_update(self):
+        """
+        알림 시간에 호출됩니다. 주말과 휴장일에는 조회하지 않습니다. (스케줄러 스레드)
+        작업 등록은 Tk 변수를 읽어야 하므로 메인 스레드로 넘깁니다.
+        """
+        if not KRX_CALENDAR.is_trading_day(datetime.date.today()):
+            log_message("INFO", "오늘은 휴장일이므로 예약된 업데이트를 건너뜁니다.")
+            return
+        self.after(0, self._start_scheduled_update)
 
-    def start_threaded_update(self):
-        log_message("INFO", "자동 업데이트 스레드 시작")
-        threading.Thread(target=self.perform_update_and_notify, daemon=True).start()
+    def _start_scheduled_update(self):
+        self.start_threaded_update()
+        self.start_watchlist_updates()
 
-    def perform_update_and_notify(self):
+    def on_intraday_poll(self):
+        """장중 실시간 모드의 조회 시점에 호출됩니다. (스케줄러 스레드, 작업 등록은 메인 스레드에서)"""
+        poller = self.poller
+        if poller is None:
+            return
+        self.after(0, lambda: self._start_intraday_poll(poller))
+
+    def _start_intraday_poll(self, poller):
+        if poller is not self.poller:
+            return # 설정 변경으로 폴링이 교체됨
+        future = self.start_threaded_update(show_errors=False)
+        if future is None:
+            self._rearm_intraday_poll(poller, None)
+        else:
+            future.add_done_callback(lambda f: self._rearm_intraday_poll(poller, f))
+
+    def _rearm_intraday_poll(self, poller, future):
+        """조회 결과로 다음 조회 시점을 계산하여 다시 예약합니다."""
+        if poller is not self.poller:
+            return # 설정 변경으로 폴링이 교체됨
+        result = None
+        if future is not None and not future.cancelled() and future.exception() is None:
+            result = future.result()
+        result = result or {}
+        delay = poller.next_delay(datetime.datetime.now(), result.get('price'), result.get('threshold_distance'))
+        self.scheduler.cancel('intraday')
+        self.scheduler.call_later(delay, self.on_intraday_poll, tag='intraday')
+
+    def _on_clock_jump(self, drift):
+        """시스템 시계 변경 또는 절전 복귀가 감지되면 호출됩니다. (스케줄러 스레드)"""
+        log_message("WARNING", f"시스템 시계 변경 또는 절전 복귀 감지 ({drift:+.0f}초). 놓친 알림 시간을 보충합니다.")
+        if drift > 0:
+            # 보충 작업이 먼저 등록되므로, 곧이어 실행될 밀린 예약 업데이트는 이 작업에 합류
+            self.after(0, self.start_catch_up)
+
+    def start_catch_up(self):
+        """놓친 알림 시간을 한 번의 묶음 조회로 보충합니다. (메인 스레드, 2-프로세스 모드에서는 수집기가 수행)"""
+        if self.split_mode:
+            return None
+        stock_code = self.stock_code.get()
+        future = self.update_pool.submit(stock_code, self.perform_catch_up, stock_code, self.file_path.get(),
+                                         parse_periods(self.periods.get()))
+        self.start_watchlist_updates(catch_up=True)
+        return future
+
+    def perform_catch_up(self, stock_code, file_path, periods_list):
+        """놓친 구간을 채우고 최종 상태에서 알림을 한 번만 평가합니다. (작업자 스레드)"""
+        try:
+            result = catch_up_missed_updates(stock_code, file_path, self.scheduled_jobs, self.alert_plan)
+        except Exception as e:
+            log_message("ERROR", f"놓친 알림 시간 보충 중 오류 발생: {e}")
+            return None
+        if result:
+            self.chart_views.rebuild(stock_code, file_path, periods_list)
+            self.notify_alerts(stock_code, result)
+            self.after(0, self.refresh_display)
+            log_message("SUCCESS", "놓친 알림 시간 보충 완료.")
+        return result
+
+    def start_watchlist_updates(self, catch_up=False):
+        """
+        관심 종목(현재 종목 제외)을 종목 단위 작업으로 업데이트합니다. (2-프로세스 모드에서는 수집기가 수행)
+        catch_up이면 현재가 조회 대신 놓친 알림 시간만 보충합니다. (메인 스레드)
+        """
+        if self.split_mode:
+            return
+        periods_list = parse_periods(self.periods.get())
+        for code, path in self.watched_tickers()[1:]:
+            self.update_pool.submit(code, self.perform_watchlist_update, code, path, periods_list, catch_up)
+
+    def perform_watchlist_update(self, stock_code, file_path, periods_list, catch_up=False):
+        """
+        관심 종목 하나의 과거 데이터를 확보하고 업데이트(또는 보충)한 뒤 대시보드 행을 갱신합니다. (작업자 스레드)
+        알림 조건은 2-프로세스 모드의 수집기와 같이 모든 관심 종목에 적용됩니다.
+        """
+        try:
+            self.load_historical_data(stock_code, file_path, periods_list)
+            if catch_up:
+                result = catch_up_missed_updates(stock_code, file_path, self.scheduled_jobs, self.alert_plan, periods_list)
+            else:
+                result = update_stock_data(stock_code, file_path, self.alert_plan, periods_list)
+        except Exception as e:
+            log_message("ERROR", f"[{stock_code}] 관심 종목 업데이트 중 오류 발생: {e}")
+            return None
+        if result:
+            self.notifier.submit(result, self.alert_plan)
+        prepared = self.chart_views.rebuild(stock_code, file_path, periods_list)
+        company_name = result['company_name'] if result else None
+        self.after(0, lambda: self.update_dashboard_row(stock_code, prepared, company_name))
+        return result
+
+    def notify_alerts(self, stock_code, result):
+        """
+        업데이트 결과를 알림 발송기에 넘깁니다. 새로 발동한 조건만 알리며,
+        실제 발송은 발송기 스레드에서 이루어지므로 기다리지 않습니다.
+        """
+        if result['company_name'] != "Unknown":
+            self.company_name = result['company_name']
+        self.notifier.submit(dict(result, company_name=self.company_name), self.alert_plan)
+
+    def start_threaded_update(self, show_errors=True):
+        """현재 종목의 업데이트 작업을 등록합니다. (메인 스레드, Tk 변수는 여기서 읽어 작업에 넘김)"""
+        stock_code = self.stock_code.get()
+        # 같은 종목의 업데이트가 진행 중이면 새로 실행하지 않고 진행 중인 작업에 합류
+        future = self.update_pool.submit(stock_code, self.perform_update_and_notify, stock_code, self.file_path.get(),
+                                         parse_periods(self.periods.get()), show_errors)
+        if future is not None:
+            log_message("INFO", f"자동 업데이트 작업 등록 (대기 {self.update_pool.queue_depth()}개, 작업 스레드 {self.update_pool.thread_count()}개)")
+        return future
+
+    def perform_update_and_notify(self, stock_code, file_path, periods_list, show_errors=True):
+        """
+        주가를 조회해 저장하고 알림 조건을 평가합니다. (작업자 스레드)
+        장중 폴링 간격 계산에 쓰이는 update_stock_data()의 결과를 반환합니다. (실패 시 None)
+        """
         log_message("INFO", "주가 데이터 업데이트를 수행합니다.")
         try:
-            stock_code = self.stock_code.get()
-            file_path = self.file_path.get()
-            current_price, self.company_name = get_stock_price(stock_code)
+            result = update_stock_data(stock_code, file_path, self.alert_plan)
             
-            if current_price:
-                data = get_historical_prices_from_csv(file_path)
-                
-                timestamp_now = datetime.datetime.now()
-                # 시간 정보도 함께 반영하여 저장
-                timestamp_str_now = timestamp_now.strftime('%Y-%m-%d %H:%M')
-                
-                # 기존 데이터의 마지막 날짜가 오늘 날짜와 같으면 덮어쓰고, 아니면 추가
-                if data and data[-1]['timestamp'].date() == timestamp_now.date():
-                    data[-1] = {'timestamp': timestamp_now, 'price': current_price}
-                else:
-                    data.append({'timestamp': timestamp_now, 'price': current_price})
-
-                # 수정된 시간 포맷으로 데이터 저장
-                data_to_save = [[d['timestamp'].strftime('%Y-%m-%d %H:%M'), d['price']] for d in data]
-                save_data(file_path, data_to_save)
-                
-                self.after(0, self.load_and_display_data)
-
-                alert_messages = []
-                for condition in self.alert_conditions:
-                    try:
-                        noti_period = int(condition['period'].get())
-                        noti_max_pct = float(condition['max_pct'].get())
-                        noti_min_pct = float(condition['min_pct'].get())
-                    except (ValueError, tk.TclError):
-                        continue
-                    
-                    if len(data) >= noti_period:
-                        recent_data = data[-noti_period:]
-                        recent_prices = [d['price'] for d in recent_data]
-                        
-                        max_price = max(recent_prices)
-                        min_price = min(recent_prices)
-                        
-                        pct_of_max_val = (1 - current_price / max_price) * 100 if max_price != 0 else 0
-                        pct_of_min_val = (current_price / min_price - 1) * 100 if min_price != 0 else 0
-                        
-                        if pct_of_max_val <= noti_max_pct:
-                            alert_messages.append(f"▼ {noti_period}일 최고가 근접: 현재가 {current_price}원\n(최고가 {max_price}원 대비 {pct_of_max_val:.2f}% 하락)")
-                        if pct_of_min_val <= noti_min_pct:
-                            alert_messages.append(f"▲ {noti_period}일 최저가 근접: 현재가 {current_price}원\n(최저가 {min_price}원 대비 {pct_of_min_val:.2f}% 상승)")
-
-                if alert_messages:
-                    title = f"주식 가격 알림 - {self.company_name} ({stock_code})"
-                    message = "\n\n".join(alert_messages)
-                    send_notification(title, message)
+            if result:
+                # 화면 갱신 전에 이 스레드에서 기간별 차트 데이터를 미리 준비
+                self.chart_views.rebuild(stock_code, file_path, periods_list)
+                # 회사명은 업데이트 결과에 들어 있으므로 알림 처리 후 화면만 갱신
+                self.notify_alerts(stock_code, result)
+                self.after(0, self.refresh_display)
                 
                 log_message("SUCCESS", "주가 업데이트 완료.")
+                return result
             else:
                 log_message("ERROR", "주가 업데이트 실패: 가격 정보를 가져올 수 없습니다.")
-                self.after(0, lambda: messagebox.showerror("업데이트 실패", "주가 정보를 가져올 수 없습니다."))
+                if show_errors:
+                    self.after(0, lambda: messagebox.showerror("업데이트 실패", "주가 정보를 가져올 수 없습니다."))
                 
         except Exception as e:
             log_message("ERROR", f"주가 업데이트 중 오류 발생: {e}")
-            self.after(0, lambda: messagebox.showerror("업데이트 오류", f"업데이트 중 오류가 발생했습니다: {e}"))
+            if show_errors:
+                self.after(0, lambda err=e: messagebox.showerror("업데이트 오류", f"업데이트 중 오류가 발생했습니다: {err}"))
+        return None
 
-    def load_and_display_data(self):
+    def get_chart_views(self):
+        """
+        현재 종목의 기간별 차트 데이터를 캐시에서 가져옵니다.
+        없거나 오래되었으면 None을 반환하고, 다시 준비하는 작업은 작업자 스레드에 맡깁니다.
+        """
+        stock_code = self.stock_code.get()
+        file_path = self.file_path.get()
+        periods_list = parse_periods(self.periods.get())
+        prepared = self.chart_views.get(stock_code, data_version(file_path), periods_list)
+        if prepared is None:
+            future = self.update_pool.submit(('views', stock_code, file_path), self.chart_views.get_or_build,
+                                             stock_code, file_path, periods_list)
+            if future is not None:
+                future.add_done_callback(lambda f: self.after(0, self.refresh_display))
+        return prepared
+
+    def load_and_display_data(self, load_history=False, fetch_name=True, on_done=None):
+        """
+        과거 데이터 확보, 회사명 조회, CSV 로드를 작업자 스레드에서 수행하고
+        끝나면 after()로 메인 스레드에 돌아와 화면을 갱신합니다. 그동안 화면에는 로드 중 상태를 표시합니다.
+        on_done: 화면 갱신 후 메인 스레드에서 호출할 함수
+        """
         log_message("INFO", "데이터 로드 및 GUI 업데이트 시작")
+        self.load_generation += 1
+        generation = self.load_generation
+        stock_code = self.stock_code.get()
         file_path = self.file_path.get()
-        data = get_historical_prices_from_csv(file_path)
-        
-        self.company_name = get_stock_price(self.stock_code.get())[1]
+        periods_list = parse_periods(self.periods.get())
+
+        self.status_label.config(text="상태: 데이터 불러오는 중...")
+        if self.chart is not None and not self.chart.has_data():
+            self.chart.show_message("데이터를 불러오는 중...")
+
+        def load():
+            company_name = None
+            if load_history:
+                with sms_timing.timed("과거 데이터 확보"):
+                    self.load_historical_data(stock_code, file_path, periods_list)
+            if fetch_name:
+                with sms_timing.timed("회사명 조회"):
+                    company_name = get_stock_price(stock_code)[1]
+            with sms_timing.timed("차트 데이터 준비"):
+                self.chart_views.get_or_build(stock_code, file_path, periods_list)
+            return company_name
+
+        future = self.update_pool.submit(('load', stock_code, file_path, load_history, fetch_name), load)
+        if future is None:
+            # 대기열이 가득 차 있으면 잠시 후 다시 시도
+            self.after(1000, lambda: self.load_and_display_data(load_history, fetch_name, on_done))
+            return
+        future.add_done_callback(lambda f: self.after(0, lambda: self._on_load_done(generation, f, on_done)))
+
+    def _on_load_done(self, generation, future, on_done):
+        """백그라운드 로드 결과를 화면에 반영합니다. (메인 스레드)"""
+        try:
+            company_name = future.result()
+        except Exception as e:
+            log_message("ERROR", f"데이터 로드 중 오류 발생: {e}")
+            if generation == self.load_generation:
+                self.status_label.config(text="상태: 데이터 로드 실패")
+                if self.chart is not None:
+                    self.chart.show_message("데이터를 불러오지 못했습니다.")
+            return
+        if generation != self.load_generation:
+            # 설정이 바뀌어 더 새로운 로드가 진행 중이면 화면은 그쪽에서 갱신
+            if on_done:
+                on_done()
+            return
+        if company_name is not None:
+            self.company_name = company_name
+        self.status_label.config(text="상태: 준비 완료")
+        self.refresh_display()
+        if on_done:
+            on_done()
+
+    def _on_first_idle(self):
+        sms_timing.mark("첫 화면 표시")
+        if self.startup_report:
+            log_message("INFO", sms_timing.report())
+
+    def _on_initial_load_done(self):
+        sms_timing.mark("초기 데이터 로드 완료")
+        if self.startup_report:
+            log_message("INFO", sms_timing.report())
+        self.start_catch_up()
+
+    def refresh_display(self):
+        """캐시된 차트 데이터로 분석 정보와 차트를 다시 표시합니다. (네트워크 조회 없음)"""
+        prepared = self.get_chart_views()
+        if prepared is None:
+            return # 작업자 스레드에서 준비가 끝나면 다시 호출됨
         
-        if not data:
+        if prepared['last'] is None:
             self.update_today_info("N/A", [])
             self.update_plot_with_period(None)
             self.last_update_label.config(text="마지막 업데이트 시간: N/A")
             log_message("WARNING", "데이터가 없어 UI를 '데이터 없음' 상태로 업데이트합니다.")
             return
             
-        last_data = data[-1]
+        last_data = prepared['last']
         last_price = last_data['price']
         
         self.last_update_label.config(text=f"마지막 업데이트 시간: {last_data['timestamp'].strftime('%Y-%m-%d %H:%M')}")
 
-        periods_analysis = []
-        periods_str = self.periods.get().strip()
-        if periods_str:
-            periods_list = sorted([int(p) for p in periods_str.split(',') if p.strip().isdigit()])
-
-            for period in periods_list:
-                if len(data) >= period:
-                    recent_data = data[-period:]
-                    prices = [d['price'] for d in recent_data]
-                    max_price = max(prices)
-                    min_price = min(prices)
-                    
-                    pct_of_max = (1 - last_price / max_price) * 100 if max_price != 0 else 0
-                    pct_of_min = (last_price / min_price - 1) * 100 if min_price != 0 else 0
-
-                    periods_analysis.append({
-                        'period': period,
-                        'max_price': max_price,
-                        'min_price': min_price,
-                        'pct_of_max': pct_of_max,
-                        'pct_of_min': pct_of_min
-                    })
-                else:
-                    periods_analysis.append({
-                        'period': period,
-                        'max_price': 'N/A',
-                        'min_price': 'N/A',
-                        'pct_of_max': 'N/A',
-                        'pct_of_min': 'N/A'
-                    })
-        self.update_today_info(last_price, periods_analysis)
+        self.update_today_info(last_price, self.build_periods_analysis(last_price, prepared['window_stats']))
         self.update_plot_with_period(None)
+        self.update_dashboard_row(self.stock_code.get(), prepared, self.company_name)
         log_message("SUCCESS", "GUI 업데이트 완료.")
+
+    def build_periods_analysis(self, last_price, window_stats):
+        """기간별 최고가/최저가로 '오늘의 주가 분석' 표시용 목록을 만듭니다."""
+        periods_analysis = []
+        for period in sorted(parse_periods(self.periods.get())):
+            if period in window_stats:
+                max_price, min_price = window_stats[period]
+                
+                pct_of_max = pct_from_max(last_price, max_price)
+                pct_of_min = pct_from_min(last_price, min_price)
+
+                periods_analysis.append({
+                    'period': period,
+                    'max_price': max_price,
+                    'min_price': min_price,
+                    'pct_of_max': pct_of_max,
+                    'pct_of_min': pct_of_min
+                })
+            else:
+                periods_analysis.append({
+                    'period': period,
+                    'max_price': 'N/A',
+                    'min_price': 'N/A',
+                    'pct_of_max': 'N/A',
+                    'pct_of_min': 'N/A'
+                })
+        return periods_analysis
     
     def setup_plot_tab(self, parent_frame):
-        log_message("INFO", "시각화 탭 UI를 재구성합니다.")
+        log_message("INFO", "시각화 탭 UI를 구성합니다.")
         for widget in parent_frame.winfo_children():
             widget.destroy()
 
@@ -726,23 +1002,19 @@ class StockApp(tk.Tk):
         main_frame.grid_columnconfigure(0, weight=3)
         main_frame.grid_columnconfigure(1, weight=1)
         
-        plot_area_frame = ttk.Frame(main_frame)
-        plot_area_frame.grid(row=0, column=0, sticky='nsew', padx=5, pady=5)
-
-        period_buttons_frame = ttk.Frame(plot_area_frame)
-        period_buttons_frame.pack(fill='x', padx=5, pady=5)
-        ttk.Button(period_buttons_frame, text="전체 기간 보기", command=lambda: self.update_plot_with_period(None)).pack(side='left', padx=5)
-        
-        periods_list = [int(p) for p in self.periods.get().split(',') if p.strip().isdigit()]
-        for p in periods_list:
-            ttk.Button(period_buttons_frame, text=f'최근 {p}일 데이터', command=lambda period=p: self.update_plot_with_period(period)).pack(side='left', padx=5)
-
-        self.fig = Figure(figsize=(5, 4), dpi=100)
-        self.ax = self.fig.add_subplot(111)
-        self.canvas = FigureCanvasTkAgg(self.fig, master=plot_area_frame)
-        self.canvas.draw()
-        self.canvas_widget = self.canvas.get_tk_widget()
-        self.canvas_widget.pack(fill='both', expand=True, padx=5, pady=5)
+        self.plot_area_frame = ttk.Frame(main_frame)
+        self.plot_area_frame.grid(row=0, column=0, sticky='nsew', padx=5, pady=5)
+
+        plot_controls_frame = ttk.Frame(self.plot_area_frame)
+        plot_controls_frame.pack(fill='x', padx=5, pady=5)
+        self.period_buttons_frame = ttk.Frame(plot_controls_frame)
+        self.period_buttons_frame.pack(side='left', fill='x')
+        style_combo = ttk.Combobox(plot_controls_frame, textvariable=self.chart_style, values=list(CHART_STYLE_LABELS),
+                                   state='readonly', width=10)
+        style_combo.pack(side='right', padx=5)
+        style_combo.bind('<<ComboboxSelected>>', self._on_chart_style_changed)
+        ttk.Checkbutton(plot_controls_frame, text="백그라운드 렌더링", variable=self.offscreen_render,
+                        command=self._on_render_mode_changed).pack(side='right', padx=5)
 
         control_area_frame = ttk.Frame(main_frame)
         control_area_frame.grid(row=0, column=1, sticky='nsew', padx=(10, 0))
@@ -754,12 +1026,28 @@ class StockApp(tk.Tk):
         self.last_update_label.pack(anchor='w')
         self.current_price_label = ttk.Label(today_info_frame, text="현재 가격: N/A", font=("Helvetica", 12, "bold"))
         self.current_price_label.pack(anchor='w', pady=(0, 10))
+
+        self.period_info_frame = ttk.Frame(today_info_frame)
+        self.period_info_frame.pack(fill='both', expand=True)
+        self.build_period_widgets()
+
+    def build_period_widgets(self):
+        """분석 기간에 따라 달라지는 기간 버튼과 기간별 분석 표시만 다시 만듭니다. (차트는 유지)"""
+        for frame in (self.period_buttons_frame, self.period_info_frame):
+            for widget in frame.winfo_children():
+                widget.destroy()
+
+        ttk.Button(self.period_buttons_frame, text="전체 기간 보기", command=lambda: self.update_plot_with_period(None)).pack(side='left', padx=5)
         
+        periods_list = [int(p) for p in self.periods.get().split(',') if p.strip().isdigit()]
+        for p in periods_list:
+            ttk.Button(self.period_buttons_frame, text=f'최근 {p}일 데이터', command=lambda period=p: self.update_plot_with_period(period)).pack(side='left', padx=5)
+
+        self.update_dashboard_periods()
+
         self.today_info_widgets = {}
-        periods_list = sorted([int(p) for p in self.periods.get().split(',') if p.strip().isdigit()])
-        
-        for period in periods_list:
-            frame = ttk.Frame(today_info_frame)
+        for period in sorted(periods_list):
+            frame = ttk.Frame(self.period_info_frame)
             frame.pack(fill='x', pady=2)
             
             period_label = ttk.Label(frame, text=f"--- 최근 {period}일 데이터 ---", font=("Helvetica", 10, "bold"))
@@ -784,6 +1072,194 @@ class StockApp(tk.Tk):
                 'pct_min': pct_min_label
             }
 
+    # ------------------------------------------------------------------
+    # 대시보드 탭
+    # ------------------------------------------------------------------
+    def setup_dashboard_tab(self, parent_frame):
+        controls = ttk.Frame(parent_frame)
+        controls.pack(fill='x', padx=5, pady=5)
+        ttk.Label(controls, text="관심 종목 (쉼표로 구분):").pack(side='left')
+        watchlist_entry = ttk.Entry(controls, textvariable=self.watchlist, width=40)
+        watchlist_entry.pack(side='left', padx=5)
+        watchlist_entry.bind('<Return>', lambda e: self.apply_watchlist())
+        ttk.Button(controls, text="적용", command=self.apply_watchlist).pack(side='left')
+        ttk.Label(controls, text="기준 기간(일):").pack(side='left', padx=(15, 0))
+        # 기간 목록은 build_period_widgets()에서 채움
+        self.dashboard_period_combo = ttk.Combobox(controls, textvariable=self.dashboard_period, state='readonly', width=6)
+        self.dashboard_period_combo.pack(side='left', padx=5)
+        self.dashboard_period_combo.bind('<<ComboboxSelected>>', lambda e: self.refresh_dashboard())
+        ttk.Button(controls, text="새로고침", command=self.refresh_dashboard).pack(side='right')
+
+        self.dashboard = TickerDashboard(parent_frame)
+        self.dashboard.pack(fill='both', expand=True, padx=5, pady=5)
+        self.update_dashboard_periods()
+
+    def update_dashboard_periods(self):
+        """대시보드 기준 기간 목록을 분석 기간에 맞춥니다. (대시보드 탭이 아직 없으면 만들 때 채움)"""
+        if self.dashboard_period_combo is None:
+            return
+        periods_list = [int(p) for p in self.periods.get().split(',') if p.strip().isdigit()]
+        self.dashboard_period_combo['values'] = sorted(periods_list)
+        if self.get_dashboard_period() not in periods_list and periods_list:
+            self.dashboard_period.set(min(periods_list))
+
+    def watched_tickers(self):
+        """
+        대시보드에 표시할 (종목 코드, CSV 경로) 목록입니다.
+        관심 종목의 CSV는 현재 CSV와 같은 폴더의 stock_data_<종목 코드>.csv입니다.
+        """
+        stock_code = self.stock_code.get()
+        file_path = self.file_path.get()
+        tickers = [(stock_code, file_path)]
+        folder = os.path.dirname(file_path)
+        for code in self.watchlist.get().split(','):
+            code = code.strip()
+            if re.fullmatch(r'\d{6}', code) and code not in [c for c, _ in tickers]:
+                tickers.append((code, os.path.join(folder, f"stock_data_{code}.csv")))
+        return tickers
+
+    def get_dashboard_period(self):
+        value = self.dashboard_period.get()
+        return int(value) if value.isdigit() else None
+
+    def apply_watchlist(self):
+        """
+        관심 종목 목록을 반영합니다. 새 종목은 과거 데이터를 받아 두고, 이후 알림 시간마다 함께 업데이트합니다.
+        2-프로세스 모드에서는 수집기를 새 목록으로 다시 시작해 수집기가 이를 맡습니다.
+        """
+        self.refresh_dashboard()
+        if self.split_mode:
+            self.restart_collector_process()
+        else:
+            self.start_watchlist_updates(catch_up=True)
+
+    def refresh_dashboard(self):
+        """관심 종목의 CSV를 작업자 스레드에서 읽어(캐시 사용) 대시보드 행을 갱신합니다."""
+        tickers = self.watched_tickers()
+        periods_list = parse_periods(self.periods.get())
+        self.dashboard.remove_missing([code for code, _ in tickers])
+        # 데이터가 아직 없는 종목도 행은 먼저 보이도록 빈 행을 만듦 (값은 N/A)
+        for code, _ in tickers:
+            if code not in self.dashboard.rows:
+                self.dashboard.update_row(code, {})
+
+        def load():
+            return [(code, self.chart_views.get_or_build(code, path, periods_list)) for code, path in tickers]
+
+        future = self.update_pool.submit(('dashboard', tuple(tickers)), load)
+        if future is not None:
+            future.add_done_callback(lambda f: self.after(0, lambda: self._on_dashboard_loaded(f)))
+
+    def _on_dashboard_loaded(self, future):
+        try:
+            results = future.result()
+        except Exception as e:
+            log_message("ERROR", f"대시보드 데이터 로드 중 오류 발생: {e}")
+            return
+        stock_code = self.stock_code.get()
+        for code, prepared in results:
+            self.update_dashboard_row(code, prepared, self.company_name if code == stock_code else None)
+
+    def setup_diagnostics_tab(self, parent_frame):
+        controls = ttk.Frame(parent_frame)
+        controls.pack(fill='x', padx=5, pady=5)
+        ttk.Label(controls, text=f"{DIAGNOSTICS_INTERVAL_MS // 1000}초마다 갱신 (이 탭이 보이는 동안)").pack(side='left')
+        ttk.Button(controls, text="새로고침", command=self.refresh_diagnostics).pack(side='right')
+
+        columns = ('labels', 'value')
+        self.diagnostics_tree = ttk.Treeview(parent_frame, columns=columns, show='tree headings')
+        self.diagnostics_tree.heading('#0', text="지표")
+        self.diagnostics_tree.heading('labels', text="라벨")
+        self.diagnostics_tree.heading('value', text="값")
+        self.diagnostics_tree.column('#0', width=260)
+        self.diagnostics_tree.column('labels', width=220)
+        self.diagnostics_tree.column('value', width=420)
+        scrollbar = ttk.Scrollbar(parent_frame, orient='vertical', command=self.diagnostics_tree.yview)
+        self.diagnostics_tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side='right', fill='y', pady=5)
+        self.diagnostics_tree.pack(fill='both', expand=True, padx=5, pady=5)
+
+    def refresh_diagnostics(self):
+        """성능 지표 표를 갱신하고, 진단 탭이 보이는 동안 DIAGNOSTICS_INTERVAL_MS 뒤에 다시 갱신합니다."""
+        if self.diagnostics_after_id is not None:
+            self.after_cancel(self.diagnostics_after_id)
+            self.diagnostics_after_id = None
+        if self.notebook.select() != str(self.diagnostics_frame):
+            return
+        tree = self.diagnostics_tree
+        # 행은 (지표 이름, 라벨)로 식별해 값만 바꿈 (스크롤 위치와 선택 유지)
+        seen = set()
+        for index, (name, labels, value) in enumerate(REGISTRY.snapshot()):
+            iid = f"{name}{labels}"
+            seen.add(iid)
+            if tree.exists(iid):
+                tree.item(iid, values=(labels, value))
+                tree.move(iid, '', index)
+            else:
+                tree.insert('', index, iid=iid, text=name, values=(labels, value))
+        for iid in tree.get_children():
+            if iid not in seen:
+                tree.delete(iid)
+        self.diagnostics_after_id = self.after(DIAGNOSTICS_INTERVAL_MS, self.refresh_diagnostics)
+
+    def update_dashboard_row(self, stock_code, prepared, company_name=None):
+        """준비된 차트 데이터로 대시보드 한 행을 갱신합니다. (바뀐 칸만 다시 그려짐)"""
+        if self.dashboard is None or stock_code not in [code for code, _ in self.watched_tickers()]:
+            return # 그사이 관심 종목에서 빠진 종목
+        if prepared['last'] is None:
+            self.dashboard.update_row(stock_code, {}) # 데이터가 없는 종목은 빈 행으로 유지
+            return
+        last = prepared['last']
+        values = row_values(last['price'], last['timestamp'], prepared['window_stats'], self.get_dashboard_period(),
+                            spark=prepared['views'][None]['prices'])
+        if company_name and company_name != "Unknown":
+            values['company_name'] = company_name
+        self.dashboard.update_row(stock_code, values)
+
+    def _on_tab_changed(self, event):
+        if self.notebook.select() == str(self.plot_frame):
+            self.ensure_chart()
+        elif self.notebook.select() == str(self.dashboard_frame):
+            self.refresh_dashboard()
+        elif self.notebook.select() == str(self.diagnostics_frame):
+            self.refresh_diagnostics()
+
+    def ensure_chart(self):
+        """차트를 처음 필요할 때 만듭니다. (matplotlib import와 폰트 설정이 이때 일어남)"""
+        if self.chart is not None:
+            return
+        style = CHART_STYLE_LABELS[self.chart_style.get()]
+        with sms_timing.timed("차트 생성"):
+            if self.offscreen_render.get():
+                # 작업자 스레드에서 Agg로 그리고 완성된 이미지만 표시 (확대/이동 도구 없음)
+                with importing('matplotlib'):
+                    from sms_render import OffscreenChart
+                self.chart = OffscreenChart(self.plot_area_frame, figsize=(5, 4), dpi=100, style=style, log=log_message)
+            else:
+                with importing('matplotlib'):
+                    from sms_plot import PriceChart
+                # 차트 요소는 한 번만 만들고 이후에는 데이터만 바꿔서 다시 그림
+                self.chart = PriceChart(self.plot_area_frame, figsize=(5, 4), dpi=100, style=style)
+                self.fig = self.chart.fig
+                self.ax = self.chart.ax
+                self.canvas = self.chart.canvas
+                self.chart.toolbar.pack(side='bottom', fill='x', padx=5)
+        self.canvas_widget = self.chart.widget
+        self.canvas_widget.pack(fill='both', expand=True, padx=5, pady=5)
+        self.update_plot_with_period(None)
+
+    def _on_render_mode_changed(self):
+        """렌더링 방식이 바뀌면 차트를 새로 만듭니다."""
+        if self.chart is None:
+            return
+        self.chart.destroy()
+        self.chart = None
+        self.ensure_chart()
+
+    def _on_chart_style_changed(self, event=None):
+        if self.chart is not None:
+            self.chart.set_style(CHART_STYLE_LABELS[self.chart_style.get()])
+
     def update_today_info(self, current_price, periods_analysis):
         """오늘 날짜의 분석 정보를 GUI에 업데이트합니다."""
         if isinstance(current_price, int):
@@ -838,12 +1314,29 @@ class StockApp(tk.Tk):
             elif not periods_list:
                 condition['period'].set('')
 
+    def compile_alert_conditions(self, *args):
+        """
+        GUI의 알림 조건들을 평가 계획으로 컴파일합니다.
+        Tk 변수는 메인 스레드에서만 읽고, 업데이트 스레드는 컴파일된 계획만 사용합니다.
+        """
+        conditions = []
+        for condition in self.alert_conditions:
+            try:
+                conditions.append((
+                    int(condition['period'].get()),
+                    float(condition['max_pct'].get()),
+                    float(condition['min_pct'].get())
+                ))
+            except (ValueError, tk.TclError):
+                continue
+        self.alert_plan = compile_alert_plan(conditions)
+
     def add_alert_condition(self):
-        if len(self.alert_conditions) >= 5:
-            messagebox.showwarning("제한", "알림 조건은 최대 5개까지 추가할 수 있습니다.")
+        if len(self.alert_conditions) >= MAX_ALERT_CONDITIONS:
+            messagebox.showwarning("제한", f"알림 조건은 최대 {MAX_ALERT_CONDITIONS}개까지 추가할 수 있습니다.")
             return
 
-        frame = ttk.Frame(self.alert_frame, padding=5, relief='solid', borderwidth=1)
+        frame = ttk.Frame(self.alert_list_frame, padding=5, relief='solid', borderwidth=1)
         frame.pack(fill='x', padx=5, pady=5)
 
         period_var = tk.StringVar()
@@ -871,68 +1364,118 @@ class StockApp(tk.Tk):
             'min_pct': min_pct_var,
             'combo': period_combo
         })
+        for var in (period_var, max_pct_var, min_pct_var):
+            var.trace_add('write', self.compile_alert_conditions)
         
         self.update_period_combos()
+        self.compile_alert_conditions()
 
     def remove_alert_condition(self):
         if len(self.alert_conditions) > 1:
             last_condition = self.alert_conditions.pop()
             last_condition['frame'].destroy()
+            self.compile_alert_conditions()
         else:
             messagebox.showwarning("제한", "최소 1개의 알림 조건은 필수입니다.")
 
+    def optimize_alert_conditions(self):
+        """저장된 과거 데이터로 기간과 비율 조합을 탐색하고, 최적 조합을 알림 조건에 반영합니다."""
+        periods_list = sorted({int(p) for p in self.periods.get().split(',') if p.strip().isdigit()})
+        if not periods_list:
+            messagebox.showwarning("최적화", "최적화에 사용할 데이터 또는 분석 기간이 없습니다.")
+            return
+
+        # Tk 변수는 메인 스레드에서 읽어 두고, CSV 읽기부터는 작업 스레드에서 처리
+        file_path = self.file_path.get()
+        metric = self.optimize_metric.get()
+        candidates = build_grid(periods_list, pct_steps(0.5, 10.0, 0.5), pct_steps(0.5, 10.0, 0.5))
+        log_message("INFO", f"알림 조건 최적화 시작: {len(candidates)}개 조합, 지표 '{metric}'")
+        self.status_label.config(text="상태: 알림 조건 최적화 중...")
+
+        def run_optimizer():
+            try:
+                data = get_historical_prices_from_csv(file_path)
+                if not data:
+                    self.after(0, self._on_optimize_no_data)
+                    return
+                results = optimize_alert_thresholds([d['price'] for d in data], candidates, metric=metric,
+                                                    highs=[d['high'] for d in data], lows=[d['low'] for d in data],
+                                                    timestamps=[d['timestamp'] for d in data])
+            except Exception as e:
+                log_message("ERROR", f"알림 조건 최적화 실패: {e}")
+                results = None
+            self.after(0, lambda: self._on_optimize_done(results, metric))
+
+        threading.Thread(target=run_optimizer, daemon=True).start()
+
+    def _on_optimize_no_data(self):
+        self.status_label.config(text="상태: 준비 완료")
+        messagebox.showwarning("최적화", "최적화에 사용할 데이터 또는 분석 기간이 없습니다.")
+
+    def _on_optimize_done(self, results, metric):
+        self.status_label.config(text="상태: 준비 완료")
+        if not results:
+            messagebox.showinfo("최적화 결과", "조건을 만족하는 조합을 찾지 못했습니다.")
+            return
+
+        lines = [f"{i}. {r['period']}일 / 최고가 대비 {r['max_pct']}% / 최저가 대비 {r['min_pct']}% "
+                 f"→ {metric}={r[metric]:.3f} (알림 {r['alerts']}회)"
+                 for i, r in enumerate(results[:5], start=1)]
+        log_message("SUCCESS", f"알림 조건 최적화 완료: 1위 {lines[0]}")
+        if messagebox.askyesno("최적화 결과", "\n".join(lines) + "\n\n1위 조합을 첫 번째 알림 조건에 적용하시겠습니까?"):
+            self.apply_alert_condition(0, *result_to_condition(results[0]))
+            if self.alert_plan.rules != self.prev_alert_rules:
+                self.update_settings() # 2-프로세스 모드면 수집기에도 새 조건을 넘김
+
+    def apply_alert_condition(self, index, period, max_pct, min_pct):
+        """index번째 알림 조건에 설정값을 반영합니다."""
+        condition = self.alert_conditions[index]
+        condition['period'].set(str(period))
+        condition['max_pct'].set(str(max_pct))
+        condition['min_pct'].set(str(min_pct))
+        log_message("INFO", f"알림 조건 {index + 1} 적용: {period}일, {max_pct}%, {min_pct}%")
+
     def browse_file_path(self):
         filename = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files", "*.csv")])
         if filename:
             self.file_path.set(filename)
-        self.load_and_display_data()
+        self.load_and_display_data(fetch_name=False)
 
     def update_plot_with_period(self, period_to_show):
-        file_path = self.file_path.get()
-        data = get_historical_prices_from_csv(file_path)
-        
-        self.ax.clear()
+        if self.chart is None:
+            return # 시각화 탭을 처음 열 때 그려짐
+        # 기간 전환은 미리 준비된 차트 데이터를 꺼내 쓰기만 함 (CSV 재로드 없음)
+        prepared = self.get_chart_views()
+        if prepared is None:
+            return # 작업자 스레드에서 준비가 끝나면 다시 그려짐
+        views = prepared['views']
         
-        if not data:
-            self.ax.set_title("데이터 파일이 없습니다.")
-            self.canvas.draw()
+        if not views:
+            self.chart.show_message("데이터 파일이 없습니다.")
             return
 
-        if period_to_show is not None and len(data) >= period_to_show:
-            data = data[-period_to_show:]
-            title_text = f"{self.company_name}({self.stock_code.get()}) 주가 추이 (최근 {period_to_show}일)"
+        view = views.get(period_to_show) or views[None]
+        if view['period'] is not None:
+            title_text = f"{self.company_name}({self.stock_code.get()}) 주가 추이 (최근 {view['period']}일)"
         else:
             title_text = f"{self.company_name}({self.stock_code.get()}) 주가 추이 (전체)"
 
-        timestamps = [d['timestamp'] for d in data]
-        prices = [d['price'] for d in data]
-
-        self.ax.plot(timestamps, prices, label='주가', marker='o', markersize=3)
-        
-        if len(prices) > 0:
-            max_price = max(prices)
-            min_price = min(prices)
-            self.ax.axhline(y=max_price, color='r', linestyle='--', label=f'기간 내 최고가 ({max_price:,})')
-            self.ax.axhline(y=min_price, color='b', linestyle='--', label=f'기간 내 최저가 ({min_price:,})')
-            self.ax.legend()
-
-        self.ax.set_title(title_text)
-        self.ax.set_xlabel("날짜 및 시간")
-        self.ax.set_ylabel("가격")
-        
-        # 수정된 부분: 시간도 표시되도록 포맷 변경
-        formatter = mdates.DateFormatter('%Y-%m-%d %H:%M')
-        self.ax.xaxis.set_major_formatter(formatter)
-        
-        self.fig.autofmt_xdate()
-        
-        self.ax.grid(True)
-        self.canvas.draw()
+        self.chart.update(view['timestamps'], view['prices'], title_text, xs=view['xs'], highs=view['highs'], lows=view['lows'],
+                          opens=view['opens'], volumes=view['volumes'])
 
 # ====================================================================
 # C. 메인 실행
 # ====================================================================
 
 if __name__ == "__main__":
-    app = StockApp()
+    multiprocessing.freeze_support() # PyInstaller 단일 파일 빌드에서 프로세스 풀 사용
+    # --log-level=DEBUG: 시작 로그 수준 (실행 중에는 설정 탭에서 변경)
+    log_level = next((arg.split('=', 1)[1] for arg in sys.argv[1:] if arg.startswith('--log-level=')), 'INFO')
+    sms_logging.setup_logging(level=log_level, log_file=LOG_FILE)
+    # --split: 수집기와 GUI를 별도 프로세스로 실행 (공유 메모리 링 버퍼로 연결)
+    # --startup-report: 모듈 import와 첫 화면 표시까지 걸린 시간을 로그로 출력
+    # --metrics-port=9108: 성능 지표를 http://127.0.0.1:9108/metrics 로 제공 (Prometheus 텍스트 형식)
+    metrics_port = next((int(arg.split('=', 1)[1]) for arg in sys.argv[1:] if arg.startswith('--metrics-port=')), None)
+    app = StockApp(split_mode='--split' in sys.argv[1:], startup_report='--startup-report' in sys.argv[1:],
+                   metrics_port=metrics_port)
     app.mainloop()
\ No newline at end of file
@@ -0,0 +1,351 @@
+# ====================================================================
+# SMS 벤치마크 실행기
+# ====================================================================
+# 업데이트와 화면 갱신에서 시간이 많이 드는 구간을 네트워크 없이 측정합니다.
+# - HTML 파싱: fixtures/의 네이버 금융 페이지(종목 메인, 일별 시세) 사본 (bs4 필요)
+# - CSV 저장/로드: 1만/10만/100만 행
+# - 기간별 최고가/최저가 분석, 알림 조건 평가, 기간별 차트 데이터 준비
+# - 차트 그리기: 시계열 길이와 스타일별로 Agg 캔버스에 한 번 그리는 시간 (matplotlib 필요)
+# 입력은 모두 synthetic.py의 시드 고정 생성기로 만들며, 필요한 라이브러리가 없는 항목은 건너뜁니다.
+#
+# 사용법 (저장소 최상위 폴더에서):
+#   python benchmarks/run.py                          # 실행 후 baseline.json과 비교
+#   python benchmarks/run.py --quick                  # 100만 행 항목 제외
+#   python benchmarks/run.py --filter csv             # 이름에 csv가 들어간 항목만
+#   python benchmarks/run.py --output result.json     # 결과를 JSON으로 저장
+#   python benchmarks/run.py --save-baseline          # 결과를 새 기준(baseline.json)으로 저장
+# 기준보다 --tolerance(기본 50%) 넘게 느려진 항목이 있으면 종료 코드 1을 반환합니다.
+# - 반복 측정 사이사이에 고정된 순수 파이썬 연산(보정 측정)을 번갈아 재고, 최솟값을 보정 측정의
+#   최솟값으로 나눈 상대값끼리 비교합니다. 컴퓨터 속도나 측정 중 부하가 달라도 보정 측정에 같이 반영되어 상쇄됩니다.
+# - 최솟값은 다른 프로세스의 간섭이 가장 적은 측정이라 중앙값보다 덜 흔들립니다.
+# 그래도 남는 차이가 있으므로, 기준은 가능하면 비교할 컴퓨터에서 --save-baseline으로 만드세요.
+
+import argparse
+import datetime
+import gc
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from sms_alerts import compile_alert_plan, compute_window_stats
+from sms_calendar import SeriesDateIndex
+from sms_core import (evaluate_series, get_historical_prices_from_csv, parse_history_page, parse_quote_html,
+                      save_data)
+import sms_logging
+from sms_views import build_period_views
+from synthetic import alert_conditions, csv_rows, ohlcv_series
+
+FIXTURES_DIR = os.path.join(BENCH_DIR, 'fixtures')
+BASELINE_PATH = os.path.join(BENCH_DIR, 'baseline.json')
+
+CSV_SIZES = (10_000, 100_000, 1_000_000)
+ANALYSIS_SIZES = (10_000, 100_000)
+PLOT_SIZES = (1_000, 10_000, 100_000)
+# 분석 기간 5, 10, ..., 250일 (50개)
+PERIODS = tuple(range(5, 255, 5))
+# 종목당 최대 알림 조건 수와 같음 (SMS-v1.0.1.py의 MAX_ALERT_CONDITIONS)
+ALERT_CONDITION_COUNT = 300
+QUICK_MAX_ROWS = 100_000
+
+BENCHMARKS = []
+
+
+def benchmark(name, params=(None,), requires=()):
+    """
+    벤치마크 등록 데코레이터. 함수는 (param, workdir)을 받아 준비를 마친 뒤 측정할 호출 가능 객체를 반환합니다.
+    requires에 적은 모듈이 설치되어 있지 않으면 건너뜁니다.
+    """
+    def register(fn):
+        for param in params:
+            BENCHMARKS.append({'name': name if param is None else f"{name}[{param}]", 'fn': fn, 'param': param,
+                               'requires': tuple(requires)})
+        return fn
+    return register
+
+
+def read_fixture(filename):
+    with open(os.path.join(FIXTURES_DIR, filename), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def param_rows(param):
+    """'line-10000'처럼 여러 값을 묶은 파라미터의 행 수"""
+    return int(str(param).rsplit('-', 1)[-1])
+
+
+# ====================================================================
+# 벤치마크 항목
+# ====================================================================
+
+@benchmark('parse_quote', requires=('bs4',))
+def bench_parse_quote(param, workdir):
+    html = read_fixture('naver_item_main.html')
+    price, name = parse_quote_html(html)
+    assert (price, name) == (79600, '삼성전자'), (price, name)
+    return lambda: parse_quote_html(html)
+
+
+@benchmark('parse_history', requires=('bs4',))
+def bench_parse_history(param, workdir):
+    html = read_fixture('naver_sise_day.html')
+    rows, oldest = parse_history_page(html)
+    assert len(rows) == 10 and oldest == datetime.date(2024, 6, 3), (len(rows), oldest)
+    return lambda: parse_history_page(html)
+
+
+@benchmark('csv_save', params=CSV_SIZES)
+def bench_csv_save(rows, workdir):
+    data = csv_rows(ohlcv_series(rows))
+    path = os.path.join(workdir, f"save_{rows}.csv")
+    return lambda: save_data(path, data)
+
+
+@benchmark('csv_load', params=CSV_SIZES)
+def bench_csv_load(rows, workdir):
+    path = os.path.join(workdir, f"load_{rows}.csv")
+    save_data(path, csv_rows(ohlcv_series(rows)))
+    return lambda: get_historical_prices_from_csv(path)
+
+
+@benchmark('window_stats', params=ANALYSIS_SIZES)
+def bench_window_stats(rows, workdir):
+    data = ohlcv_series(rows)
+    prices = [d['price'] for d in data]
+    highs = [d['high'] for d in data]
+    lows = [d['low'] for d in data]
+    date_index = SeriesDateIndex(d['timestamp'] for d in data)
+
+    def run():
+        window_starts = date_index.window_starts(PERIODS)
+        return compute_window_stats(prices, PERIODS, window_starts, highs, lows)
+    return run
+
+
+@benchmark('alert_eval', params=ANALYSIS_SIZES)
+def bench_alert_eval(rows, workdir):
+    data = ohlcv_series(rows)
+    prices = [d['price'] for d in data]
+    highs = [d['high'] for d in data]
+    lows = [d['low'] for d in data]
+    plan = compile_alert_plan(alert_conditions(ALERT_CONDITION_COUNT, PERIODS))
+    window_starts = SeriesDateIndex(d['timestamp'] for d in data).window_starts(plan.periods)
+
+    def run():
+        plan.evaluate(prices, prices[-1], window_starts, highs, lows)
+        return plan.threshold_distance(prices, prices[-1], window_starts, highs, lows)
+    return run
+
+
+@benchmark('evaluate_series', params=ANALYSIS_SIZES)
+def bench_evaluate_series(rows, workdir):
+    """업데이트 한 번의 분석 전체 (분석 기간 3개 + 알림 조건 300개)"""
+    data = ohlcv_series(rows)
+    date_index = SeriesDateIndex(d['timestamp'] for d in data)
+    plan = compile_alert_plan(alert_conditions(ALERT_CONDITION_COUNT, PERIODS))
+    return lambda: evaluate_series('005930', '삼성전자', data, date_index, plan, (20, 120, 250))
+
+
+@benchmark('chart_views', params=ANALYSIS_SIZES)
+def bench_chart_views(rows, workdir):
+    data = ohlcv_series(rows)
+    return lambda: build_period_views(data, (20, 120, 250))
+
+
+@benchmark('plot_render', params=[f"{style}-{rows}" for style in ('line', 'candle') for rows in PLOT_SIZES],
+           requires=('matplotlib', 'numpy'))
+def bench_plot_render(param, workdir):
+    import warnings
+    import matplotlib
+    matplotlib.use('Agg')
+    # 한글 폰트가 없는 환경에서 글자마다 나오는 경고는 측정과 무관하므로 숨김
+    warnings.filterwarnings('ignore', message='Glyph .* missing from font')
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from sms_plot import ChartFigure, dates_to_x
+
+    style, rows = param.rsplit('-', 1)
+    data = ohlcv_series(int(rows), freq='day')
+    columns = {key: [d[key] for d in data] for key in ('timestamp', 'price', 'high', 'low', 'open', 'volume')}
+    xs = dates_to_x(columns['timestamp'])
+    figure = ChartFigure(figsize=(10, 5), dpi=100, style=style)
+    canvas = FigureCanvasAgg(figure.fig)
+    calls = [0]
+
+    def run():
+        # 제목을 바꿔 매번 새 데이터로 인식되게 함 (같은 내용이면 set_series가 아무것도 하지 않음)
+        calls[0] += 1
+        figure.set_series(columns['timestamp'], columns['price'], f"벤치마크 {calls[0]}", xs=xs,
+                          highs=columns['high'], lows=columns['low'], opens=columns['open'], volumes=columns['volume'])
+        canvas.draw()
+    return run
+
+
+# ====================================================================
+# 측정과 비교
+# ====================================================================
+
+def timeit_once(run):
+    """run()을 한 번 실행한 시간(초). timeit과 같이 가비지 컬렉션을 먼저 정리하고 실행 중에는 끕니다."""
+    gc.collect()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        run()
+        return time.perf_counter() - started
+    finally:
+        gc.enable()
+
+
+def measure(run, min_time=1.0, min_repeat=3, max_repeat=50):
+    """
+    한 번 예열한 뒤, 총 min_time초 이상이 되거나 max_repeat회가 될 때까지 반복 측정합니다. (최소 min_repeat회)
+    반복마다 보정 연산(calibration_loop)도 한 번씩 번갈아 재므로, 둘의 최솟값은 비슷한 상태의 컴퓨터에서 잰 값입니다.
+    """
+    run()
+    calibration_loop()
+    times = []
+    calibrations = []
+    while len(times) < max_repeat and (len(times) < min_repeat or sum(times) < min_time):
+        calibrations.append(timeit_once(calibration_loop))
+        times.append(timeit_once(run))
+    calibrations.append(timeit_once(calibration_loop))
+    return {'median': statistics.median(times), 'min': min(times), 'max': max(times), 'repeat': len(times),
+            'calibration': min(calibrations), 'relative': min(times) / min(calibrations)}
+
+
+def calibration_loop():
+    """보정 측정용 고정 연산 (정수 연산과 리스트/딕셔너리 조작, 수 ms)"""
+    counts = {}
+    values = []
+    for i in range(20_000):
+        key = i * 7919 % 101
+        counts[key] = counts.get(key, 0) + 1
+        values.append(key)
+    return sum(values)
+
+
+def missing_modules(modules):
+    return [name for name in modules if importlib.util.find_spec(name) is None]
+
+
+def run_benchmarks(selected, min_time):
+    results = {}
+    with tempfile.TemporaryDirectory(prefix='sms_bench_') as workdir:
+        for bench in selected:
+            missing = missing_modules(bench['requires'])
+            if missing:
+                results[bench['name']] = {'skipped': f"{', '.join(missing)} 없음"}
+                print(f"{bench['name']:<28} 건너뜀 ({', '.join(missing)} 없음)")
+                continue
+            run = bench['fn'](bench['param'], workdir)
+            result = measure(run, min_time=min_time)
+            results[bench['name']] = result
+            print(f"{bench['name']:<28} 중앙값 {format_seconds(result['median']):>10}  "
+                  f"최소 {format_seconds(result['min']):>10}  ({result['repeat']}회)")
+    return results
+
+
+def format_seconds(seconds):
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f}µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds:.3f}s"
+
+
+def environment():
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+    }
+
+
+def compare(results, baseline, tolerance):
+    """
+    기준 결과와 비교합니다. 반환값: 느려진 항목 이름 목록
+    양쪽에 보정 상대값('relative')이 있으면 그것을, 없으면(예전 기준 파일) 최솟값을 비교합니다.
+    기준이나 이번 실행 어느 한쪽에서 건너뛴 항목은 비교하지 않습니다.
+    """
+    regressions = []
+    print(f"\n기준 비교 (허용 범위 +{tolerance:.0%}):")
+    for name, result in results.items():
+        base = baseline.get('results', {}).get(name)
+        if 'min' not in result or not base or 'min' not in base:
+            continue
+        if 'relative' in result and 'relative' in base:
+            ratio = result['relative'] / base['relative']
+        else:
+            ratio = result['min'] / base['min']
+        if ratio > 1 + tolerance:
+            status = "느려짐"
+            regressions.append(name)
+        elif ratio < 1 / (1 + tolerance):
+            status = "빨라짐"
+        else:
+            status = "유지"
+        print(f"  {name:<28} {format_seconds(base['min']):>10} → {format_seconds(result['min']):>10}  "
+              f"x{ratio:.2f}  {status}")
+    if baseline.get('environment', {}).get('machine') != platform.machine():
+        print("  (주의: 기준과 다른 종류의 컴퓨터에서 측정한 결과입니다.)")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SMS 벤치마크 (네트워크 없이 실행)")
+    parser.add_argument('--filter', default='', help="이름에 이 문자열이 들어간 항목만 실행")
+    parser.add_argument('--quick', action='store_true', help=f"{QUICK_MAX_ROWS:,}행을 넘는 항목은 건너뜀")
+    parser.add_argument('--min-time', type=float, default=1.0, help="항목별 최소 측정 시간(초)")
+    parser.add_argument('--output', help="결과를 저장할 JSON 파일 경로")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="비교할 기준 결과 파일")
+    parser.add_argument('--save-baseline', action='store_true', help="이번 결과를 기준 결과 파일로 저장")
+    parser.add_argument('--tolerance', type=float, default=0.5, help="느려짐으로 판단하는 (보정한) 최솟값 증가 비율")
+    parser.add_argument('--list', action='store_true', help="항목 목록만 출력")
+    args = parser.parse_args(argv)
+
+    selected = [b for b in BENCHMARKS if args.filter in b['name']]
+    if args.quick:
+        selected = [b for b in selected
+                    if b['param'] is None or param_rows(b['param']) <= QUICK_MAX_ROWS]
+    if args.list:
+        for bench in selected:
+            print(bench['name'])
+        return 0
+
+    # 저장/로드할 때마다 남는 INFO 로그가 측정 결과 출력에 섞이지 않도록 함
+    sms_logging.setup_logging(level='WARNING')
+    report = {'environment': environment(), 'results': run_benchmarks(selected, args.min_time)}
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n기준 결과 저장: {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"\n기준 결과 파일이 없어 비교하지 않습니다: {args.baseline}")
+        return 0
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare(report['results'], baseline, args.tolerance)
+    if regressions:
+        print(f"\n느려진 항목 {len(regressions)}개: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+# ====================================================================
+# 벤치마크용 합성 데이터 생성기
+# ====================================================================
+# 네트워크나 실제 CSV 없이도 같은 입력으로 반복 측정할 수 있도록, 시드를 고정한
+# 난수로 주가 시계열과 알림 조건을 만듭니다.
+# - 가격은 호가 단위(100원)로 움직이는 랜덤 워크이며, 시가/고가/저가는 종가 주변에서 만듭니다.
+# - 시각은 거래일(KRX_CALENDAR)의 정규장 1분 간격(09:00~15:30) 또는 일별(00:00)입니다.
+
+import datetime
+import random
+
+from sms_calendar import KRX_CALENDAR
+from sms_core import make_row
+
+TICK = 100
+SESSION_OPEN = datetime.time(9, 0)
+SESSION_MINUTES = 391  # 09:00 ~ 15:30
+
+
+def trading_timestamps(count, start=datetime.date(2015, 1, 2), freq='minute', calendar=KRX_CALENDAR):
+    """start부터 거래일만 골라 count개의 시각을 만듭니다. freq: 'minute'(정규장 1분 간격) 또는 'day'"""
+    timestamps = []
+    day = start
+    per_day = SESSION_MINUTES if freq == 'minute' else 1
+    while len(timestamps) < count:
+        if calendar.is_trading_day(day):
+            opening = datetime.datetime.combine(day, SESSION_OPEN if freq == 'minute' else datetime.time(0, 0))
+            for minute in range(min(per_day, count - len(timestamps))):
+                timestamps.append(opening + datetime.timedelta(minutes=minute))
+        day += datetime.timedelta(days=1)
+    return timestamps
+
+
+def random_walk(count, start=70000, seed=0):
+    """호가 단위로 움직이는 가격 count개 (항상 양수)"""
+    rng = random.Random(seed)
+    price = start
+    prices = []
+    for _ in range(count):
+        price = max(TICK, price + rng.choice((-2, -1, -1, 0, 0, 0, 1, 1, 2)) * TICK)
+        prices.append(price)
+    return prices
+
+
+def ohlcv_series(count, seed=0, freq='minute', start=70000):
+    """make_row() 형식(시각은 datetime)의 시계열 count개"""
+    rng = random.Random(seed + 1)
+    timestamps = trading_timestamps(count, freq=freq)
+    data = []
+    for timestamp, close in zip(timestamps, random_walk(count, start, seed)):
+        open_price = max(TICK, close + rng.randint(-3, 3) * TICK)
+        high = max(close, open_price) + rng.randint(0, 4) * TICK
+        low = max(TICK, min(close, open_price) - rng.randint(0, 4) * TICK)
+        data.append(make_row(timestamp, close, open_price, high, low, rng.randint(1_000, 500_000)))
+    return data
+
+
+def csv_rows(data):
+    """save_data()에 넘길 행 목록 (시각은 CSV와 같은 '%Y-%m-%d %H:%M' 문자열)"""
+    return [[d['timestamp'].strftime('%Y-%m-%d %H:%M'), d['price'], d['open'], d['high'], d['low'], d['volume']]
+            for d in data]
+
+
+def alert_conditions(count, periods, seed=0):
+    """[(기간, 최고가 대비 %, 최저가 대비 %)] count개. 기간은 periods에서 고르고 비율은 0.5% 단위"""
+    rng = random.Random(seed)
+    return [(rng.choice(periods), rng.randint(1, 30) / 2, rng.randint(1, 30) / 2) for _ in range(count)]
@@ -0,0 +1,187 @@
+# ====================================================================
+# 알림 조건 컴파일러
+# ====================================================================
+# 알림 조건(기간, 최고가 대비 하락률, 최저가 대비 상승률) 목록을
+# 한 번에 평가할 수 있는 평가 계획(AlertPlan)으로 컴파일합니다.
+# - 같은 기간을 쓰는 조건은 하나의 윈도우로 묶습니다.
+# - 윈도우별 최고가/최저가는 데이터를 뒤에서부터 한 번만 훑으며 계산합니다.
+# - 윈도우별 임계값은 정렬해 두고 이진 탐색으로 발동 여부를 판정합니다.
+
+import bisect
+
+
+def compute_window_stats(prices, periods, window_starts=None, highs=None, lows=None):
+    """
+    여러 기간의 최고가/최저가를 데이터를 뒤에서부터 한 번만 순회하여 계산합니다.
+    window_starts({기간: 시작 행 번호})가 없으면 최근 N개 행을 N일 구간으로 봅니다.
+    highs/lows(일별 고가/저가)를 주면 최고가는 고가에서, 최저가는 저가에서 구합니다. (없으면 prices)
+    데이터가 부족한 기간은 결과에서 제외됩니다.
+    반환값: {기간: (최고가, 최저가)}
+    """
+    stats = {}
+    n = len(prices)
+    highs = prices if highs is None else highs
+    lows = prices if lows is None else lows
+
+    # 기간별 구간 길이(행 수)를 구하고, 길이가 같은 기간끼리 묶음
+    by_length = {}
+    for period in periods:
+        if window_starts is None:
+            length = period
+        elif period in window_starts:
+            length = n - window_starts[period]
+        else:
+            continue
+        if 0 < length <= n:
+            by_length.setdefault(length, []).append(period)
+    if not by_length:
+        return stats
+
+    lengths = sorted(by_length)
+    max_price = highs[n - 1]
+    min_price = lows[n - 1]
+    next_idx = 0
+    # 가장 짧은 구간부터 차례로 경계에 도달할 때마다 현재 누적값을 기록
+    for count in range(1, lengths[-1] + 1):
+        high = highs[n - count]
+        low = lows[n - count]
+        if high > max_price:
+            max_price = high
+        if low < min_price:
+            min_price = low
+        while next_idx < len(lengths) and lengths[next_idx] == count:
+            for period in by_length[count]:
+                stats[period] = (max_price, min_price)
+            next_idx += 1
+    return stats
+
+
+def pct_from_max(current_price, max_price):
+    """최고가 대비 하락률(%)"""
+    return (1 - current_price / max_price) * 100 if max_price != 0 else 0
+
+
+def pct_from_min(current_price, min_price):
+    """최저가 대비 상승률(%)"""
+    return (current_price / min_price - 1) * 100 if min_price != 0 else 0
+
+
+class AlertPlan:
+    """
+    컴파일된 알림 조건 평가 계획입니다.
+    compile_alert_plan()으로 생성하며, evaluate()는 스레드 안전하게 여러 번 호출할 수 있습니다.
+    """
+
+    def __init__(self, rules):
+        # rules: [(조건 번호, 기간, 최고가 대비 %, 최저가 대비 %)]
+        self.rules = tuple(rules)
+        windows = {}
+        for rule_id, period, max_pct, min_pct in self.rules:
+            max_rules, min_rules = windows.setdefault(period, ([], []))
+            max_rules.append((max_pct, rule_id))
+            min_rules.append((min_pct, rule_id))
+
+        # 기간별로 (임계값 오름차순 목록, 조건 번호 목록)을 미리 만들어 둠
+        self.windows = {}
+        for period, (max_rules, min_rules) in windows.items():
+            max_rules.sort()
+            min_rules.sort()
+            self.windows[period] = (
+                [pct for pct, _ in max_rules], [rule_id for _, rule_id in max_rules],
+                [pct for pct, _ in min_rules], [rule_id for _, rule_id in min_rules],
+            )
+        self.periods = tuple(sorted(self.windows))
+
+    def __len__(self):
+        return len(self.rules)
+
+    def evaluate(self, prices, current_price, window_starts=None, highs=None, lows=None, stats=None):
+        """
+        모든 조건을 한 번에 평가합니다.
+        window_starts, highs, lows는 compute_window_stats()와 같은 의미입니다.
+        이미 계산한 compute_window_stats() 결과가 있으면 stats로 넘겨 다시 계산하지 않습니다.
+        발동한 (기간, 종류)마다 하나의 알림 딕셔너리를 반환하며,
+        'rules'에는 해당 알림을 발동시킨 조건 번호들이 담깁니다.
+        """
+        alerts = []
+        if not self.periods or not current_price:
+            return alerts
+
+        if stats is None:
+            stats = compute_window_stats(prices, self.periods, window_starts, highs, lows)
+        for period in self.periods:
+            if period not in stats:
+                continue
+            max_price, min_price = stats[period]
+            max_thresholds, max_ids, min_thresholds, min_ids = self.windows[period]
+
+            # 임계값이 현재 비율 이상인 조건이 모두 발동 (오름차순 목록의 뒷부분)
+            pct_of_max = pct_from_max(current_price, max_price)
+            idx = bisect.bisect_left(max_thresholds, pct_of_max)
+            if idx < len(max_thresholds):
+                alerts.append({
+                    'period': period, 'kind': 'max', 'price': current_price,
+                    'ref_price': max_price, 'pct': pct_of_max, 'rules': max_ids[idx:]
+                })
+
+            pct_of_min = pct_from_min(current_price, min_price)
+            idx = bisect.bisect_left(min_thresholds, pct_of_min)
+            if idx < len(min_thresholds):
+                alerts.append({
+                    'period': period, 'kind': 'min', 'price': current_price,
+                    'ref_price': min_price, 'pct': pct_of_min, 'rules': min_ids[idx:]
+                })
+        return alerts
+
+    def threshold_distance(self, prices, current_price, window_starts=None, highs=None, lows=None, stats=None):
+        """
+        현재가가 가장 가까운 알림 임계값까지 남은 거리(%p)를 반환합니다.
+        이미 발동 중인 조건이 있으면 0, 평가할 조건이 없으면 None입니다. (stats는 evaluate()와 같음)
+        """
+        if not self.periods or not current_price:
+            return None
+        if stats is None:
+            stats = compute_window_stats(prices, self.periods, window_starts, highs, lows)
+        distance = None
+        for period in self.periods:
+            if period not in stats:
+                continue
+            max_price, min_price = stats[period]
+            max_thresholds, _, min_thresholds, _ = self.windows[period]
+            # 오름차순 목록의 마지막 값이 가장 먼저 발동하는 임계값
+            for gap in (pct_from_max(current_price, max_price) - max_thresholds[-1],
+                        pct_from_min(current_price, min_price) - min_thresholds[-1]):
+                gap = max(gap, 0)
+                if distance is None or gap < distance:
+                    distance = gap
+        return distance
+
+
+def compile_alert_plan(conditions):
+    """
+    알림 조건 목록을 평가 계획으로 컴파일합니다.
+    conditions: [(기간, 최고가 대비 %, 최저가 대비 %)]
+    기간이 0 이하이거나 비율이 음수인 조건은 제외합니다.
+    """
+    rules = []
+    for rule_id, (period, max_pct, min_pct) in enumerate(conditions):
+        if period <= 0 or max_pct < 0 or min_pct < 0:
+            continue
+        rules.append((rule_id, int(period), float(max_pct), float(min_pct)))
+    return AlertPlan(rules)
+
+
+def format_alert_message(alert):
+    """평가 결과 하나를 알림 메시지 문자열로 변환합니다."""
+    if alert['kind'] == 'max':
+        return (f"▼ {alert['period']}일 최고가 근접: 현재가 {alert['price']}원\n"
+                f"(최고가 {alert['ref_price']}원 대비 {alert['pct']:.2f}% 하락)")
+    return (f"▲ {alert['period']}일 최저가 근접: 현재가 {alert['price']}원\n"
+            f"(최저가 {alert['ref_price']}원 대비 {alert['pct']:.2f}% 상승)")
+
+
+def format_alert_summary(alert):
+    """여러 종목을 묶은 요약 알림에 쓰는 한 줄 요약"""
+    if alert['kind'] == 'max':
+        return f"{alert['period']}일 최고가 대비 {alert['pct']:.2f}%▼"
+    return f"{alert['period']}일 최저가 대비 {alert['pct']:.2f}%▲"
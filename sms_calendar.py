@@ -0,0 +1,230 @@
+# ====================================================================
+# 한국거래소(KRX) 거래일 달력 및 시계열 날짜 인덱스
+# ====================================================================
+# 분석 기간 'N일'을 CSV 행 수가 아닌 실제 거래일 수로 계산하기 위한 모듈입니다.
+# - 거래일 달력은 아래의 휴장일 표(KRX_HOLIDAYS)로부터 네트워크 없이 만들어집니다.
+# - 매년 날짜가 같은 휴장일(FIXED_HOLIDAYS)은 연도별로 자동 계산합니다. 설/추석 등 음력 휴장일과
+#   대체 휴장일은 계산할 수 없으므로, 표에 없는 해가 되면 경고를 남깁니다. 매년 말 다음 해 휴장일을 추가해 주세요.
+# - 시계열 날짜 인덱스는 행 추가 시 점진적으로 갱신되며, 윈도우 경계는 이진 탐색으로 찾습니다.
+
+import bisect
+import datetime
+
+from sms_logging import log_message
+
+# KRX 휴장일 (주말 제외, 연말 휴장일 포함)
+KRX_HOLIDAYS = (
+    # 2024
+    '2024-01-01', '2024-02-09', '2024-02-12', '2024-03-01', '2024-04-10',
+    '2024-05-01', '2024-05-06', '2024-05-15', '2024-06-06', '2024-08-15',
+    '2024-09-16', '2024-09-17', '2024-09-18', '2024-10-01', '2024-10-03',
+    '2024-10-09', '2024-12-25', '2024-12-31',
+    # 2025
+    '2025-01-01', '2025-01-27', '2025-01-28', '2025-01-29', '2025-01-30',
+    '2025-03-03', '2025-05-01', '2025-05-05', '2025-05-06', '2025-06-03',
+    '2025-06-06', '2025-08-15', '2025-10-03', '2025-10-06', '2025-10-07',
+    '2025-10-08', '2025-10-09', '2025-12-25', '2025-12-31',
+    # 2026
+    '2026-01-01', '2026-02-16', '2026-02-17', '2026-02-18', '2026-03-02',
+    '2026-05-01', '2026-05-05', '2026-05-25', '2026-06-03', '2026-08-17',
+    '2026-09-24', '2026-09-25', '2026-10-05', '2026-10-09', '2026-12-25',
+    '2026-12-31',
+)
+
+# 매년 날짜가 같은 휴장일 (월, 일): 신정, 삼일절, 근로자의 날, 어린이날, 현충일, 광복절, 개천절, 한글날, 성탄절, 연말 휴장일
+FIXED_HOLIDAYS = ((1, 1), (3, 1), (5, 1), (5, 5), (6, 6), (8, 15), (10, 3), (10, 9), (12, 25), (12, 31))
+
+# 정규장 운영 시간
+SESSION_OPEN = datetime.time(9, 0)
+SESSION_CLOSE = datetime.time(15, 30)
+
+
+def _to_ordinal(value):
+    """date/datetime/ordinal(int)을 날짜 ordinal로 변환합니다."""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, datetime.datetime):
+        value = value.date()
+    return value.toordinal()
+
+
+class TradingCalendar:
+    """
+    휴장일 표와 고정 휴장일로 만든 정렬된 거래일 목록입니다. 범위 밖 날짜를 조회하면 목록을 자동으로 확장합니다.
+    목록이 새 연도로 넓어질 때 그 해의 고정 휴장일을 더하며, 올해가 표에 없으면 경고를 한 번 남깁니다.
+    """
+
+    def __init__(self, holidays=KRX_HOLIDAYS, fixed_holidays=FIXED_HOLIDAYS):
+        self.holidays = {datetime.date.fromisoformat(d).toordinal() for d in holidays}
+        self.fixed_holidays = fixed_holidays
+        self.table_years = frozenset(datetime.date.fromordinal(o).year for o in self.holidays)
+        self._years = set() # 고정 휴장일을 더한 연도
+        first_year = min((datetime.date.fromordinal(o).year for o in self.holidays), default=datetime.date.today().year)
+        last_year = max((datetime.date.fromordinal(o).year for o in self.holidays), default=first_year)
+        self._first = datetime.date(first_year, 1, 1).toordinal()
+        self._last = self._first - 1
+        self._days = []
+        self._extend_to(datetime.date(last_year, 12, 31).toordinal())
+
+    def _is_open(self, ordinal):
+        # date.fromordinal(o).weekday()와 같음 (ordinal 1 = 0001-01-01 월요일)
+        return (ordinal - 1) % 7 < 5 and ordinal not in self.holidays
+
+    def _add_years(self, start, end):
+        """start~end(ordinal) 구간이 걸친 연도들의 고정 휴장일을 휴장일 집합에 더합니다."""
+        today_year = datetime.date.today().year
+        for year in range(datetime.date.fromordinal(start).year, datetime.date.fromordinal(end).year + 1):
+            if year in self._years:
+                continue
+            self._years.add(year)
+            self.holidays.update(datetime.date(year, month, day).toordinal() for month, day in self.fixed_holidays)
+            if year == today_year and year not in self.table_years:
+                log_message("WARNING", f"{year}년 KRX 휴장일이 휴장일 표에 없습니다. "
+                                       f"음력/대체 휴장일이 거래일로 계산되니 KRX_HOLIDAYS에 추가해 주세요.")
+
+    def _extend_to(self, ordinal):
+        if ordinal > self._last:
+            self._add_years(self._last + 1, ordinal)
+            self._days.extend(o for o in range(self._last + 1, ordinal + 1) if self._is_open(o))
+            self._last = ordinal
+
+    def _extend_back_to(self, ordinal):
+        if ordinal < self._first:
+            self._add_years(ordinal, self._first - 1)
+            self._days[:0] = [o for o in range(ordinal, self._first) if self._is_open(o)]
+            self._first = ordinal
+
+    def _ensure(self, ordinal):
+        self._extend_to(ordinal)
+        self._extend_back_to(ordinal)
+
+    def is_trading_day(self, day):
+        ordinal = _to_ordinal(day)
+        self._ensure(ordinal) # 처음 보는 연도의 고정 휴장일 반영
+        return self._is_open(ordinal)
+
+    def is_session_open(self, moment):
+        """moment(datetime)가 거래일의 정규장 시간 안에 있는지 확인합니다."""
+        return self.is_trading_day(moment) and SESSION_OPEN <= moment.time() <= SESSION_CLOSE
+
+    def previous_trading_day(self, day, inclusive=True):
+        """day 이전(inclusive이면 당일 포함)의 가장 가까운 거래일을 반환합니다."""
+        ordinal = _to_ordinal(day)
+        self._ensure(ordinal)
+        idx = bisect.bisect_right(self._days, ordinal if inclusive else ordinal - 1) - 1
+        while idx < 0:
+            self._extend_back_to(self._first - 366)
+            idx = bisect.bisect_right(self._days, ordinal if inclusive else ordinal - 1) - 1
+        return datetime.date.fromordinal(self._days[idx])
+
+    def next_trading_day(self, day, inclusive=True):
+        """day 이후(inclusive이면 당일 포함)의 가장 가까운 거래일을 반환합니다."""
+        ordinal = _to_ordinal(day)
+        self._ensure(ordinal + 14) # 연휴를 넘어서는 여유분
+        idx = bisect.bisect_left(self._days, ordinal if inclusive else ordinal + 1)
+        return datetime.date.fromordinal(self._days[idx])
+
+    def window_start_date(self, end_day, trading_days):
+        """end_day를 포함해 거슬러 올라간 trading_days번째 거래일(윈도우의 첫날)을 반환합니다."""
+        ordinal = _to_ordinal(end_day)
+        self._ensure(ordinal)
+        idx = bisect.bisect_right(self._days, ordinal) - trading_days
+        while idx < 0:
+            self._extend_back_to(self._first - 366)
+            idx = bisect.bisect_right(self._days, ordinal) - trading_days
+        return datetime.date.fromordinal(self._days[idx])
+
+    def trading_days_between(self, start_day, end_day):
+        """start_day 이후부터 end_day까지(양 끝 포함) 거래일 목록을 반환합니다."""
+        start, end = _to_ordinal(start_day), _to_ordinal(end_day)
+        self._ensure(start)
+        self._ensure(end)
+        lo = bisect.bisect_left(self._days, start)
+        hi = bisect.bisect_right(self._days, end)
+        return [datetime.date.fromordinal(o) for o in self._days[lo:hi]]
+
+
+# 프로그램 전체에서 공유하는 KRX 거래일 달력
+KRX_CALENDAR = TradingCalendar()
+
+
+class SeriesDateIndex:
+    """
+    시계열 각 행의 날짜 ordinal을 정렬 상태로 보관하는 인덱스입니다.
+    append()/replace_last()로 점진적으로 갱신하며, 윈도우 시작 행은 이진 탐색으로 찾습니다.
+    """
+
+    def __init__(self, timestamps=(), calendar=None):
+        self.calendar = calendar or KRX_CALENDAR
+        self._ordinals = []
+        for ts in timestamps:
+            self.append(ts)
+
+    def __len__(self):
+        return len(self._ordinals)
+
+    @property
+    def ordinals(self):
+        """행별 날짜 ordinal 목록 (읽기 전용으로 사용)"""
+        return self._ordinals
+
+    def _check_order(self, ordinal, position):
+        # 인덱스는 행 번호와 일대일이어야 하므로, 시간 역순 행은 인덱스만 따로 정렬하지 않고 거부
+        if position > 0 and ordinal < self._ordinals[position - 1]:
+            raise ValueError(f"시계열 행은 시간순이어야 합니다: {datetime.date.fromordinal(ordinal)} "
+                             f"< {datetime.date.fromordinal(self._ordinals[position - 1])}")
+
+    def append(self, timestamp):
+        """행 하나의 날짜를 끝에 추가합니다. 마지막 행보다 이른 날짜면 ValueError"""
+        ordinal = _to_ordinal(timestamp)
+        self._check_order(ordinal, len(self._ordinals))
+        self._ordinals.append(ordinal)
+
+    def replace_last(self, timestamp):
+        """마지막 행의 날짜를 바꿉니다. 바로 앞 행보다 이른 날짜면 ValueError (인덱스는 그대로)"""
+        ordinal = _to_ordinal(timestamp)
+        self._check_order(ordinal, len(self._ordinals) - 1)
+        self._ordinals[-1] = ordinal
+
+    def window_start(self, trading_days):
+        """
+        마지막 행 기준 최근 trading_days 거래일 구간이 시작되는 행 번호를 반환합니다.
+        저장된 데이터가 구간의 첫날까지 거슬러 올라가지 못하면 None을 반환합니다.
+        """
+        if not self._ordinals or trading_days <= 0:
+            return None
+        start_day = self.calendar.window_start_date(self._ordinals[-1], trading_days)
+        start_ordinal = start_day.toordinal()
+        if self._ordinals[0] > start_ordinal:
+            return None
+        return bisect.bisect_left(self._ordinals, start_ordinal)
+
+    def row_window_starts(self, trading_days):
+        """
+        각 행을 마지막 행으로 볼 때의 window_start(trading_days) 값을 행마다 담은 목록을 반환합니다.
+        (과거 시점을 재현하는 백테스트용) 같은 날짜의 행은 달력을 한 번만 조회합니다.
+        """
+        ordinals = self._ordinals
+        starts = [None] * len(ordinals)
+        if not ordinals or trading_days <= 0:
+            return starts
+        day = start = None
+        lo = 0
+        for i, ordinal in enumerate(ordinals):
+            if ordinal != day:
+                day = ordinal
+                start_ordinal = self.calendar.window_start_date(ordinal, trading_days).toordinal()
+                start = None if ordinals[0] > start_ordinal else bisect.bisect_left(ordinals, start_ordinal, lo)
+                if start is not None:
+                    lo = start
+            starts[i] = start
+        return starts
+
+    def window_starts(self, periods):
+        """여러 기간의 윈도우 시작 행 번호를 {기간: 행 번호}로 반환합니다. (데이터 부족 기간은 제외)"""
+        starts = {}
+        for period in periods:
+            start = self.window_start(period)
+            if start is not None:
+                starts[period] = start
+        return starts
@@ -0,0 +1,103 @@
+# ====================================================================
+# 캔들차트 / 거래량 렌더러
+# ====================================================================
+# 봉 하나마다 아티스트를 만들면 수천 개의 봉에서 매우 느려지므로,
+# 모든 몸통은 PolyCollection 하나, 모든 꼬리는 LineCollection 하나, 거래량 막대는 PolyCollection 하나로 그립니다.
+# - 'candle': 봉 하나가 충분히 넓으면(가로 CANDLE_MIN_PX 픽셀 이상) 몸통+꼬리 캔들
+# - 'ohlc'  : 그보다 촘촘하면 고가-저가 세로선에 시가/종가 눈금을 붙인 OHLC 바
+# - 'line'  : 봉 하나가 OHLC_MIN_PX 픽셀보다 좁으면 캔들을 숨기고 종가 선(다운샘플링)으로 표시
+# 색은 국내 관례대로 상승은 빨강, 하락은 파랑입니다.
+
+from matplotlib.collections import LineCollection, PolyCollection
+
+CANDLE_MIN_PX = 4.0
+OHLC_MIN_PX = 1.5
+
+UP_COLOR = '#d62728'
+DOWN_COLOR = '#1f4fd6'
+# 거래량 막대는 가격 축 아래쪽 이 비율만큼만 차지
+VOLUME_HEIGHT = 0.2
+
+
+def choose_mode(bar_count, width_px):
+    """보이는 봉 개수와 축의 가로 픽셀 수로 'candle', 'ohlc', 'line' 중 하나를 고릅니다."""
+    if bar_count <= 0:
+        return 'line'
+    px_per_bar = width_px / bar_count
+    if px_per_bar >= CANDLE_MIN_PX:
+        return 'candle'
+    if px_per_bar >= OHLC_MIN_PX:
+        return 'ohlc'
+    return 'line'
+
+
+def bar_width(xs):
+    """이웃한 봉 사이 가장 좁은 간격의 70%를 봉 너비로 사용합니다."""
+    gaps = [b - a for a, b in zip(xs, xs[1:]) if b > a]
+    return 0.7 * min(gaps) if gaps else 0.6
+
+
+class CandleRenderer:
+
+    def __init__(self, ax):
+        self.ax = ax
+        # 거래량은 같은 x축을 쓰는 보조 축에 그리고, 가격 축을 위에 두어 마우스 이벤트는 가격 축이 받음
+        self.volume_ax = ax.twinx()
+        self.volume_ax.yaxis.set_visible(False)
+        ax.set_zorder(self.volume_ax.get_zorder() + 1)
+        ax.patch.set_visible(False)
+
+        self.wicks = LineCollection([], linewidths=0.8)
+        self.bodies = PolyCollection([], linewidths=0.5)
+        self.bars = LineCollection([], linewidths=1.0)
+        self.volumes = PolyCollection([], linewidths=0, alpha=0.35)
+        ax.add_collection(self.wicks)
+        ax.add_collection(self.bodies)
+        ax.add_collection(self.bars)
+        self.volume_ax.add_collection(self.volumes)
+        self.mode = None
+        self.hide()
+
+    def hide(self):
+        for artist in (self.wicks, self.bodies, self.bars, self.volumes):
+            artist.set_visible(False)
+        self.mode = None
+
+    def set_data(self, mode, xs, opens, highs, lows, closes, volumes):
+        """보이는 구간의 봉들을 mode('candle' 또는 'ohlc')로 그립니다."""
+        self.mode = mode
+        half = bar_width(xs) / 2
+        colors = [UP_COLOR if c >= o else DOWN_COLOR for o, c in zip(opens, closes)]
+
+        if mode == 'candle':
+            self.wicks.set_segments([((x, l), (x, h)) for x, h, l in zip(xs, highs, lows)])
+            self.wicks.set_color(colors)
+            self.bodies.set_verts([
+                ((x - half, o), (x - half, c), (x + half, c), (x + half, o))
+                for x, o, c in zip(xs, opens, closes)
+            ])
+            self.bodies.set_facecolor(colors)
+            self.bodies.set_edgecolor(colors)
+            self.bars.set_visible(False)
+            self.wicks.set_visible(True)
+            self.bodies.set_visible(True)
+        else:
+            # 세로선(고가-저가), 왼쪽 눈금(시가), 오른쪽 눈금(종가)
+            segments = []
+            bar_colors = []
+            for x, o, h, l, c, color in zip(xs, opens, highs, lows, closes, colors):
+                segments.extend((((x, l), (x, h)), ((x - half, o), (x, o)), ((x, c), (x + half, c))))
+                bar_colors.extend((color, color, color))
+            self.bars.set_segments(segments)
+            self.bars.set_color(bar_colors)
+            self.bars.set_visible(True)
+            self.wicks.set_visible(False)
+            self.bodies.set_visible(False)
+
+        vols = [v or 0 for v in volumes]
+        self.volumes.set_verts([((x - half, 0), (x - half, v), (x + half, v), (x + half, 0)) for x, v in zip(xs, vols)])
+        self.volumes.set_facecolor(colors)
+        top = max(vols) if vols else 0
+        self.volumes.set_visible(top > 0)
+        if top > 0:
+            self.volume_ax.set_ylim(0, top / VOLUME_HEIGHT)
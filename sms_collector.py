@@ -0,0 +1,332 @@
+# ====================================================================
+# 헤드리스 수집기 (GUI 없이 실행)
+# ====================================================================
+# tkinter/matplotlib 없이 스케줄러 → 주가 조회 → CSV 저장 → 알림 평가를
+# 수행하는 데몬/CLI입니다. 리눅스 서버 등 화면이 없는 환경에서 사용합니다.
+#
+# 사용법:
+#   python sms_collector.py --write-config sms_collector.json   # 예시 설정 파일 생성
+#   python sms_collector.py --config sms_collector.json         # 데몬으로 실행
+#   python sms_collector.py --config sms_collector.json --once  # 한 번만 업데이트 후 종료
+#   python sms_collector.py --config sms_collector.json --metrics-port 9108  # 지표를 127.0.0.1:9108/metrics로 제공
+#
+# 설정 파일(JSON)의 최상위 값은 모든 종목의 기본값이며, tickers의 각 항목에서 덮어쓸 수 있습니다.
+
+import argparse
+import datetime
+import json
+import os
+import signal
+import sys
+import threading
+
+from sms_alerts import compile_alert_plan, compute_window_stats
+from sms_calendar import KRX_CALENDAR, SeriesDateIndex
+from sms_core import (catch_up_missed_updates, get_historical_prices_from_csv, load_initial_history, log_message,
+                      parse_periods, update_stock_data)
+import sms_logging
+from sms_metrics import REGISTRY, start_http_server
+from sms_notify import NotificationDispatcher
+from sms_polling import AdaptivePoller
+from sms_ringbuffer import QuoteRingBuffer
+from sms_scheduler import TimerScheduler
+from sms_sinks import AlertOutbox, DesktopSink, build_sinks
+from sms_workers import UpdateWorkerPool
+
+DEFAULT_CONFIG = {
+    'data_dir': os.path.join(os.path.expanduser('~'), 'Documents'),
+    'notification_times': '09:00,10:00,11:00,12:00,13:00,14:00,15:00,15:30',
+    'periods': '20,120,250',
+    # [기간, 최고가 대비 하락률(%), 최저가 대비 상승률(%)]
+    'alert_conditions': [[20, 5.0, 5.0]],
+    'intraday': False,
+    'intraday_interval': 60,
+    # 데스크톱 알림 사용 여부 (서버에서는 false로 두면 로그로만 남김)
+    'desktop_notifications': False,
+    # 같은 조건을 다시 알리기까지의 최소 시간(초), 재무장 폭(%p), 여러 종목 알림을 모으는 시간(초)
+    'alert_cooldown': 1800,
+    'alert_hysteresis': 1.0,
+    'digest_window': 2.0,
+    # 알림 전달 대상 목록 (sms_sinks.py 참고) 예: [{"type": "webhook", "url": "http://127.0.0.1:8080/alerts"}]
+    'alert_sinks': [],
+    # 보내지 못한 알림을 보관하는 발신함 파일 (없으면 data_dir/sms_outbox.json)
+    'outbox_path': None,
+    'workers': 2,
+    # 로그 파일 (없으면 data_dir/sms_logs/collector.log), 수준, JSON 형식 여부, 교체 방식('size' 또는 'daily')
+    'log_file': None,
+    'log_level': 'INFO',
+    'log_json': False,
+    'log_rotation': 'size',
+    # 성능 지표 HTTP 포트 (127.0.0.1에서만 열림, null이면 사용 안 함)
+    'metrics_port': None,
+    'tickers': [{'stock_code': '005930'}],
+}
+
+
+def load_config(path):
+    """설정 파일을 읽어 종목별 설정 목록과 전역 설정을 반환합니다."""
+    with open(path, 'r', encoding='utf-8') as f:
+        config = dict(DEFAULT_CONFIG, **json.load(f))
+
+    tickers = []
+    for entry in config['tickers']:
+        if isinstance(entry, str):
+            entry = {'stock_code': entry}
+        ticker = {k: v for k, v in config.items() if k != 'tickers'}
+        ticker.update(entry)
+        if not ticker.get('file_path'):
+            ticker['file_path'] = os.path.join(ticker['data_dir'], f"stock_data_{ticker['stock_code']}.csv")
+        tickers.append(ticker)
+    return config, tickers
+
+
+class TickerJob:
+    """종목 하나의 설정과 컴파일된 알림 계획, 장중 폴링 상태"""
+
+    def __init__(self, config):
+        self.stock_code = config['stock_code']
+        self.file_path = config['file_path']
+        self.notification_times = [t.strip() for t in config['notification_times'].split(',') if t.strip()]
+        self.periods = parse_periods(config['periods'])
+        self.alert_plan = compile_alert_plan(tuple(c) for c in config['alert_conditions'])
+        self.poller = None
+        if config['intraday']:
+            interval = int(config['intraday_interval'])
+            self.poller = AdaptivePoller(base_interval=interval, min_interval=max(5, interval // 4), max_interval=interval * 10)
+
+
+class Collector:
+
+    def __init__(self, config, tickers, ring=None):
+        self.config = config
+        # 2-프로세스 모드: 업데이트 결과를 GUI 프로세스와 공유하는 링 버퍼
+        self.ring = ring
+        self._ring_lock = threading.Lock()
+        self.jobs = [TickerJob(t) for t in tickers]
+        self.scheduler = TimerScheduler(log=log_message)
+        self.scheduler.on_clock_jump = self.on_clock_jump
+        self.pool = UpdateWorkerPool(max_workers=int(config['workers']), max_queue=max(8, len(self.jobs) * 2), log=log_message)
+        self._stop_event = threading.Event()
+        self.notifier = NotificationDispatcher(self.deliver_alert, cooldown=float(config['alert_cooldown']),
+                                               hysteresis=float(config['alert_hysteresis']),
+                                               digest_window=float(config['digest_window']), log=log_message)
+        sinks = build_sinks(config['alert_sinks'])
+        if config['desktop_notifications'] and not any(isinstance(sink, DesktopSink) for sink in sinks):
+            sinks.append(DesktopSink())
+        self.outbox = None
+        if sinks:
+            outbox_path = config['outbox_path'] or os.path.join(config['data_dir'], 'sms_outbox.json')
+            self.outbox = AlertOutbox(sinks, path=outbox_path, log=log_message)
+        self.metrics_server = None
+        REGISTRY.gauge('sms_update_queue_depth', "대기 중인 업데이트 작업 수").set_function(self.pool.queue_depth)
+        if self.outbox is not None:
+            REGISTRY.gauge('sms_outbox_pending', "발신함에 남은 알림 수").set_function(self.outbox.pending_count)
+
+    def deliver_alert(self, title, message):
+        """
+        알림 발송기 스레드에서 호출됩니다. 로그로 남기고, 싱크가 설정되어 있으면 발신함에 넣습니다.
+        (실제 전송은 싱크별 스레드에서 이루어짐)
+        """
+        log_message("ALERT", f"{title}\n{message}")
+        if self.outbox is not None:
+            self.outbox.submit(title, message)
+
+    def run_update(self, job, catch_up=False):
+        """
+        종목 하나를 업데이트하고 발동한 알림을 전달합니다. (작업자 스레드)
+        catch_up이면 놓친 알림 시간만 한 번에 보충하며, 놓친 시간이 없으면 아무것도 하지 않습니다.
+        """
+        try:
+            if catch_up:
+                result = catch_up_missed_updates(job.stock_code, job.file_path, job.notification_times, job.alert_plan, job.periods)
+                if not result:
+                    return None
+            else:
+                result = update_stock_data(job.stock_code, job.file_path, job.alert_plan, job.periods)
+        except Exception as e:
+            log_message("ERROR", f"[{job.stock_code}] 주가 업데이트 중 오류 발생: {e}")
+            return None
+        if not result:
+            log_message("ERROR", f"[{job.stock_code}] 주가 업데이트 실패: 가격 정보를 가져올 수 없습니다.")
+            return None
+
+        if self.ring is not None:
+            # 링 버퍼의 쓰는 쪽은 하나여야 하므로 작업자 스레드 간에는 잠금으로 직렬화
+            with self._ring_lock:
+                self.ring.publish(job.stock_code, result['timestamp'], result['price'], result['window_stats'])
+
+        # 새로 발동한 조건만 발송기 스레드로 넘김 (같은 주기에 여러 종목이 발동하면 요약 알림 하나로 묶임)
+        self.notifier.submit(result, job.alert_plan)
+        log_message("SUCCESS", f"[{job.stock_code}] 주가 업데이트 완료: {result['price']:,}원")
+        return result
+
+    def publish_stored_state(self, job):
+        """저장된 데이터의 마지막 가격과 기간별 최고가/최저가를 링 버퍼에 기록합니다. (조회 없음)"""
+        data = get_historical_prices_from_csv(job.file_path)
+        if not data:
+            return
+        prices = [d['price'] for d in data]
+        date_index = SeriesDateIndex(d['timestamp'] for d in data)
+        stats = compute_window_stats(prices, job.periods, date_index.window_starts(job.periods),
+                                     [d['high'] for d in data], [d['low'] for d in data])
+        with self._ring_lock:
+            self.ring.publish(job.stock_code, data[-1]['timestamp'], prices[-1], stats)
+
+    def submit(self, job, catch_up=False):
+        return self.pool.submit(job.stock_code, self.run_update, job, catch_up)
+
+    def on_clock_jump(self, drift):
+        log_message("WARNING", f"시스템 시계 변경 또는 절전 복귀 감지 ({drift:+.0f}초). 놓친 알림 시간을 보충합니다.")
+        if drift > 0:
+            for job in self.jobs:
+                self.submit(job, catch_up=True)
+
+    def on_scheduled_update(self):
+        if not KRX_CALENDAR.is_trading_day(datetime.date.today()):
+            log_message("INFO", "오늘은 휴장일이므로 예약된 업데이트를 건너뜁니다.")
+            return
+        for job in self.jobs:
+            self.submit(job)
+
+    def on_intraday_poll(self, job):
+        future = self.submit(job)
+        if future is None:
+            self._rearm_intraday_poll(job, None)
+        else:
+            future.add_done_callback(lambda f: self._rearm_intraday_poll(job, f))
+
+    def _rearm_intraday_poll(self, job, future):
+        result = future.result() if future is not None and not future.cancelled() and future.exception() is None else None
+        result = result or {}
+        delay = job.poller.next_delay(datetime.datetime.now(), result.get('price'), result.get('threshold_distance'))
+        self.scheduler.call_later(delay, lambda: self.on_intraday_poll(job), tag=f"intraday:{job.stock_code}")
+
+    def start(self):
+        if self.outbox is not None:
+            self.outbox.start()
+        if self.config['metrics_port']:
+            try:
+                self.metrics_server = start_http_server(int(self.config['metrics_port']))
+                log_message("SUCCESS", f"성능 지표 제공: http://127.0.0.1:{self.config['metrics_port']}/metrics")
+            except OSError as e:
+                log_message("WARNING", f"성능 지표 서버를 시작하지 못했습니다: {e}")
+        for job in self.jobs:
+            load_initial_history(job.stock_code, job.file_path, job.periods)
+
+        # 알림 시간이 같은 종목들은 하나의 예약 작업으로 묶어 처리
+        times = sorted({t for job in self.jobs for t in job.notification_times})
+        for t in self.scheduler.set_daily_times(times, self.on_scheduled_update):
+            log_message("SUCCESS", f"알림 시간이 {t}에 예약되었습니다.")
+        for job in self.jobs:
+            if job.poller:
+                delay = job.poller.next_delay(datetime.datetime.now())
+                self.scheduler.call_later(delay, lambda job=job: self.on_intraday_poll(job), tag=f"intraday:{job.stock_code}")
+                log_message("SUCCESS", f"[{job.stock_code}] 장중 실시간 모드 활성화 (첫 조회까지 {delay:.0f}초)")
+        self.scheduler.start()
+
+        # 종료되어 있던 동안 놓친 알림 시간을 종목별로 한 번에 보충
+        for job in self.jobs:
+            self.submit(job, catch_up=True)
+
+    def run_forever(self):
+        self.start()
+        if self.ring is not None:
+            # 시작 직후 저장된 데이터 기준의 상태를 알려 GUI가 바로 갱신되도록 함
+            for job in self.jobs:
+                self.publish_stored_state(job)
+        log_message("INFO", f"헤드리스 수집기 실행 중: {len(self.jobs)}개 종목 (종료: Ctrl+C)")
+        while not self._stop_event.wait(3600):
+            pass
+        self.scheduler.stop()
+        self.pool.shutdown()
+        self.notifier.stop()
+        if self.outbox is not None:
+            self.outbox.stop()
+        if self.metrics_server is not None:
+            self.metrics_server.shutdown()
+        log_message("INFO", "헤드리스 수집기를 종료합니다.")
+
+    def run_once(self):
+        """모든 종목을 한 번 업데이트하고 끝날 때까지 기다립니다. (알림 전송 포함)"""
+        if self.outbox is not None:
+            self.outbox.start()
+        for job in self.jobs:
+            load_initial_history(job.stock_code, job.file_path, job.periods)
+        futures = [self.submit(job) for job in self.jobs]
+        for future in futures:
+            if future is not None:
+                future.result()
+        self.pool.shutdown()
+        self.notifier.stop()
+        if self.outbox is not None:
+            self.outbox.flush()
+            self.outbox.stop()
+
+    def stop(self, *args):
+        self._stop_event.set()
+
+
+def setup_collector_logging(config):
+    log_file = config['log_file'] or os.path.join(config['data_dir'], 'sms_logs', 'collector.log')
+    sms_logging.setup_logging(level=config['log_level'], log_file=log_file, json_format=config['log_json'],
+                              rotation=config['log_rotation'])
+
+
+def run_collector_process(config, ring_name):
+    """
+    2-프로세스 모드에서 GUI가 띄우는 수집기 프로세스의 진입점입니다.
+    config는 설정 파일과 같은 형식의 딕셔너리이며, 결과는 ring_name 링 버퍼에 기록합니다.
+    """
+    config = dict(DEFAULT_CONFIG, **config)
+    setup_collector_logging(config)
+    tickers = [dict({k: v for k, v in config.items() if k != 'tickers'}, **t) for t in config['tickers']]
+    ring = QuoteRingBuffer.attach(ring_name)
+    try:
+        Collector(config, tickers, ring=ring).run_forever()
+    finally:
+        ring.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SMS 헤드리스 주가 수집기")
+    parser.add_argument('--config', help="설정 파일(JSON) 경로")
+    parser.add_argument('--once', action='store_true', help="모든 종목을 한 번 업데이트한 뒤 종료")
+    parser.add_argument('--write-config', metavar='PATH', help="예시 설정 파일을 생성하고 종료")
+    parser.add_argument('--log-level', choices=sms_logging.LEVELS, help="로그 수준 (설정 파일의 log_level보다 우선)")
+    parser.add_argument('--metrics-port', type=int, help="성능 지표 HTTP 포트 (설정 파일의 metrics_port보다 우선)")
+    args = parser.parse_args(argv)
+
+    if args.write_config:
+        with open(args.write_config, 'w', encoding='utf-8') as f:
+            json.dump(DEFAULT_CONFIG, f, ensure_ascii=False, indent=2)
+        log_message("SUCCESS", f"예시 설정 파일 생성: '{args.write_config}'")
+        return 0
+    if not args.config:
+        parser.error("--config 또는 --write-config가 필요합니다.")
+
+    config, tickers = load_config(args.config)
+    if args.log_level:
+        config['log_level'] = args.log_level
+    if args.metrics_port:
+        config['metrics_port'] = args.metrics_port
+    setup_collector_logging(config)
+    collector = Collector(config, tickers)
+    if args.once:
+        collector.run_once()
+        return 0
+
+    signal.signal(signal.SIGINT, collector.stop)
+    signal.signal(signal.SIGTERM, collector.stop)
+    if hasattr(signal, 'SIGUSR1'):
+        # 실행 중 로그 수준 전환: kill -USR1 <PID> 할 때마다 DEBUG ↔ 설정된 수준
+        def toggle_debug(*args):
+            level = config['log_level'] if sms_logging.get_level() == 'DEBUG' else 'DEBUG'
+            sms_logging.set_level(level)
+            log_message("WARNING", f"로그 수준 변경: {level}")
+        signal.signal(signal.SIGUSR1, toggle_debug)
+    collector.run_forever()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,532 @@
+# ====================================================================
+# 핵심 로직: 데이터 수집, 저장 및 알림 파이프라인
+# ====================================================================
+# GUI(SMS-v*.py)와 헤드리스 수집기(sms_collector.py)가 함께 사용하는 모듈입니다.
+# tkinter/matplotlib을 가져오지 않으며, requests/BeautifulSoup/plyer는
+# 실제로 필요할 때 불러와 수집기의 시작 시간과 메모리 사용량을 줄입니다. (sms_timing.importing)
+
+import csv
+import datetime
+import os
+import threading
+
+from sms_alerts import compute_window_stats, pct_from_max, pct_from_min
+from sms_calendar import KRX_CALENDAR, SeriesDateIndex
+from sms_logging import log_message # 다른 모듈은 sms_core에서 가져다 씀
+from sms_metrics import (ALERT_EVAL_SECONDS, ALERTS, ANALYSIS_SECONDS, CSV_ROWS, CSV_SECONDS, FETCH_FAILURES,
+                         FETCH_REQUESTS, FETCH_SECONDS, PARSE_SECONDS, timed)
+from sms_timing import importing
+
+
+# 종목 메인 페이지 시세표(.no_info)의 항목 이름 → 행 키
+QUOTE_DAY_FIELDS = {'시가': 'open', '고가': 'high', '저가': 'low', '거래량': 'volume'}
+
+
+def parse_quote_day(soup):
+    """종목 메인 페이지 시세표에서 당일 {'open', 'high', 'low', 'volume'}을 꺼냅니다. 항목이 빠지면 None"""
+    # 시세표 칸마다 CSS 선택자를 해석하면 페이지 해석만큼 느려지므로 find로 찾음
+    day = {}
+    table = soup.find('table', class_='no_info')
+    for cell in table.find_all('td') if table else ():
+        label = cell.find('span', class_='sptxt')
+        em = cell.find('em')
+        value = em.find('span', class_='blind') if em else None
+        if label and value and label.text.strip() in QUOTE_DAY_FIELDS:
+            try:
+                day[QUOTE_DAY_FIELDS[label.text.strip()]] = int(value.text.replace(',', ''))
+            except ValueError:
+                continue
+    return day if len(day) == len(QUOTE_DAY_FIELDS) else None
+
+def parse_quote_page(html):
+    """
+    네이버 금융 종목 메인 페이지 HTML에서 (현재가, 회사명, 당일 시세)를 꺼냅니다.
+    당일 시세는 {'open', 'high', 'low', 'volume'}이며, 시세표가 없거나 항목이 빠지면 None입니다.
+    """
+    with importing('bs4'):
+        from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+    price_element = soup.select_one('.today .blind')
+    name_element = soup.select_one('.wrap_company h2 a')
+    current_price = int(price_element.text.replace(',', '')) if price_element else None
+    company_name = name_element.text if name_element else "Unknown"
+    return current_price, company_name, parse_quote_day(soup)
+
+def parse_quote_html(html):
+    """네이버 금융 종목 메인 페이지 HTML에서 (현재가, 회사명)을 꺼냅니다. 찾지 못한 값은 None, "Unknown"입니다."""
+    return parse_quote_page(html)[:2]
+
+def get_stock_quote(stock_code):
+    """지정된 주식 코드의 (현재가, 회사명, 당일 시가/고가/저가/거래량)을 크롤링합니다."""
+    with importing('requests'):
+        import requests
+
+    url = f"https://finance.naver.com/item/main.naver?code={stock_code}"
+    headers = {'User-Agent': 'Mozilla/5.0'}
+    FETCH_REQUESTS.inc(kind='quote')
+    try:
+        with timed(FETCH_SECONDS, kind='quote'):
+            response = requests.get(url, headers=headers)
+        if response.status_code == 200:
+            with timed(PARSE_SECONDS, kind='quote'):
+                return parse_quote_page(response.text)
+    except Exception as e:
+        log_message("ERROR", f"가격 크롤링 실패: {e}")
+    FETCH_FAILURES.inc(kind='quote')
+    return None, "Unknown", None
+
+def get_stock_price(stock_code):
+    """지정된 주식 코드의 현재 가격을 크롤링하고 회사명을 반환합니다."""
+    return get_stock_quote(stock_code)[:2]
+
+# CSV 열 구성: 예전 파일은 Timestamp,Price 두 열이며, 읽을 때 고가/저가/시가를 종가로 채움
+CSV_HEADER = ['Timestamp', 'Price', 'Open', 'High', 'Low', 'Volume']
+LEGACY_CSV_HEADER = ['Timestamp', 'Price']
+
+
+def make_row(timestamp, price, open_price=None, high=None, low=None, volume=None):
+    """
+    저장 데이터 한 행을 만듭니다. 'price'는 종가(장중에는 마지막 조회가)입니다.
+    시가/고가/저가가 없으면 가격으로 채우고, 거래량을 모르면 None입니다.
+    """
+    return {
+        'timestamp': timestamp,
+        'price': price,
+        'open': price if open_price is None else open_price,
+        'high': price if high is None else high,
+        'low': price if low is None else low,
+        'volume': volume,
+    }
+
+def parse_history_page(html):
+    """
+    네이버 금융 일별 시세 페이지 HTML 한 장을 행 목록으로 바꿉니다. (make_row 형식, 시간은 00:00)
+    반환값: (행 목록, 가장 오래된 날짜) 데이터가 없는 페이지면 ([], None)
+    """
+    with importing('bs4'):
+        from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+    rows = soup.find('table', class_='type2').find_all('tr')
+
+    data = []
+    oldest = None
+    for row in rows[2:]: # 헤더와 불필요한 행 제외
+        cols = row.find_all('td')
+        # 날짜, 종가, 전일비, 시가, 고가, 저가, 거래량
+        if len(cols) > 6:
+            date_str = cols[0].text.strip()
+            try:
+                close, open_price, high, low, volume = (
+                    int(cols[i].text.strip().replace(',', '')) for i in (1, 3, 4, 5, 6))
+                date = datetime.datetime.strptime(date_str, '%Y.%m.%d')
+            except (ValueError, IndexError):
+                continue
+            # 일별 데이터이므로, 시간은 00:00으로 통일
+            timestamp = date.strftime('%Y-%m-%d 00:00')
+            data.append(make_row(timestamp, close, open_price, high, low, volume))
+            oldest = date.date() if oldest is None else min(oldest, date.date())
+    return data, oldest
+
+def get_historical_data_from_naver(stock_code, pages=10, since=None):
+    """
+    네이버 금융에서 과거 일별 데이터를 크롤링합니다. (시가/고가/저가/종가/거래량)
+    since(date)를 주면 그 날짜가 포함된 페이지까지만 조회합니다. (이미 가진 구간은 다시 받지 않음)
+    """
+    with importing('requests'):
+        import requests
+
+    log_message("INFO", f"과거 데이터 크롤링 시작: {stock_code}")
+    data = []
+    url_base = f"https://finance.naver.com/item/sise_day.naver?code={stock_code}"
+    headers = {'User-Agent': 'Mozilla/5.0'}
+
+    for page in range(1, pages + 1):
+        url = f"{url_base}&page={page}"
+        FETCH_REQUESTS.inc(kind='history')
+        try:
+            with timed(FETCH_SECONDS, kind='history'):
+                response = requests.get(url, headers=headers)
+            if response.status_code == 200:
+                with timed(PARSE_SECONDS, kind='history'):
+                    rows, oldest = parse_history_page(response.text)
+                data.extend(rows)
+                if oldest is None:
+                    break # 빈 페이지 (상장 이전)
+                if since is not None and oldest <= since:
+                    break
+            else:
+                FETCH_FAILURES.inc(kind='history')
+                log_message("WARNING", f"과거 데이터 크롤링 중 오류: HTTP {response.status_code}")
+                break
+        except Exception as e:
+            FETCH_FAILURES.inc(kind='history')
+            log_message("ERROR", f"과거 데이터 크롤링 실패: {e}")
+            break
+
+    # 날짜 기준 오름차순으로 정렬
+    data.sort(key=lambda x: datetime.datetime.strptime(x['timestamp'], '%Y-%m-%d %H:%M'))
+    log_message("SUCCESS", f"과거 데이터 크롤링 완료: 총 {len(data)}개 데이터 수집")
+    return data
+
+def save_data(file_path, data):
+    """
+    주식 데이터를 CSV 파일에 저장합니다.
+    """
+    # 디렉토리가 없으면 생성
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+
+    with timed(CSV_SECONDS, op='save'), open(file_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_HEADER)
+        writer.writerows(data)
+    CSV_ROWS.inc(len(data), op='save')
+    log_message("INFO", f"데이터 저장 완료: '{file_path}'")
+
+def _optional_int(value):
+    return int(value) if value not in ('', None) else None
+
+def read_csv_header(file_path):
+    """CSV 파일의 헤더 행을 반환합니다. 파일이 없거나 비어 있으면 None"""
+    if not os.path.exists(file_path) or os.stat(file_path).st_size == 0:
+        return None
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return next(csv.reader(f), None)
+
+def get_historical_prices_from_csv(file_path):
+    """
+    CSV 파일에서 시간별 데이터를 불러옵니다.
+    예전 형식(Timestamp,Price) 파일도 읽으며, 이때 시가/고가/저가는 가격과 같고 거래량은 None입니다.
+    """
+    data = []
+    if os.path.exists(file_path) and os.stat(file_path).st_size > 0:
+        with timed(CSV_SECONDS, op='load'), open(file_path, 'r', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            try:
+                # 헤더 건너뛰기
+                next(reader)
+                for row in reader:
+                    try:
+                        timestamp = datetime.datetime.strptime(row[0], '%Y-%m-%d %H:%M')
+                        price = int(row[1])
+                        if len(row) >= 6:
+                            data.append(make_row(timestamp, price, _optional_int(row[2]), _optional_int(row[3]),
+                                                 _optional_int(row[4]), _optional_int(row[5])))
+                        else:
+                            data.append(make_row(timestamp, price))
+                    except (ValueError, IndexError):
+                        continue
+            except StopIteration:
+                pass
+        CSV_ROWS.inc(len(data), op='load')
+        # 손으로 고친 파일 등 시간순이 아닌 행은 정렬 (날짜 인덱스와 행 번호가 어긋나지 않도록)
+        if any(a['timestamp'] > b['timestamp'] for a, b in zip(data, data[1:])):
+            log_message("WARNING", f"'{file_path}'의 행이 시간순이 아니어서 시간순으로 정렬했습니다.")
+            data.sort(key=lambda d: d['timestamp'])
+    return data
+
+def data_version(file_path):
+    """CSV 파일의 데이터 버전 (경로, 수정 시각, 크기). 파일이 없으면 None"""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return (os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+
+def send_notification(title, message):
+    """데스크톱 알림을 보냅니다."""
+    with importing('plyer'):
+        from plyer import notification
+
+    notification.notify(title=title, message=message, app_name='Stock Notifier', timeout=10)
+    log_message("INFO", f"알림 발송: {title}")
+
+# ====================================================================
+# 업데이트 파이프라인 (GUI/헤드리스 공용)
+# ====================================================================
+
+# CSV 파일별 잠금 (파일을 읽고 고쳐 다시 쓰는 작업끼리 겹치지 않도록)
+_csv_locks = {}
+_csv_locks_guard = threading.Lock()
+
+# 파일별로 마지막에 저장한 시계열 (데이터 버전, 행 목록, 날짜 인덱스). csv_lock을 잡고 사용
+_series_cache = {}
+
+def _path_key(file_path):
+    return os.path.normcase(os.path.abspath(file_path))
+
+def csv_lock(file_path):
+    """
+    file_path의 CSV를 읽고-고치고-쓰는 동안 잡는 잠금을 반환합니다. (같은 파일이면 같은 잠금)
+    작업자 풀은 종목 단위로만 작업을 하나씩 실행하므로, 초기 로드처럼 다른 키로 등록된 작업이
+    같은 파일을 동시에 고치지 않도록 파일 단위로 한 번 더 막습니다.
+    """
+    key = _path_key(file_path)
+    with _csv_locks_guard:
+        lock = _csv_locks.get(key)
+        if lock is None:
+            lock = _csv_locks[key] = threading.RLock()
+        return lock
+
+def load_series(file_path):
+    """
+    CSV의 (행 목록, 날짜 인덱스)를 반환합니다. (csv_lock을 잡은 상태에서 호출)
+    마지막 store_series() 이후 파일이 바뀌지 않았으면 다시 읽지 않고 보관해 둔 목록과 인덱스를 넘겨주며,
+    호출한 쪽이 store_series()로 돌려놓기 전까지는 보관본을 비워 둡니다. (중간에 실패하면 다음에 다시 읽음)
+    """
+    entry = _series_cache.pop(_path_key(file_path), None)
+    if entry is not None and entry[0] == data_version(file_path):
+        return entry[1], entry[2]
+    data = get_historical_prices_from_csv(file_path)
+    return data, SeriesDateIndex(d['timestamp'] for d in data)
+
+def store_series(file_path, data, date_index):
+    """행 목록을 CSV로 저장하고, 다음 업데이트가 인덱스째 이어 쓸 수 있도록 보관합니다. (csv_lock을 잡은 상태에서 호출)"""
+    save_rows(file_path, data)
+    keep_series(file_path, data, date_index)
+
+def keep_series(file_path, data, date_index):
+    """load_series()로 꺼낸 뒤 바꾸지 않은 시계열을 저장 없이 보관본으로 되돌립니다. (csv_lock을 잡은 상태에서 호출)"""
+    _series_cache[_path_key(file_path)] = (data_version(file_path), data, date_index)
+
+def parse_periods(periods_str):
+    """'20,120,250' 형식의 분석 기간 문자열을 정수 목록으로 변환합니다."""
+    return [int(p) for p in periods_str.split(',') if p.strip().isdigit()]
+
+def load_initial_history(stock_code, file_path, periods_list):
+    """
+    CSV 파일이 없거나 비어 있으면 가장 긴 분석 기간을 채울 만큼 과거 데이터를 저장합니다.
+    저장했으면 True, 건너뛰었거나 실패했으면 False를 반환합니다.
+    """
+    with csv_lock(file_path):
+        return _load_initial_history(stock_code, file_path, periods_list)
+
+def _load_initial_history(stock_code, file_path, periods_list):
+    # CSV 파일이 존재하고, 비어 있지 않은지 확인
+    header = read_csv_header(file_path)
+    if header is not None:
+        if header == LEGACY_CSV_HEADER:
+            migrate_legacy_csv(stock_code, file_path, periods_list)
+        else:
+            log_message("INFO", "기존 데이터 파일 발견. 과거 데이터 로딩을 건너뜁니다.")
+        return False
+
+    log_message("INFO", "기존 데이터 파일이 없어 과거 종가 데이터를 로드합니다.")
+    try:
+        max_period = max(periods_list) if periods_list else 20
+
+        # 1페이지당 약 10일치 데이터이므로, 최댓값에 따라 페이지 수 계산
+        pages = (max_period // 10) + 2
+
+        initial_data = get_historical_data_from_naver(stock_code, pages=pages)
+
+        if initial_data:
+            data_to_save = [[d['timestamp'], d['price'], d['open'], d['high'], d['low'], d['volume']] for d in initial_data]
+            save_data(file_path, data_to_save)
+            log_message("SUCCESS", f"과거 데이터 로딩 완료: 총 {len(initial_data)}개의 데이터가 '{file_path}'에 저장되었습니다.")
+            return True
+        log_message("ERROR", "과거 데이터 로딩 실패: 과거 데이터를 가져올 수 없습니다.")
+    except Exception as e:
+        log_message("ERROR", f"과거 데이터 로딩 중 오류 발생: {e}")
+    return False
+
+def migrate_legacy_csv(stock_code, file_path, periods_list):
+    """
+    예전 형식(Timestamp,Price) CSV를 OHLCV 형식으로 바꿉니다.
+    가장 긴 분석 기간에 해당하는 지난 거래일은 일별 시세에서 실제 시가/고가/저가/거래량을 받아 채우고,
+    그보다 오래된 행은 가격을 시가/고가/저가로 사용합니다. 저장된 가격(종가)은 바꾸지 않습니다.
+    """
+    data = get_historical_prices_from_csv(file_path)
+    log_message("INFO", f"예전 형식의 데이터 파일을 OHLCV 형식으로 변환합니다: '{file_path}'")
+    today = datetime.date.today()
+    max_period = max(periods_list) if periods_list else 20
+    past = [d for d in data if d['timestamp'].date() < today]
+    if past:
+        since = max(past[0]['timestamp'].date(), KRX_CALENDAR.window_start_date(today, max_period))
+        try:
+            span = len(KRX_CALENDAR.trading_days_between(since, today))
+            history = get_historical_data_from_naver(stock_code, pages=span // 10 + 1, since=since)
+        except Exception as e:
+            log_message("WARNING", f"과거 시세 조회 실패. 가격만으로 변환합니다: {e}")
+            history = []
+        by_date = {datetime.datetime.strptime(h['timestamp'], '%Y-%m-%d %H:%M').date(): h for h in history}
+        filled = 0
+        for i, d in enumerate(data):
+            h = by_date.get(d['timestamp'].date())
+            if h is None or d['timestamp'].date() >= today:
+                continue
+            # 장중에 저장된 가격도 그날의 고가/저가 범위 안에 들도록 함
+            data[i] = make_row(d['timestamp'], d['price'], h['open'],
+                               max(h['high'], d['price']), min(h['low'], d['price']), h['volume'])
+            filled += 1
+        log_message("SUCCESS", f"{filled}일의 시가/고가/저가/거래량을 채웠습니다.")
+    save_rows(file_path, data)
+
+def evaluate_series(stock_code, company_name, data, date_index, alert_plan, periods=()):
+    """
+    저장된 시계열의 마지막 가격을 기준으로 알림 조건을 평가하고 결과 딕셔너리를 만듭니다.
+    분석 기간은 CSV 행 수가 아닌 실제 거래일 수 기준이며, 최고가/최저가는 일별 고가/저가로 구합니다.
+    """
+    current_price = data[-1]['price']
+    prices = [d['price'] for d in data]
+    highs = [d['high'] for d in data]
+    lows = [d['low'] for d in data]
+    all_periods = set(alert_plan.periods) | set(periods)
+    window_starts = date_index.window_starts(all_periods)
+    with timed(ANALYSIS_SECONDS, kind='evaluate'):
+        # 분석 기간과 알림 조건 기간을 한 번에 계산하고 아래에서 나눠 씀
+        stats = compute_window_stats(prices, all_periods, window_starts, highs, lows)
+        window_stats = {period: stats[period] for period in periods if period in stats}
+        # 알림 조건 기간별 현재 비율 (발동하지 않은 조건의 재무장 판단에 사용, sms_notify)
+        alert_levels = {
+            period: (pct_from_max(current_price, stats[period][0]), pct_from_min(current_price, stats[period][1]))
+            for period in alert_plan.periods if period in stats
+        }
+    with timed(ALERT_EVAL_SECONDS):
+        alerts = alert_plan.evaluate(prices, current_price, stats=stats)
+        threshold_distance = alert_plan.threshold_distance(prices, current_price, stats=stats)
+    ALERTS.inc(len(alerts))
+    return {
+        'stock_code': stock_code,
+        'company_name': company_name,
+        'price': current_price,
+        'timestamp': data[-1]['timestamp'],
+        'alerts': alerts,
+        'threshold_distance': threshold_distance,
+        'window_stats': window_stats,
+        'alert_levels': alert_levels,
+    }
+
+def upsert_today(data, date_index, timestamp_now, current_price, day=None):
+    """
+    기존 데이터의 마지막 날짜가 오늘 날짜와 같으면 덮어쓰고, 아니면 추가합니다.
+    day(종목 페이지의 당일 시가/고가/저가/거래량)가 있으면 그 값으로 행을 채우고,
+    없으면 같은 날은 시가와 거래량을 유지한 채 고가/저가만 현재가를 반영해 넓힙니다.
+    시계가 마지막 행보다 이전 날짜로 돌아갔으면 행 목록을 건드리지 않고 ValueError를 냅니다.
+    """
+    if day:
+        row = make_row(timestamp_now, current_price, day['open'], max(day['high'], current_price),
+                       min(day['low'], current_price), day['volume'])
+        if data and data[-1]['timestamp'].date() == timestamp_now.date():
+            date_index.replace_last(timestamp_now)
+            data[-1] = row
+        else:
+            date_index.append(timestamp_now)
+            data.append(row)
+    elif data and data[-1]['timestamp'].date() == timestamp_now.date():
+        last = data[-1]
+        data[-1] = make_row(timestamp_now, current_price, last['open'],
+                            max(last['high'], current_price), min(last['low'], current_price), last['volume'])
+        date_index.replace_last(timestamp_now)
+    else:
+        date_index.append(timestamp_now)
+        data.append(make_row(timestamp_now, current_price))
+
+def save_rows(file_path, data):
+    """make_row() 형식의 목록을 CSV로 저장합니다. (시간 정보 포함, 모르는 거래량은 빈 칸)"""
+    data_to_save = [[d['timestamp'].strftime('%Y-%m-%d %H:%M'), d['price'], d['open'], d['high'], d['low'],
+                     '' if d['volume'] is None else d['volume']] for d in data]
+    save_data(file_path, data_to_save)
+
+def update_stock_data(stock_code, file_path, alert_plan, periods=()):
+    """
+    현재가를 조회해 CSV에 반영하고, 컴파일된 알림 계획으로 조건을 평가합니다.
+    periods를 주면 화면 표시용 기간별 최고가/최저가('window_stats')도 함께 계산합니다.
+    가격을 가져오지 못하면 None을 반환합니다.
+    """
+    current_price, company_name, day = get_stock_quote(stock_code)
+    if not current_price:
+        return None
+
+    with csv_lock(file_path):
+        # 보관해 둔 행 목록과 날짜 인덱스에 오늘 행만 반영 (평가도 다음 업데이트가 목록을 고치기 전에 끝냄)
+        data, date_index = load_series(file_path)
+        upsert_today(data, date_index, datetime.datetime.now(), current_price, day)
+        store_series(file_path, data, date_index)
+        return evaluate_series(stock_code, company_name, data, date_index, alert_plan, periods)
+
+# ====================================================================
+# 놓친 알림 시간 보충 (절전/프로그램 종료 중 누락분)
+# ====================================================================
+
+def find_missed_slots(notification_times, last_timestamp, now, calendar=None):
+    """
+    마지막 저장 시각(last_timestamp) 이후 now까지 지나간 알림 시각 중 거래일에 해당하는 것을 반환합니다.
+    notification_times: 'HH:MM' 문자열 목록
+    시각이 00:00인 행은 일별 시세(종가)이므로, 오늘이 아니면 그날의 알림 시각은 모두 반영된 것으로 봅니다.
+    """
+    calendar = calendar or KRX_CALENDAR
+    if last_timestamp.time() == datetime.time(0, 0) and last_timestamp.date() < now.date():
+        last_timestamp = datetime.datetime.combine(last_timestamp.date(), datetime.time.max)
+    times = []
+    for t in notification_times:
+        try:
+            times.append(datetime.datetime.strptime(t.strip(), '%H:%M').time())
+        except ValueError:
+            continue
+    missed = []
+    for day in calendar.trading_days_between(last_timestamp.date(), now.date()):
+        for t in sorted(times):
+            slot = datetime.datetime.combine(day, t)
+            if last_timestamp < slot <= now:
+                missed.append(slot)
+    return missed
+
+def catch_up_missed_updates(stock_code, file_path, notification_times, alert_plan, periods=(), now=None):
+    """
+    놓친 알림 시각이 있으면 한 번의 묶음 조회로 빈 구간을 채우고, 최종 상태에서 알림을 한 번만 평가합니다.
+    - 기록이 하나도 없는 지난 거래일만 일별 시세 페이지에서 받아 채웁니다. (이미 있는 장중 기록은 그대로 둠)
+    - 오늘 놓친 시각이 있으면 현재가를 한 번만 조회해 반영합니다.
+    행 목록과 날짜 인덱스는 load_series()/store_series()로 주고받으므로 인덱스를 다시 만들지 않습니다.
+    놓친 시각이 없거나, 저장된 데이터가 없거나, 바뀐 행이 없으면 None을 반환합니다.
+    """
+    with csv_lock(file_path):
+        return _catch_up_missed_updates(stock_code, file_path, notification_times, alert_plan, periods, now)
+
+def _catch_up_missed_updates(stock_code, file_path, notification_times, alert_plan, periods=(), now=None):
+    now = now or datetime.datetime.now()
+    data, date_index = load_series(file_path)
+    if not data:
+        return None
+    missed = find_missed_slots(notification_times, data[-1]['timestamp'], now)
+    if not missed:
+        keep_series(file_path, data, date_index)
+        return None
+
+    log_message("INFO", f"놓친 알림 시간 {len(missed)}개 감지 ({missed[0]:%Y-%m-%d %H:%M} ~ {missed[-1]:%Y-%m-%d %H:%M}). 한 번에 보충합니다.")
+    # 놓친 시각은 모두 마지막 행 이후이므로, 기록이 없는 지난 거래일은 마지막 행의 날짜보다 뒤에 옴
+    last_day = data[-1]['timestamp'].date()
+    past_days = sorted({slot.date() for slot in missed if last_day < slot.date() < now.date()})
+    company_name = "Unknown"
+    changed = False
+
+    if past_days:
+        # 1페이지당 약 10거래일이므로 가장 오래된 누락일까지 덮을 만큼만, 그 날짜가 나오면 멈춤
+        span = len(KRX_CALENDAR.trading_days_between(past_days[0], now.date()))
+        history = get_historical_data_from_naver(stock_code, pages=span // 10 + 1, since=past_days[0])
+        closes = {}
+        for row in history:
+            ts = datetime.datetime.strptime(row['timestamp'], '%Y-%m-%d %H:%M')
+            if ts.date() in past_days:
+                closes[ts.date()] = make_row(ts, row['price'], row['open'], row['high'], row['low'], row['volume'])
+        # 빠진 날짜만 시간순으로 이어 붙임 (인덱스도 행과 함께 늘림)
+        for day in sorted(closes):
+            date_index.append(closes[day]['timestamp'])
+            data.append(closes[day])
+        if closes:
+            changed = True
+            log_message("SUCCESS", f"지난 거래일 {len(closes)}일의 시세를 보충했습니다.")
+
+    if any(slot.date() == now.date() for slot in missed):
+        current_price, company_name, day = get_stock_quote(stock_code)
+        if current_price:
+            upsert_today(data, date_index, now, current_price, day)
+            changed = True
+
+    if not changed:
+        log_message("WARNING", "놓친 알림 시간을 보충하지 못했습니다. (바뀐 데이터 없음)")
+        keep_series(file_path, data, date_index)
+        return None
+    store_series(file_path, data, date_index)
+    return evaluate_series(stock_code, company_name, data, date_index, alert_plan, periods)
@@ -0,0 +1,272 @@
+# ====================================================================
+# 여러 종목 대시보드 (가상화된 표)
+# ====================================================================
+# 종목마다 라벨 위젯을 만들면 수백 종목에서 위젯이 수천 개가 되어 Tk가 느려지므로,
+# Canvas 하나에 화면에 보이는 행만 그립니다.
+# - 보이는 행 수만큼의 캔버스 항목(글자, 스파크라인)을 만들어 두고, 스크롤하면 내용만 바꿔 재사용합니다.
+# - 각 칸은 마지막으로 그린 값을 기억해 두고, 값이 바뀐 칸만 itemconfigure/coords로 갱신합니다.
+# - 열 제목을 누르면 그 열로 정렬하며, 다시 누르면 순서가 반대로 바뀝니다.
+
+import tkinter as tk
+from tkinter import ttk
+
+from sms_alerts import pct_from_max, pct_from_min
+
+ROW_HEIGHT = 22
+SPARK_POINTS = 60
+SPARK_WIDTH = 120
+
+# (키, 제목, 너비, 정렬) - 정렬: 'w' 왼쪽, 'e' 오른쪽
+COLUMNS = (
+    ('stock_code', '종목 코드', 80, 'w'),
+    ('company_name', '회사명', 140, 'w'),
+    ('price', '현재가', 90, 'e'),
+    ('high', '최고가', 90, 'e'),
+    ('low', '최저가', 90, 'e'),
+    ('pct_max', '최고가 대비', 90, 'e'),
+    ('pct_min', '최저가 대비', 90, 'e'),
+    ('spark', '추이', SPARK_WIDTH, 'w'),
+    ('timestamp', '업데이트', 120, 'w'),
+)
+
+
+def format_cell(key, value):
+    """칸에 표시할 글자를 만듭니다."""
+    if value is None:
+        return "N/A"
+    if key in ('price', 'high', 'low'):
+        return f"{value:,}"
+    if key == 'pct_max':
+        return f"{value:.2f}%▼"
+    if key == 'pct_min':
+        return f"{value:.2f}%▲"
+    if key == 'timestamp':
+        return value.strftime('%Y-%m-%d %H:%M')
+    return str(value)
+
+
+def row_values(price, timestamp, window_stats, period, spark=None):
+    """
+    대시보드 한 행의 값을 만듭니다.
+    window_stats: {기간: (최고가, 최저가)} (ChartViewCache의 'window_stats' 또는 수집기 링 버퍼의 'stats')
+    spark를 주지 않으면 스파크라인은 그대로 둡니다.
+    """
+    values = {'price': price, 'timestamp': timestamp, 'high': None, 'low': None, 'pct_max': None, 'pct_min': None}
+    stats = window_stats.get(period)
+    if stats:
+        max_price, min_price = stats
+        values.update(high=max_price, low=min_price,
+                      pct_max=pct_from_max(price, max_price), pct_min=pct_from_min(price, min_price))
+    if spark is not None:
+        values['spark'] = spark
+    return values
+
+
+def sort_key(value):
+    # 값이 없는 칸은 (값 없음 여부, 값) 순서로 정렬해 맨 뒤로 보냄
+    return (value is None, value if value is not None else 0)
+
+
+class TickerDashboard(ttk.Frame):
+
+    def __init__(self, master, **kwargs):
+        super().__init__(master, **kwargs)
+        self.rows = {}        # 종목 코드 -> 행 데이터 딕셔너리
+        self.order = []       # 정렬된 종목 코드 목록
+        self.sort_column = 'stock_code'
+        self.sort_reverse = False
+        self._order_dirty = False
+        self._render_after_id = None
+        self._offset = 0      # 맨 위 행의 y 위치(픽셀)
+        self._slots = []      # 화면에 보이는 행 하나를 그리는 캔버스 항목 묶음
+
+        self.header = tk.Canvas(self, height=ROW_HEIGHT + 2, highlightthickness=0, background='#e8e8e8')
+        self.header.pack(fill='x')
+        body_frame = ttk.Frame(self)
+        body_frame.pack(fill='both', expand=True)
+        self.body = tk.Canvas(body_frame, highlightthickness=0, background='white')
+        self.scrollbar = ttk.Scrollbar(body_frame, orient='vertical', command=self._on_scrollbar)
+        self.scrollbar.pack(side='right', fill='y')
+        self.body.pack(side='left', fill='both', expand=True)
+
+        self._x_positions = []
+        x = 0
+        for key, title, width, anchor in COLUMNS:
+            self._x_positions.append(x)
+            item = self.header.create_text(x + 4, ROW_HEIGHT // 2 + 1, text=title, anchor='w', font=("Helvetica", 10, "bold"))
+            self.header.tag_bind(item, '<Button-1>', lambda e, key=key: self.sort_by(key))
+            x += width
+        self._header_items = self.header.find_all()
+        self._spark_x = self._x_positions[[key for key, *_ in COLUMNS].index('spark')]
+
+        self.body.bind('<Configure>', lambda e: self._schedule_render())
+        self.body.bind('<MouseWheel>', self._on_wheel)
+        self.body.bind('<Button-4>', lambda e: self.scroll_rows(-3))
+        self.body.bind('<Button-5>', lambda e: self.scroll_rows(3))
+
+    # ------------------------------------------------------------------
+    # 데이터
+    # ------------------------------------------------------------------
+    def update_row(self, stock_code, values):
+        """
+        종목 하나의 값을 반영합니다. 바뀐 값이 없으면 아무것도 하지 않습니다.
+        values: COLUMNS의 키 일부 ('spark'는 최근 가격 목록)
+        """
+        row = self.rows.get(stock_code)
+        if row is None:
+            row = {key: None for key, *_ in COLUMNS}
+            row['stock_code'] = stock_code
+            self.rows[stock_code] = row
+            self._order_dirty = True
+        changed = False
+        for key, value in values.items():
+            if key == 'spark' and value is not None:
+                value = tuple(value[-SPARK_POINTS:])
+            if row.get(key) != value:
+                row[key] = value
+                changed = True
+                if key == self.sort_column:
+                    self._order_dirty = True
+        if changed or self._order_dirty:
+            self._schedule_render()
+
+    def remove_missing(self, stock_codes):
+        """stock_codes에 없는 종목의 행을 지웁니다."""
+        keep = set(stock_codes)
+        for code in [c for c in self.rows if c not in keep]:
+            del self.rows[code]
+            self._order_dirty = True
+        self._schedule_render()
+
+    def sort_by(self, key):
+        if key == 'spark':
+            return
+        if key == self.sort_column:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.sort_column, self.sort_reverse = key, False
+        self._order_dirty = True
+        self._schedule_render()
+
+    # ------------------------------------------------------------------
+    # 스크롤
+    # ------------------------------------------------------------------
+    def _max_offset(self):
+        return max(len(self.order) * ROW_HEIGHT - self.body.winfo_height(), 0)
+
+    def scroll_rows(self, rows):
+        self._offset = min(max(self._offset + rows * ROW_HEIGHT, 0), self._max_offset())
+        self._schedule_render()
+
+    def _on_wheel(self, event):
+        self.scroll_rows(-1 if event.delta > 0 else 1)
+
+    def _on_scrollbar(self, action, value, unit=None):
+        if action == 'moveto':
+            self._offset = min(max(float(value) * len(self.order) * ROW_HEIGHT, 0), self._max_offset())
+        elif action == 'scroll':
+            step = int(value) * (1 if unit == 'units' else max(self.body.winfo_height() // ROW_HEIGHT - 1, 1))
+            self.scroll_rows(step)
+            return
+        self._schedule_render()
+
+    # ------------------------------------------------------------------
+    # 그리기
+    # ------------------------------------------------------------------
+    def _schedule_render(self):
+        # 여러 종목이 한꺼번에 갱신되어도 한 번만 다시 그림
+        if self._render_after_id is None:
+            self._render_after_id = self.after_idle(self._render)
+
+    def _resort(self):
+        column = self.sort_column
+        self.order = sorted(self.rows, key=lambda code: sort_key(self.rows[code][column]), reverse=self.sort_reverse)
+        # None은 역순 정렬에서도 뒤에 오도록
+        if self.sort_reverse:
+            self.order.sort(key=lambda code: self.rows[code][column] is None)
+        self._order_dirty = False
+        for item, (key, title, *_) in zip(self._header_items, COLUMNS):
+            arrow = (" ▼" if self.sort_reverse else " ▲") if key == self.sort_column else ""
+            self.header.itemconfigure(item, text=title + arrow)
+
+    def _ensure_slots(self, count):
+        """보이는 행 수만큼 캔버스 항목을 만들어 둡니다. (늘어날 때만 추가)"""
+        while len(self._slots) < count:
+            texts = {}
+            for (key, _, width, anchor), x in zip(COLUMNS, self._x_positions):
+                if key == 'spark':
+                    continue
+                tx = x + width - 6 if anchor == 'e' else x + 4
+                texts[key] = self.body.create_text(tx, 0, anchor=anchor, text="", font=("Helvetica", 10))
+            spark = self.body.create_line(0, 0, 0, 0, fill='#1f77b4', width=1)
+            separator = self.body.create_line(0, 0, 0, 0, fill='#eeeeee')
+            # 슬롯마다 마지막으로 그린 (종목, 칸 값)을 기억해 바뀐 칸만 갱신
+            self._slots.append({'texts': texts, 'spark': spark, 'separator': separator, 'drawn': {}, 'y': None})
+
+    def _render(self):
+        self._render_after_id = None
+        if self._order_dirty:
+            self._resort()
+        height = self.body.winfo_height()
+        width = self.body.winfo_width()
+        visible = height // ROW_HEIGHT + 2
+        self._ensure_slots(visible)
+        self._offset = min(self._offset, self._max_offset())
+
+        first = int(self._offset // ROW_HEIGHT)
+        for i, slot in enumerate(self._slots):
+            index = first + i
+            code = self.order[index] if i < visible and index < len(self.order) else None
+            self._draw_slot(slot, code, index * ROW_HEIGHT - self._offset, width)
+
+        total = len(self.order) * ROW_HEIGHT
+        if total > 0:
+            self.scrollbar.set(self._offset / total, min((self._offset + height) / total, 1.0))
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _draw_slot(self, slot, code, y, width):
+        drawn = slot['drawn']
+        state = 'normal' if code is not None else 'hidden'
+        if drawn.get('state') != state:
+            for item in (*slot['texts'].values(), slot['spark'], slot['separator']):
+                self.body.itemconfigure(item, state=state)
+            drawn['state'] = state
+        if code is None:
+            return
+
+        row = self.rows[code]
+        if slot['y'] != (y, width):
+            # 스크롤로 위치만 바뀌면 항목을 옮기기만 함
+            for item in slot['texts'].values():
+                self.body.coords(item, self.body.coords(item)[0], y + ROW_HEIGHT // 2)
+            self.body.coords(slot['separator'], 0, y + ROW_HEIGHT - 1, width, y + ROW_HEIGHT - 1)
+            slot['y'] = (y, width)
+            drawn.pop('spark', None)
+
+        for key, item in slot['texts'].items():
+            text = format_cell(key, row[key])
+            if drawn.get(key) != text:
+                self.body.itemconfigure(item, text=text)
+                drawn[key] = text
+
+        spark = (code, row['spark'])
+        if drawn.get('spark') != spark:
+            self._draw_spark(slot['spark'], row['spark'], y)
+            drawn['spark'] = spark
+
+    def _draw_spark(self, item, prices, y):
+        x0, spark_width = self._spark_x + 4, SPARK_WIDTH - 8
+        if not prices or len(prices) < 2:
+            self.body.coords(item, x0, y + ROW_HEIGHT // 2, x0, y + ROW_HEIGHT // 2)
+            return
+        low, high = min(prices), max(prices)
+        span = (high - low) or 1
+        step = spark_width / (len(prices) - 1)
+        top, bottom = y + 3, y + ROW_HEIGHT - 4
+        coords = []
+        for i, price in enumerate(prices):
+            coords.append(x0 + i * step)
+            coords.append(bottom - (price - low) / span * (bottom - top))
+        self.body.coords(item, *coords)
+        self.body.itemconfigure(item, fill='#d62728' if prices[-1] >= prices[0] else '#1f4fd6')
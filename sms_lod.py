@@ -0,0 +1,115 @@
+# ====================================================================
+# 차트 표시용 다운샘플링 (LOD: Level of Detail)
+# ====================================================================
+# 수년 치 장중 데이터를 모두 그리면 점이 수십만 개가 되어 그리는 데 수 초가 걸립니다.
+# 화면에 보이는 구간만 캔버스 가로 픽셀 수 정도로 줄여서 그립니다.
+# - 'lttb': Largest-Triangle-Three-Buckets. 버킷마다 이웃 점과 만드는 삼각형 넓이가 가장 큰 점을
+#   골라 추세 모양을 유지합니다.
+# - 'minmax': 버킷마다 최저점과 최고점을 모두 남깁니다. (급등락을 절대 놓치지 않음)
+# 어느 방식이든 keep으로 넘긴 인덱스(기간 내 실제 최고가/최저가)는 항상 결과에 포함됩니다.
+
+import bisect
+
+DOWNSAMPLE_METHODS = ('lttb', 'minmax')
+
+
+def lttb_indices(xs, ys, n_out, start=0, end=None):
+    """xs[start:end] 구간을 LTTB로 n_out개 점으로 줄인 인덱스 목록을 반환합니다."""
+    end = len(xs) if end is None else end
+    n = end - start
+    if n <= n_out or n_out < 3:
+        return list(range(start, end))
+
+    every = (n - 2) / (n_out - 2)
+    a = start
+    indices = [a]
+    for i in range(n_out - 2):
+        bucket_start = start + int(i * every) + 1
+        bucket_end = start + int((i + 1) * every) + 1
+
+        # 다음 버킷의 평균점 (마지막 버킷이면 마지막 점)
+        next_start = bucket_end
+        next_end = min(start + int((i + 2) * every) + 1, end)
+        if next_start >= next_end:
+            avg_x, avg_y = xs[end - 1], ys[end - 1]
+        else:
+            count = next_end - next_start
+            avg_x = sum(xs[next_start:next_end]) / count
+            avg_y = sum(ys[next_start:next_end]) / count
+
+        ax, ay = xs[a], ys[a]
+        best, best_area = bucket_start, -1.0
+        for j in range(bucket_start, bucket_end):
+            area = abs((ax - avg_x) * (ys[j] - ay) - (ax - xs[j]) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        indices.append(best)
+        a = best
+    indices.append(end - 1)
+    return indices
+
+
+def minmax_indices(xs, ys, n_out, start=0, end=None):
+    """xs[start:end] 구간을 버킷별 최저점/최고점으로 줄인 인덱스 목록을 반환합니다. (약 n_out개)"""
+    end = len(xs) if end is None else end
+    n = end - start
+    if n <= n_out or n_out < 4:
+        return list(range(start, end))
+
+    buckets = n_out // 2
+    size = n / buckets
+    indices = []
+    for b in range(buckets):
+        lo = start + int(b * size)
+        hi = min(start + int((b + 1) * size), end)
+        if lo >= hi:
+            continue
+        i_min = i_max = lo
+        for j in range(lo + 1, hi):
+            if ys[j] < ys[i_min]:
+                i_min = j
+            elif ys[j] > ys[i_max]:
+                i_max = j
+        indices.extend(sorted({i_min, i_max}))
+    if indices[0] != start:
+        indices.insert(0, start)
+    if indices[-1] != end - 1:
+        indices.append(end - 1)
+    return indices
+
+
+def visible_range(xs, x_min, x_max):
+    """
+    정렬된 xs에서 [x_min, x_max]에 보이는 점의 (start, end) 인덱스를 반환합니다.
+    선이 화면 가장자리까지 이어지도록 양쪽으로 한 점씩 더 포함합니다.
+    """
+    start = max(bisect.bisect_left(xs, x_min) - 1, 0)
+    end = min(bisect.bisect_right(xs, x_max) + 1, len(xs))
+    return start, end
+
+
+def nearest_index(xs, x):
+    """정렬된 xs에서 x와 가장 가까운 점의 인덱스를 이진 탐색으로 찾습니다. (xs가 비어 있으면 None)"""
+    if not xs:
+        return None
+    i = bisect.bisect_left(xs, x)
+    if i == 0:
+        return 0
+    if i == len(xs):
+        return i - 1
+    return i if xs[i] - x < x - xs[i - 1] else i - 1
+
+
+def downsample(xs, ys, n_out, start=0, end=None, method='lttb', keep=()):
+    """
+    xs[start:end] 구간을 n_out개 안팎의 점으로 줄인 인덱스 목록(오름차순)을 반환합니다.
+    keep의 인덱스는 구간 밖이더라도 항상 포함됩니다.
+    """
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(f"지원하지 않는 다운샘플링 방식: {method}")
+    pick = lttb_indices if method == 'lttb' else minmax_indices
+    indices = pick(xs, ys, n_out, start, end)
+    extra = [k for k in keep if k is not None]
+    if extra:
+        indices = sorted(set(indices).union(extra))
+    return indices
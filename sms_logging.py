@@ -0,0 +1,147 @@
+# ====================================================================
+# 로그 (logging 기반, 비동기)
+# ====================================================================
+# 여러 스레드에서 부르는 log_message()가 매번 시각 문자열을 만들고 print()로 바로 쓰던 것을
+# logging 프레임워크로 옮깁니다.
+# - 호출한 스레드는 LogRecord를 큐에 넣기만 하고, 서식 지정과 출력은 리스너 스레드가 합니다.
+# - 출력 대상: 콘솔(stdout이 있을 때만), 로그 파일(크기 또는 날짜 기준 교체)
+#   PyInstaller `-w` 빌드에서는 sys.stdout이 None이므로 파일에만 기록됩니다.
+# - json_format=True이면 한 줄에 하나의 JSON 객체로 기록합니다. (time, level, thread, message)
+# - 로그 수준은 실행 중에도 set_level()로 바꿀 수 있습니다.
+# - 기존 수준 이름(INFO, SUCCESS, WARNING, ERROR, ALERT)을 그대로 사용합니다.
+
+import atexit
+import datetime
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+
+SUCCESS = 25
+ALERT = 35
+logging.addLevelName(SUCCESS, 'SUCCESS')
+logging.addLevelName(ALERT, 'ALERT')
+
+LEVELS = ('DEBUG', 'INFO', 'SUCCESS', 'WARNING', 'ALERT', 'ERROR')
+_LEVEL_NUMBERS = {'DEBUG': logging.DEBUG, 'INFO': logging.INFO, 'SUCCESS': SUCCESS,
+                  'WARNING': logging.WARNING, 'ALERT': ALERT, 'ERROR': logging.ERROR}
+
+LOG_FORMAT = "[%(asctime)s] [%(levelname)s] %(message)s"
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+logger = logging.getLogger('sms')
+logger.propagate = False
+logger.setLevel(logging.INFO)
+
+_lock = threading.Lock()
+_init_lock = threading.Lock()
+_listener = None
+_stopped = False  # 종료 후에는 리스너 없이 호출한 스레드에서 바로 출력
+
+
+class JsonFormatter(logging.Formatter):
+    """레코드 하나를 JSON 한 줄로 만듭니다."""
+
+    def format(self, record):
+        entry = {
+            'time': datetime.datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'thread': record.threadName,
+            'message': record.getMessage(),
+        }
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class _RecordQueueHandler(logging.handlers.QueueHandler):
+    # 기본 QueueHandler는 넣기 전에 호출한 스레드에서 메시지 서식을 지정하므로,
+    # 서식 지정을 리스너 스레드로 미루기 위해 레코드를 그대로 넣음 (log_message는 인자 없는 문자열만 기록)
+    def prepare(self, record):
+        return record
+
+
+def level_number(level):
+    """'INFO' 같은 수준 이름이나 숫자를 logging 수준 번호로 바꿉니다."""
+    if isinstance(level, int):
+        return level
+    return _LEVEL_NUMBERS.get(str(level).upper(), logging.INFO)
+
+
+def setup_logging(level='INFO', log_file=None, json_format=False, rotation='size', max_bytes=1024 * 1024,
+                  backup_count=5, console=True):
+    """
+    로그 출력을 설정합니다. 다시 호출하면 이전 설정을 대체합니다.
+    rotation: 'size'(max_bytes마다 교체) 또는 'daily'(자정마다 교체), backup_count개의 이전 파일을 보관
+    """
+    global _listener
+    formatter = JsonFormatter() if json_format else logging.Formatter(LOG_FORMAT, DATE_FORMAT)
+    handlers = []
+    # 창 모드 빌드에서는 stdout이 None
+    if console and sys.stdout is not None:
+        handlers.append(logging.StreamHandler(sys.stdout))
+    if log_file:
+        log_file = os.path.expanduser(log_file)
+        os.makedirs(os.path.dirname(os.path.abspath(log_file)), exist_ok=True)
+        if rotation == 'daily':
+            handlers.append(logging.handlers.TimedRotatingFileHandler(log_file, when='midnight', backupCount=backup_count,
+                                                                      encoding='utf-8'))
+        else:
+            handlers.append(logging.handlers.RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count,
+                                                                 encoding='utf-8'))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            for handler in _listener.handlers:
+                handler.close()
+        log_queue = queue.SimpleQueue()
+        logger.handlers = [_RecordQueueHandler(log_queue)]
+        logger.setLevel(level_number(level))
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=False)
+        _listener.start()
+
+
+def set_level(level):
+    """실행 중에 로그 수준을 바꿉니다."""
+    logger.setLevel(level_number(level))
+
+
+def get_level():
+    return logging.getLevelName(logger.level)
+
+
+def shutdown():
+    """
+    큐에 남은 로그를 모두 출력하고 리스너 스레드를 멈춥니다. (프로그램 종료 시 자동 호출)
+    이후에 남는 로그(종료 중인 데몬 스레드 등)는 호출한 스레드에서 바로 출력합니다.
+    """
+    global _listener, _stopped
+    with _lock:
+        _stopped = True
+        if _listener is not None:
+            _listener.stop()
+            logger.handlers = list(_listener.handlers)
+            _listener = None
+
+
+atexit.register(shutdown)
+
+
+def log_message(level, message):
+    """지정된 수준으로 로그를 남깁니다. (어느 스레드에서나 호출 가능, 출력은 리스너 스레드에서)"""
+    number = _LEVEL_NUMBERS.get(level, logging.INFO)
+    if not logger.isEnabledFor(number):
+        return
+    if _listener is None and not _stopped:
+        # setup_logging()을 부르지 않은 스크립트에서는 콘솔 출력만으로 시작
+        with _init_lock:
+            if _listener is None and not _stopped:
+                setup_logging(level=logger.level)
+    # logger.log()는 호출 위치(파일/줄 번호)를 찾느라 느리므로, 레코드를 직접 만들어 넘김
+    logger.handle(logger.makeRecord(logger.name, number, '', 0, message, None, None))
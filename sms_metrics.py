@@ -0,0 +1,263 @@
+# ====================================================================
+# 성능 지표 (카운터, 게이지, 히스토그램)
+# ====================================================================
+# 업데이트 한 번에 어디서 시간이 드는지 보기 위해 조회, 파싱, CSV 입출력, 분석, 알림 평가,
+# 차트 그리기 구간의 소요 시간과 횟수를 기록합니다.
+# - Counter: 누적 횟수 (요청, 실패, 행 수, 알림 수)
+# - Gauge: 현재 값 (대기열 길이, 캐시 적중률). 함수를 등록하면 조회할 때마다 계산합니다.
+# - Histogram: 소요 시간 분포 (구간별 누적 개수, 합계, 개수)
+# 지표는 Prometheus 텍스트 형식으로 내보낼 수 있으며(start_http_server, 127.0.0.1 전용),
+# GUI에서는 진단 탭이 snapshot()으로 표시합니다.
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 초 단위 히스토그램 구간 (1ms ~ 30s)
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _label_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(key, extra=()):
+    items = list(key) + list(extra)
+    if not items:
+        return ""
+    return "{" + ",".join(f'{name}="{value}"' for name, value in items) + "}"
+
+
+class Counter:
+
+    kind = 'counter'
+
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help = help_text
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def inc(self, amount=1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        with self._lock:
+            return self._values.get(_label_key(labels), 0)
+
+    def samples(self):
+        with self._lock:
+            return [(self.name, key, value) for key, value in sorted(self._values.items())]
+
+
+class Gauge:
+
+    kind = 'gauge'
+
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help = help_text
+        self._lock = threading.Lock()
+        self._values = {}
+        self._functions = {}
+
+    def set(self, value, **labels):
+        with self._lock:
+            self._values[_label_key(labels)] = value
+
+    def set_function(self, fn, **labels):
+        """조회할 때마다 fn()을 호출해 값을 구합니다. (None을 반환하면 생략)"""
+        with self._lock:
+            self._functions[_label_key(labels)] = fn
+
+    def samples(self):
+        with self._lock:
+            values = dict(self._values)
+            functions = dict(self._functions)
+        for key, fn in functions.items():
+            try:
+                values[key] = fn()
+            except Exception:
+                values[key] = None
+        return [(self.name, key, value) for key, value in sorted(values.items()) if value is not None]
+
+
+class Histogram:
+
+    kind = 'histogram'
+
+    def __init__(self, name, help_text, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._series = {}  # 라벨 -> [구간별 개수 목록, 합계, 개수]
+
+    def observe(self, value, **labels):
+        key = _label_key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def stats(self):
+        """라벨별 {'count', 'sum', 'p50', 'p95'} (분위수는 구간 안에서 선형 보간한 추정값)"""
+        with self._lock:
+            series = {key: (list(counts), total, count) for key, (counts, total, count) in self._series.items()}
+        result = {}
+        for key, (counts, total, count) in series.items():
+            result[key] = {'count': count, 'sum': total,
+                           'p50': self._quantile(counts, count, 0.5), 'p95': self._quantile(counts, count, 0.95)}
+        return result
+
+    def _quantile(self, counts, count, q):
+        if count == 0:
+            return None
+        rank = q * count
+        seen = 0
+        for i, n in enumerate(counts):
+            if seen + n >= rank and n > 0:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else self.buckets[-1]
+                return lower + (upper - lower) * (rank - seen) / n
+            seen += n
+        return self.buckets[-1]
+
+    def samples(self):
+        with self._lock:
+            series = {key: (list(counts), total, count) for key, (counts, total, count) in self._series.items()}
+        lines = []
+        for key, (counts, total, count) in sorted(series.items()):
+            cumulative = 0
+            for bound, n in zip(self.buckets, counts):
+                cumulative += n
+                lines.append((f"{self.name}_bucket", key + (('le', repr(bound)),), cumulative))
+            lines.append((f"{self.name}_bucket", key + (('le', '+Inf'),), count))
+            lines.append((f"{self.name}_sum", key, total))
+            lines.append((f"{self.name}_count", key, count))
+        return lines
+
+
+class MetricsRegistry:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics = {}
+
+    def _get(self, cls, name, help_text, *args):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help_text, *args)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"이미 다른 종류로 등록된 지표: {name}")
+            return metric
+
+    def counter(self, name, help_text=""):
+        return self._get(Counter, name, help_text)
+
+    def gauge(self, name, help_text=""):
+        return self._get(Gauge, name, help_text)
+
+    def histogram(self, name, help_text="", buckets=DEFAULT_BUCKETS):
+        return self._get(Histogram, name, help_text, buckets)
+
+    def metrics(self):
+        with self._lock:
+            return [self._metrics[name] for name in sorted(self._metrics)]
+
+    def render(self):
+        """Prometheus 텍스트 형식(0.0.4)으로 모든 지표를 내보냅니다."""
+        lines = []
+        for metric in self.metrics():
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, key, value in metric.samples():
+                lines.append(f"{name}{_format_labels(key)} {value}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self):
+        """
+        진단 화면 표시용 [(지표 이름, 라벨 문자열, 값 문자열)] 목록
+        히스토그램은 횟수, 평균, p50/p95를 ms 단위로 보여줍니다.
+        """
+        rows = []
+        for metric in self.metrics():
+            if isinstance(metric, Histogram):
+                for key, s in sorted(metric.stats().items()):
+                    avg = s['sum'] / s['count'] * 1000 if s['count'] else 0
+                    rows.append((metric.name, _format_labels(key),
+                                 f"{s['count']}회, 평균 {avg:.1f}ms, p50 {s['p50'] * 1000:.1f}ms, p95 {s['p95'] * 1000:.1f}ms"))
+            else:
+                for _, key, value in metric.samples():
+                    text = f"{value:.3f}" if isinstance(value, float) else f"{value:,}"
+                    rows.append((metric.name, _format_labels(key), text))
+        return rows
+
+
+REGISTRY = MetricsRegistry()
+
+# 공용 지표 (모듈마다 같은 이름으로 가져다 씀)
+FETCH_SECONDS = REGISTRY.histogram('sms_fetch_seconds', "네이버 금융 조회 소요 시간 (kind=quote|history)")
+FETCH_REQUESTS = REGISTRY.counter('sms_fetch_requests_total', "네이버 금융 조회 요청 수")
+FETCH_FAILURES = REGISTRY.counter('sms_fetch_failures_total', "네이버 금융 조회 실패 수")
+PARSE_SECONDS = REGISTRY.histogram('sms_parse_seconds', "HTML 파싱 소요 시간 (kind=quote|history)")
+CSV_SECONDS = REGISTRY.histogram('sms_csv_seconds', "CSV 읽기/쓰기 소요 시간 (op=load|save)")
+CSV_ROWS = REGISTRY.counter('sms_csv_rows_total', "CSV에서 읽거나 쓴 행 수 (op=load|save)")
+ANALYSIS_SECONDS = REGISTRY.histogram('sms_analysis_seconds', "기간별 최고가/최저가 분석 소요 시간 (kind=evaluate|chart_views)")
+ALERT_EVAL_SECONDS = REGISTRY.histogram('sms_alert_eval_seconds', "알림 조건 평가 소요 시간")
+ALERTS = REGISTRY.counter('sms_alerts_total', "발동한 알림 수 (평가 결과 기준)")
+NOTIFICATIONS = REGISTRY.counter('sms_notifications_total', "실제로 발송한 알림 수")
+RENDER_SECONDS = REGISTRY.histogram('sms_render_seconds', "차트 갱신 소요 시간 (mode=tk: 갱신 요청부터 그리기 완료까지, offscreen: 렌더 스레드의 그리기)")
+
+
+def timed(histogram, **labels):
+    """with timed(CSV_SECONDS, op='load'): ... 형태로 구간 소요 시간을 기록합니다."""
+    return histogram.time(**labels)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+
+    registry = REGISTRY
+
+    def do_GET(self):
+        if self.path.split('?', 1)[0] not in ('/', '/metrics'):
+            self.send_error(404)
+            return
+        body = self.registry.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass # 요청마다 콘솔에 찍지 않음
+
+
+def start_http_server(port, host='127.0.0.1', registry=REGISTRY):
+    """
+    http://host:port/metrics 에서 지표를 제공하는 서버를 데몬 스레드로 시작하고 서버 객체를 반환합니다.
+    외부에 노출되지 않도록 기본값은 127.0.0.1입니다.
+    """
+    handler = type('MetricsHandler', (_MetricsHandler,), {'registry': registry})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='MetricsServer', daemon=True).start()
+    return server
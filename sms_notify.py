@@ -0,0 +1,171 @@
+# ====================================================================
+# 알림 발송기 (중복 제거, 쿨다운, 요약 묶음)
+# ====================================================================
+# 업데이트 스레드에서 알림을 바로 보내면, 조건이 유지되는 동안 매 알림 시간마다 같은 알림이
+# 반복되고 느린 알림 백엔드가 업데이트 전체를 지연시킵니다. 이를 막기 위해:
+# - 에지 트리거: 조건(종목, 기간, 종류, 임계값)이 '발동하지 않음 → 발동'으로 바뀔 때만 알립니다.
+# - 히스테리시스: 발동한 조건은 현재 비율이 임계값보다 hysteresis(%p) 이상 멀어져야 다시 무장됩니다.
+#   (임계값 근처에서 가격이 오르내릴 때 알림이 깜빡이지 않음)
+# - 쿨다운: 같은 조건은 다시 무장되더라도 cooldown(초) 안에는 다시 알리지 않습니다.
+# - 요약 묶음: 발송은 별도 스레드가 맡으며, digest_window(초) 동안 들어온 알림을 모아
+#   여러 종목이면 하나의 요약 알림으로 보냅니다.
+
+import queue
+import threading
+import time
+
+from sms_alerts import format_alert_message, format_alert_summary
+from sms_metrics import NOTIFICATIONS
+
+# 요약 알림에 표시할 최대 종목 수 (나머지는 '외 N개 종목')
+MAX_DIGEST_LINES = 8
+
+
+class NotificationDispatcher:
+
+    def __init__(self, send, cooldown=1800, hysteresis=1.0, digest_window=2.0, log=None, clock=time.monotonic):
+        """
+        send(title, message): 실제 발송 함수 (발송 스레드에서 호출)
+        cooldown: 같은 조건을 다시 알리기까지의 최소 시간(초)
+        hysteresis: 발동한 조건이 다시 무장되기 위해 임계값에서 벗어나야 하는 폭(%p)
+        digest_window: 첫 알림 후 다른 알림을 모으는 시간(초)
+        """
+        self.send = send
+        self.cooldown = cooldown
+        self.hysteresis = hysteresis
+        self.digest_window = digest_window
+        self.log = log
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._active = set()       # 발동 중(재무장 전)인 조건 키
+        self._last_sent = {}       # 조건 키 -> 마지막 발송 시각
+        self._queue = queue.Queue()
+        self._thread = None
+
+    # ------------------------------------------------------------------
+    # 조건 상태 (업데이트 스레드에서 호출)
+    # ------------------------------------------------------------------
+    def submit(self, result, alert_plan):
+        """
+        update_stock_data()/catch_up_missed_updates()의 결과를 반영하고, 새로 알릴 것이 있으면 발송 대기열에 넣습니다.
+        발송은 기다리지 않습니다. 대기열에 넣은 알림 목록을 반환합니다.
+        """
+        stock_code = result['stock_code']
+        levels = result.get('alert_levels', {})
+        firing = {}
+        for alert in result['alerts']:
+            for rule_id in alert['rules']:
+                firing[(rule_id, alert['kind'])] = alert
+
+        selected = {}  # (기간, 종류) -> 알릴 조건 번호 목록
+        now = self.clock()
+        with self._lock:
+            for rule_id, period, max_pct, min_pct in alert_plan.rules:
+                for kind, threshold in (('max', max_pct), ('min', min_pct)):
+                    key = (stock_code, period, kind, threshold)
+                    if (rule_id, kind) in firing:
+                        if key in self._active:
+                            continue # 이미 알린 조건이 계속 유지되는 중
+                        self._active.add(key)
+                        last = self._last_sent.get(key)
+                        if last is not None and now - last < self.cooldown:
+                            continue
+                        self._last_sent[key] = now
+                        selected.setdefault((period, kind), []).append(rule_id)
+                    elif key in self._active:
+                        level = levels.get(period)
+                        pct = None if level is None else level[0 if kind == 'max' else 1]
+                        if pct is None or pct > threshold + self.hysteresis:
+                            self._active.discard(key)
+
+        alerts = []
+        for alert in result['alerts']:
+            rules = selected.get((alert['period'], alert['kind']))
+            if rules:
+                alerts.append(dict(alert, rules=rules))
+        if alerts:
+            self._queue.put((stock_code, result['company_name'], alerts))
+            self.start()
+        return alerts
+
+    def reset(self, stock_code=None):
+        """조건 상태를 지웁니다. (종목이나 알림 조건이 바뀌었을 때)"""
+        with self._lock:
+            if stock_code is None:
+                self._active.clear()
+                self._last_sent.clear()
+            else:
+                self._active = {k for k in self._active if k[0] != stock_code}
+                self._last_sent = {k: v for k, v in self._last_sent.items() if k[0] != stock_code}
+
+    # ------------------------------------------------------------------
+    # 발송 스레드
+    # ------------------------------------------------------------------
+    def start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='NotificationDispatcher', daemon=True)
+                self._thread.start()
+
+    def stop(self, timeout=5):
+        """대기 중인 알림을 모두 보낸 뒤 발송 스레드를 멈춥니다."""
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            self._queue.put(None)
+            thread.join(timeout)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = self.clock() + self.digest_window
+            stopping = False
+            while True:
+                remaining = deadline - self.clock()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._deliver(batch)
+            if stopping:
+                return
+
+    def _deliver(self, batch):
+        for title, message in build_notifications(batch):
+            try:
+                self.send(title, message)
+                NOTIFICATIONS.inc()
+            except Exception as e:
+                if self.log:
+                    self.log("WARNING", f"알림 발송 실패: {e}")
+
+
+def build_notifications(batch):
+    """
+    모인 알림 [(종목 코드, 회사명, 알림 목록)]을 발송할 (제목, 내용) 목록으로 만듭니다.
+    한 종목이면 기존 형식 그대로, 여러 종목이면 요약 알림 하나로 묶습니다.
+    """
+    by_code = {}
+    for stock_code, company_name, alerts in batch:
+        entry = by_code.setdefault(stock_code, [company_name, []])
+        entry[0] = company_name
+        entry[1].extend(alerts)
+
+    if len(by_code) == 1:
+        stock_code, (company_name, alerts) = next(iter(by_code.items()))
+        title = f"주식 가격 알림 - {company_name} ({stock_code})"
+        return [(title, "\n\n".join(format_alert_message(alert) for alert in alerts))]
+
+    lines = [f"{company_name} ({stock_code}): " + ", ".join(format_alert_summary(alert) for alert in alerts)
+             for stock_code, (company_name, alerts) in list(by_code.items())[:MAX_DIGEST_LINES]]
+    if len(by_code) > MAX_DIGEST_LINES:
+        lines.append(f"외 {len(by_code) - MAX_DIGEST_LINES}개 종목")
+    return [(f"주식 가격 알림 - {len(by_code)}개 종목", "\n".join(lines))]
@@ -0,0 +1,214 @@
+# ====================================================================
+# 알림 임계값 최적화 (파라미터 스윕)
+# ====================================================================
+# 저장된 과거 데이터로 (기간 × 최고가 대비 % × 최저가 대비 %) 조합을
+# 그리드 탐색 또는 랜덤 탐색하여, 사용자가 고른 지표로 순위를 매깁니다.
+# - 각 시점은 실제 알림(AlertPlan.evaluate)과 같이 거래일 기준 구간의 고가/저가 대비 현재가로 평가합니다.
+# - 가격/고가/저가/날짜 배열은 공유 메모리에 한 번만 올리고, 작업 프로세스는 이를 참조만 합니다.
+# - 작업 단위는 기간 하나이며, 기간별 윈도우 시작 행과 이동 최고가/최저가는 한 번만 계산합니다.
+# - 작업 프로세스는 항상 spawn으로 띄웁니다. GUI는 스레드를 여럿 쓰므로, fork하면
+#   다른 스레드가 잡고 있던 잠금이 자식 프로세스에 잠긴 채로 복사될 수 있습니다.
+
+import array
+import multiprocessing
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from sms_alerts import pct_from_max, pct_from_min
+from sms_calendar import SeriesDateIndex
+
+# 순위 지표: 이름 -> 설명
+SWEEP_METRICS = {
+    'hit_rate': "적중률 (알림 후 유리한 방향으로 움직인 비율)",
+    'avg_return': "알림 1회당 평균 수익률(%)",
+    'total_return': "누적 수익률(%)",
+}
+
+# 작업 프로세스에서 공유 메모리를 참조하기 위한 전역 변수
+_shared_block = None
+_shared_series = None
+
+
+def row_count_starts(length, period):
+    """날짜 정보가 없을 때의 윈도우 시작 행 목록: 최근 period개 행을 period일 구간으로 봅니다."""
+    return [i - period + 1 if i >= period - 1 else None for i in range(length)]
+
+
+def rolling_extremes(highs, lows, starts):
+    """
+    각 시점 t에서 끝나는 구간 [starts[t], t]의 최고가(highs)/최저가(lows) 목록을 O(n)으로 계산합니다.
+    starts는 감소하지 않아야 하며, starts[t]가 None인(구간이 채워지지 않은) 시점은 None입니다.
+    """
+    n = len(highs)
+    maxs = [None] * n
+    mins = [None] * n
+    max_q = deque()
+    min_q = deque()
+    for i in range(n):
+        high = highs[i]
+        low = lows[i]
+        while max_q and highs[max_q[-1]] <= high:
+            max_q.pop()
+        max_q.append(i)
+        while min_q and lows[min_q[-1]] >= low:
+            min_q.pop()
+        min_q.append(i)
+        start = starts[i]
+        if start is None:
+            continue
+        while max_q[0] < start:
+            max_q.popleft()
+        while min_q[0] < start:
+            min_q.popleft()
+        maxs[i] = highs[max_q[0]]
+        mins[i] = lows[min_q[0]]
+    return maxs, mins
+
+
+def backtest_period(prices, period, thresholds, horizon, highs=None, lows=None, starts=None):
+    """
+    기간 하나에 대해 여러 (최고가 대비 %, 최저가 대비 %) 조합을 백테스트합니다.
+    각 시점의 비율은 AlertPlan.evaluate()와 같이 구간 고가/저가 대비 현재가로 구합니다.
+    highs/lows가 없으면 prices를, starts(시점별 윈도우 시작 행)가 없으면 최근 period개 행을 씁니다.
+    최고가 근접 알림은 이후 하락을, 최저가 근접 알림은 이후 상승을 적중으로 봅니다.
+    """
+    n = len(prices)
+    if starts is None:
+        starts = row_count_starts(n, period)
+    maxs, mins = rolling_extremes(prices if highs is None else highs, prices if lows is None else lows, starts)
+
+    # 시점별 비율은 조합과 무관하므로 먼저 계산
+    samples = []
+    for t in range(n - horizon):
+        price = prices[t]
+        if not price or maxs[t] is None:
+            continue
+        forward = (prices[t + horizon] / price - 1) * 100
+        samples.append((pct_from_max(price, maxs[t]), pct_from_min(price, mins[t]), forward))
+
+    results = []
+    for max_pct, min_pct in thresholds:
+        alerts = hits = 0
+        total = 0.0
+        for pct_of_max, pct_of_min, forward in samples:
+            if pct_of_max <= max_pct:
+                alerts += 1
+                total -= forward
+                hits += forward < 0
+            if pct_of_min <= min_pct:
+                alerts += 1
+                total += forward
+                hits += forward > 0
+        results.append({
+            'period': period,
+            'max_pct': max_pct,
+            'min_pct': min_pct,
+            'alerts': alerts,
+            'hits': hits,
+            'hit_rate': hits / alerts if alerts else 0.0,
+            'avg_return': total / alerts if alerts else 0.0,
+            'total_return': total,
+        })
+    return results
+
+
+def _attach_shared_series(name, length, has_dates):
+    """
+    작업 프로세스 초기화: 공유 메모리의 [가격 | 고가 | 저가 | 날짜 ordinal] 배열을 복사 없이 참조합니다.
+    날짜 인덱스만 작업 프로세스에서 한 번 만들어 두고 기간별 윈도우 시작 행 계산에 씁니다.
+    """
+    global _shared_block, _shared_series
+    _shared_block = shared_memory.SharedMemory(name=name)
+    values = _shared_block.buf.cast('d')
+    prices, highs, lows = (values[i * length:(i + 1) * length] for i in range(3))
+    date_index = SeriesDateIndex(int(o) for o in values[3 * length:4 * length]) if has_dates else None
+    _shared_series = (prices, highs, lows, date_index)
+
+
+def _window_starts(date_index, length, period):
+    if date_index is None:
+        return row_count_starts(length, period)
+    return date_index.row_window_starts(period)
+
+
+def _run_shared_task(period, thresholds, horizon):
+    prices, highs, lows, date_index = _shared_series
+    starts = _window_starts(date_index, len(prices), period)
+    return backtest_period(prices, period, thresholds, horizon, highs, lows, starts)
+
+
+def build_grid(periods, max_pcts, min_pcts):
+    """그리드 탐색용 (기간, 최고가 대비 %, 최저가 대비 %) 조합 목록을 만듭니다."""
+    return [(p, mx, mn) for p in periods for mx in max_pcts for mn in min_pcts]
+
+
+def sample_random(periods, pct_range, count, seed=None):
+    """랜덤 탐색용 조합 목록을 만듭니다. 비율은 pct_range=(하한, 상한)에서 균등 추출합니다."""
+    rng = random.Random(seed)
+    low, high = pct_range
+    periods = list(periods)
+    return [(rng.choice(periods), round(rng.uniform(low, high), 2), round(rng.uniform(low, high), 2))
+            for _ in range(count)]
+
+
+def pct_steps(start, stop, step):
+    """start부터 stop까지 step 간격의 비율 목록 (부동소수점 오차 없이)."""
+    count = int(round((stop - start) / step)) + 1
+    return [round(start + i * step, 4) for i in range(count)]
+
+
+def optimize_alert_thresholds(prices, candidates, metric='hit_rate', horizon=5, min_alerts=3, workers=None, top=10,
+                              highs=None, lows=None, timestamps=None):
+    """
+    후보 조합들을 백테스트하고 metric 기준 상위 top개 결과를 반환합니다.
+    highs/lows(일별 고가/저가)와 timestamps를 주면 실제 알림과 같이 거래일 기준 구간의
+    고가/저가로 평가하고, 없으면 prices와 최근 N개 행 구간을 씁니다.
+    workers가 1이면 현재 프로세스에서 바로 계산하고, 그 외에는 프로세스 풀을 사용합니다.
+    """
+    if metric not in SWEEP_METRICS:
+        raise ValueError(f"알 수 없는 지표입니다: {metric}")
+    highs = prices if highs is None else highs
+    lows = prices if lows is None else lows
+
+    # 기간별로 묶어 이동 최고가/최저가 계산을 공유
+    by_period = {}
+    for period, max_pct, min_pct in candidates:
+        if 0 < period < len(prices) - horizon:
+            by_period.setdefault(int(period), []).append((max_pct, min_pct))
+
+    date_index = SeriesDateIndex(timestamps) if timestamps is not None else None
+    results = []
+    if workers == 1 or len(by_period) <= 1:
+        for period, thresholds in by_period.items():
+            starts = _window_starts(date_index, len(prices), period)
+            results.extend(backtest_period(prices, period, thresholds, horizon, highs, lows, starts))
+    else:
+        values = array.array('d', prices)
+        values.extend(highs)
+        values.extend(lows)
+        if date_index is not None:
+            values.extend(date_index.ordinals)
+        block = shared_memory.SharedMemory(create=True, size=max(len(values) * values.itemsize, 1))
+        try:
+            block.buf[:len(values) * values.itemsize] = values.tobytes()
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                     initializer=_attach_shared_series,
+                                     initargs=(block.name, len(prices), date_index is not None)) as pool:
+                futures = [pool.submit(_run_shared_task, period, thresholds, horizon)
+                           for period, thresholds in by_period.items()]
+                for future in futures:
+                    results.extend(future.result())
+        finally:
+            block.close()
+            block.unlink()
+
+    results = [r for r in results if r['alerts'] >= min_alerts]
+    results.sort(key=lambda r: (r[metric], r['alerts']), reverse=True)
+    return results[:top]
+
+
+def result_to_condition(result):
+    """최적화 결과를 알림 조건 설정값 (기간, 최고가 대비 %, 최저가 대비 %)으로 변환합니다."""
+    return result['period'], result['max_pct'], result['min_pct']
@@ -0,0 +1,353 @@
+# ====================================================================
+# 주가 차트 (시각화 탭)
+# ====================================================================
+# 매번 ax.clear()로 모든 요소를 다시 만들던 방식 대신, 한 번 만든 아티스트의
+# 데이터만 set_data()로 바꿉니다.
+# - 범례, 최고가/최저가 선, 날짜 포맷, x축 라벨 회전은 처음 한 번만 설정합니다.
+# - 표시할 내용이 이전과 같으면 다시 그리지 않고, 다르면 draw_idle()로 Tk 이벤트 루프가
+#   한가할 때 한 번만 그립니다.
+# - 마우스 커서 같은 오버레이는 배경을 저장해 두고 블리팅(blit)으로 그 부분만 갱신합니다.
+#   커서에 가장 가까운 점은 정렬된 x좌표 배열에서 이진 탐색으로 찾고, 가리키는 점이 바뀔 때만 다시 그립니다.
+# - 긴 시계열은 보이는 구간만 캔버스 가로 픽셀 수 정도로 다운샘플링해서 그리며(sms_lod),
+#   확대/이동/창 크기 변경 시 다시 계산합니다. 기간 내 실제 최고가/최저가 점은 항상 남깁니다.
+# - 'candle' 스타일에서는 보이는 봉의 밀도에 따라 캔들 → OHLC 바 → 종가 선으로 자동 전환합니다. (sms_candles)
+# - 아티스트 관리(ChartFigure)는 캔버스와 분리되어 있어, Tk 캔버스(PriceChart) 대신
+#   작업자 스레드의 Agg 캔버스에서도 그릴 수 있습니다. (sms_render)
+
+import functools
+import sys
+import time
+
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.figure import Figure
+from matplotlib import font_manager, rc
+import matplotlib.dates as mdates
+
+from sms_alerts import pct_from_max, pct_from_min
+from sms_candles import CandleRenderer, choose_mode
+from sms_lod import downsample, nearest_index, visible_range
+from sms_metrics import RENDER_SECONDS
+
+CHART_STYLES = ('line', 'candle')
+
+# 표시하는 점이 이 개수 이하일 때만 점 마커를 그림
+MARKER_LIMIT = 300
+# 확대/이동 중 다운샘플링 재계산을 미루는 시간(ms)
+LOD_DELAY_MS = 50
+
+
+@functools.lru_cache(maxsize=None)
+def korean_font_family():
+    """운영체제별 한글 폰트 이름을 찾습니다. (폰트 파일 조회는 한 번만 수행)"""
+    if sys.platform == 'darwin': # macOS
+        return 'AppleGothic'
+    if sys.platform == 'win32': # Windows
+        try:
+            return font_manager.FontProperties(fname="c:/Windows/Fonts/malgun.ttf").get_name()
+        except Exception:
+            return None # Malgun Gothic 폰트가 없는 경우
+    return None
+
+
+def configure_fonts():
+    """한글 폰트 설정 (운영체제에 따라 자동 선택)"""
+    family = korean_font_family()
+    if family:
+        rc('font', family=family)
+    if sys.platform == 'darwin':
+        rc('axes', unicode_minus=False)
+
+
+def dates_to_x(timestamps):
+    """datetime 목록을 차트 x좌표(matplotlib 날짜 숫자) 목록으로 바꿉니다."""
+    return list(mdates.date2num(timestamps)) if timestamps else []
+
+
+class ChartFigure:
+    """
+    차트의 Figure와 아티스트, 다운샘플링 상태를 관리합니다. (캔버스 종류와 무관)
+    캔버스는 하위 클래스나 호출하는 쪽에서 self.fig에 붙입니다.
+    """
+
+    def __init__(self, figsize=(5, 4), dpi=100, lod_method='lttb', style='line'):
+        configure_fonts()
+        self.fig = Figure(figsize=figsize, dpi=dpi)
+        self.ax = self.fig.add_subplot(111)
+
+        # 한 번만 만드는 아티스트들
+        self.price_line, = self.ax.plot([], [], label='주가', marker='o', markersize=3)
+        self.max_line = self.ax.axhline(y=0, color='r', linestyle='--', label='기간 내 최고가')
+        self.min_line = self.ax.axhline(y=0, color='b', linestyle='--', label='기간 내 최저가')
+        self.legend = self.ax.legend()
+        self.ax.set_xlabel("날짜 및 시간")
+        self.ax.set_ylabel("가격")
+        # 시간도 표시되도록 포맷 지정
+        self.ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d %H:%M'))
+        self.ax.grid(True)
+        self.fig.autofmt_xdate()
+        # 캔들/OHLC/거래량 (style='candle'일 때만 표시)
+        self.style = style
+        self.candles = CandleRenderer(self.ax)
+        self._signature = None
+
+        # 다운샘플링 상태: 전체 시계열(x는 matplotlib 날짜 숫자)과 마지막으로 그린 구간
+        self.lod_method = lod_method
+        self._xs = []
+        self._ys = []
+        self._timestamps = []
+        self._extremes = None  # (기간 내 최고가, 최저가)
+        self._ohlcv = None  # (시가, 고가, 저가, 거래량) 목록
+        self._keep = ()
+        self._lod_key = None
+
+    # ------------------------------------------------------------------
+    # 데이터 갱신
+    # ------------------------------------------------------------------
+    def set_series(self, timestamps, prices, title, xs=None, highs=None, lows=None, opens=None, volumes=None):
+        """
+        표시할 시계열을 바꿉니다. 이전과 같은 내용이면 아무것도 하지 않고 False를 반환합니다.
+        xs: 미리 변환해 둔 x좌표 (없으면 timestamps로 계산)
+        highs/lows: 일별 고가/저가 (주면 기간 내 최고가/최저가 선을 이 값으로 그림)
+        opens/volumes: 시가/거래량 (highs/lows와 함께 있으면 캔들 스타일로 그릴 수 있음)
+        구간 중간의 값만 바뀐 경우도 잡도록 기간 내 최고가/최저가를 비교에 포함합니다.
+        """
+        has_ohlc = opens is not None and highs is not None and lows is not None
+        highs = prices if highs is None else highs
+        lows = prices if lows is None else lows
+        max_price = max(highs) if prices else None
+        min_price = min(lows) if prices else None
+        signature = (title, self.style, len(prices), timestamps[0] if timestamps else None,
+                     timestamps[-1] if timestamps else None, prices[-1] if prices else None, max_price, min_price)
+        if signature == self._signature:
+            return False
+        self._signature = signature
+
+        has_data = bool(prices)
+        for artist in (self.price_line, self.max_line, self.min_line, self.legend):
+            artist.set_visible(has_data)
+        self.ax.set_title(title)
+
+        if has_data:
+            self._xs = xs if xs is not None else dates_to_x(timestamps)
+            self._ys = list(prices)
+            self._timestamps = timestamps
+            self._ohlcv = (opens, highs, lows, volumes or [None] * len(prices)) if has_ohlc else None
+            # 최고가/최저가 선의 기준(고가/저가)과 종가 선의 꼭짓점(종가 최고/최저)을 모두 남김
+            self._keep = (highs.index(max_price), lows.index(min_price),
+                          self._ys.index(max(self._ys)), self._ys.index(min(self._ys)))
+            self._extremes = (max_price, min_price)
+            self._lod_key = None
+            self._render_range(0, len(self._xs))
+            self.max_line.set_ydata([max_price, max_price])
+            self.min_line.set_ydata([min_price, min_price])
+            # 범례 항목은 새로 만들지 않고 글자만 바꿈
+            texts = self.legend.get_texts()
+            texts[1].set_text(f'기간 내 최고가 ({max_price:,})')
+            texts[2].set_text(f'기간 내 최저가 ({min_price:,})')
+            # x 범위는 데이터 양 끝으로 직접 맞추고(캔들 모드에서는 선이 숨겨져 있음), y 범위는 최고가/최저가 선 기준
+            pad = max((self._xs[-1] - self._xs[0]) * 0.02, 0.5)
+            self.ax.set_xlim(self._xs[0] - pad, self._xs[-1] + pad)
+            self.ax.relim(visible_only=True)
+            self.ax.autoscale_view(scalex=False)
+        else:
+            self._xs, self._ys, self._timestamps, self._ohlcv, self._keep = [], [], [], None, ()
+            self._extremes = None
+            self.candles.hide()
+        return True
+
+    def apply_style(self, style):
+        """'line'(종가 선) 또는 'candle'(캔들/OHLC + 거래량)로 바꿉니다. 바뀌었으면 True"""
+        if style not in CHART_STYLES:
+            raise ValueError(f"지원하지 않는 차트 스타일: {style}")
+        if style == self.style:
+            return False
+        self.style = style
+        self._signature = None
+        if self._xs:
+            self._lod_key = None
+            self.refresh_visible()
+        return True
+
+    def has_data(self):
+        return bool(self._xs)
+
+    # ------------------------------------------------------------------
+    # 다운샘플링 (LOD)
+    # ------------------------------------------------------------------
+    def _target_points(self):
+        # 가로 픽셀당 점 하나 정도면 충분함
+        return max(int(self.ax.bbox.width), 100)
+
+    def _render_range(self, start, end):
+        """
+        xs[start:end] 구간을 그립니다. 바뀐 것이 있으면 True
+        캔들 스타일이면 봉 밀도에 따라 캔들/OHLC 바를 고르고, 너무 촘촘하면 다운샘플링한 종가 선으로 그립니다.
+        """
+        n_out = self._target_points()
+        mode = 'line'
+        if self.style == 'candle' and self._ohlcv is not None:
+            mode = choose_mode(end - start, self.ax.bbox.width)
+        key = (start, end, n_out, mode)
+        if key == self._lod_key:
+            return False
+        self._lod_key = key
+
+        if mode != 'line':
+            opens, highs, lows, volumes = self._ohlcv
+            self.candles.set_data(mode, self._xs[start:end], opens[start:end], highs[start:end], lows[start:end],
+                                  self._ys[start:end], volumes[start:end])
+            self.price_line.set_visible(False)
+            # 자동 범위 계산에 쓰이도록 선 데이터는 보이는 구간의 양 끝만 남김
+            self.price_line.set_data([self._xs[start], self._xs[end - 1]], [self._ys[start], self._ys[end - 1]])
+            return True
+
+        self.candles.hide()
+        self.price_line.set_visible(True)
+        indices = downsample(self._xs, self._ys, n_out, start, end, method=self.lod_method, keep=self._keep)
+        self.price_line.set_data([self._xs[i] for i in indices], [self._ys[i] for i in indices])
+        self.price_line.set_marker('o' if len(indices) <= MARKER_LIMIT else '')
+        return True
+
+    def refresh_visible(self):
+        """현재 x 범위(확대/이동, 크기 변경 반영)에 맞게 다시 다운샘플링합니다. 바뀐 것이 있으면 True"""
+        if not self._xs:
+            return False
+        x_min, x_max = self.ax.get_xlim()
+        start, end = visible_range(self._xs, x_min, x_max)
+        if end - start < 2:
+            return False
+        return self._render_range(start, end)
+
+
+class PriceChart(ChartFigure):
+    """Tk 캔버스에 직접 그리는 차트 (확대/이동 도구 모음과 블리팅 오버레이 포함)"""
+
+    def __init__(self, master, figsize=(5, 4), dpi=100, lod_method='lttb', style='line'):
+        super().__init__(figsize, dpi, lod_method, style)
+        self.canvas = FigureCanvasTkAgg(self.fig, master=master)
+        self.widget = self.canvas.get_tk_widget()
+        # 확대/이동 도구 모음 (배치는 호출하는 쪽에서)
+        self.toolbar = NavigationToolbar2Tk(self.canvas, master, pack_toolbar=False)
+        self.toolbar.update()
+
+        # 블리팅용 오버레이 (십자선, 가리키는 점, 툴팁)
+        self.cursor_line = self.ax.axvline(x=0, color='gray', linewidth=0.8, animated=True, visible=False)
+        self.cursor_hline = self.ax.axhline(y=0, color='gray', linewidth=0.8, animated=True, visible=False)
+        self.cursor_point, = self.ax.plot([], [], marker='o', markersize=6, color='black', animated=True, visible=False)
+        self.tooltip = self.ax.annotate('', xy=(0, 0), xytext=(12, 12), textcoords='offset points', fontsize=9,
+                                        bbox=dict(boxstyle='round', facecolor='white', alpha=0.9),
+                                        animated=True, visible=False)
+        self.overlays = [self.cursor_line, self.cursor_hline, self.cursor_point, self.tooltip]
+        self._hover_index = None
+        self._background = None
+        self._update_started = None  # 데이터 갱신 요청 시각 (그리기가 끝나면 소요 시간 기록)
+
+        self._lod_after_id = None
+        self.ax.callbacks.connect('xlim_changed', self._schedule_lod)
+        self.canvas.mpl_connect('resize_event', self._schedule_lod)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self.canvas.mpl_connect('motion_notify_event', self._on_motion)
+        self.canvas.mpl_connect('axes_leave_event', self._on_leave)
+
+        self.canvas.draw()
+
+    def update(self, timestamps, prices, title, xs=None, highs=None, lows=None, opens=None, volumes=None):
+        """set_series()와 같으며, 바뀐 것이 있으면 Tk가 한가할 때 한 번 그립니다."""
+        started = time.perf_counter()
+        if self.set_series(timestamps, prices, title, xs, highs, lows, opens, volumes):
+            self._hide_hover()
+            if self._update_started is None:
+                self._update_started = started
+            self.canvas.draw_idle()
+
+    def set_style(self, style):
+        if self.apply_style(style):
+            self.canvas.draw_idle()
+
+    def show_message(self, title):
+        """데이터가 없을 때 제목만 표시합니다."""
+        self.update([], [], title)
+
+    def destroy(self):
+        self.toolbar.destroy()
+        self.widget.destroy()
+
+    def _schedule_lod(self, *args):
+        # 확대/이동 중에는 이벤트가 연달아 오므로 잠시 모았다가 한 번만 계산
+        if not self._xs or self._lod_after_id is not None:
+            return
+        self._lod_after_id = self.widget.after(LOD_DELAY_MS, self._refresh_lod)
+
+    def _refresh_lod(self):
+        self._lod_after_id = None
+        if self.refresh_visible():
+            self.canvas.draw_idle()
+
+    # ------------------------------------------------------------------
+    # 블리팅 오버레이
+    # ------------------------------------------------------------------
+    def _on_draw(self, event):
+        # 전체 그리기가 끝날 때마다 오버레이를 제외한 배경을 저장
+        self._background = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_overlays()
+        if self._update_started is not None:
+            # 데이터 갱신 요청부터 화면에 그려질 때까지 (draw_idle 대기 포함)
+            RENDER_SECONDS.observe(time.perf_counter() - self._update_started, mode='tk')
+            self._update_started = None
+
+    def _draw_overlays(self):
+        for artist in self.overlays:
+            if artist.get_visible():
+                self.ax.draw_artist(artist)
+
+    def blit_overlays(self):
+        """저장된 배경 위에 오버레이만 다시 그려 화면에 반영합니다."""
+        if self._background is None:
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_overlays()
+        self.canvas.blit(self.fig.bbox)
+
+    def tooltip_text(self, index):
+        """index 번째 점의 툴팁 내용 (시각, 가격, 기간 내 최고가/최저가 대비 비율)"""
+        price = self._ys[index]
+        max_price, min_price = self._extremes
+        lines = [self._timestamps[index].strftime('%Y-%m-%d %H:%M'), f"가격: {price:,}원"]
+        if self._ohlcv is not None:
+            opens, highs, lows, _ = self._ohlcv
+            lines.append(f"시가 {opens[index]:,} / 고가 {highs[index]:,} / 저가 {lows[index]:,}")
+        lines.append(f"최고가 대비 {pct_from_max(price, max_price):.2f}%▼")
+        lines.append(f"최저가 대비 {pct_from_min(price, min_price):.2f}%▲")
+        return "\n".join(lines)
+
+    def _on_motion(self, event):
+        if event.inaxes is not self.ax or not self._xs:
+            return
+        index = nearest_index(self._xs, event.xdata)
+        if index == self._hover_index:
+            return # 같은 점을 가리키는 동안에는 다시 그리지 않음
+        self._hover_index = index
+        x, y = self._xs[index], self._ys[index]
+        self.cursor_line.set_xdata([x, x])
+        self.cursor_hline.set_ydata([y, y])
+        self.cursor_point.set_data([x], [y])
+        self.tooltip.xy = (x, y)
+        self.tooltip.set_text(self.tooltip_text(index))
+        # 오른쪽 절반에서는 툴팁을 점의 왼쪽에 두어 축 밖으로 나가지 않게 함
+        x_min, x_max = self.ax.get_xlim()
+        on_right = x > (x_min + x_max) / 2
+        self.tooltip.set_position((-12, 12) if on_right else (12, 12))
+        self.tooltip.set_horizontalalignment('right' if on_right else 'left')
+        for artist in self.overlays:
+            artist.set_visible(True)
+        self.blit_overlays()
+
+    def _hide_hover(self):
+        self._hover_index = None
+        for artist in self.overlays:
+            artist.set_visible(False)
+
+    def _on_leave(self, event):
+        if self._hover_index is not None:
+            self._hide_hover()
+            self.blit_overlays()
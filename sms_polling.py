@@ -0,0 +1,63 @@
+# ====================================================================
+# 장중 적응형 폴링
+# ====================================================================
+# 장중 실시간 모드에서 다음 조회까지의 대기 시간을 계산합니다.
+# - KRX 정규장 시간에만 base_interval초 간격으로 조회합니다.
+# - 가격이 변하지 않으면 간격을 backoff배씩 늘립니다. (최대 max_interval초)
+# - 현재가가 알림 임계값에 near_pct%p 이내로 가까워지면 min_interval초로 좁힙니다.
+# - 주말/휴장일과 장 마감 이후에는 다음 거래일 개장 시각까지 조회하지 않습니다.
+
+import datetime
+
+from sms_calendar import KRX_CALENDAR, SESSION_CLOSE, SESSION_OPEN
+
+
+class AdaptivePoller:
+
+    def __init__(self, base_interval=60, min_interval=10, max_interval=600, backoff=2.0, near_pct=0.5, calendar=None):
+        self.base_interval = base_interval
+        self.min_interval = min(min_interval, base_interval)
+        self.max_interval = max(max_interval, base_interval)
+        self.backoff = backoff
+        self.near_pct = near_pct
+        self.calendar = calendar or KRX_CALENDAR
+        self.interval = base_interval
+        self.last_price = None
+
+    def seconds_until_open(self, now):
+        """장중이면 0, 아니면 다음 정규장 개장 시각까지 남은 초를 반환합니다."""
+        if self.calendar.is_session_open(now):
+            return 0
+        day = now.date()
+        if not self.calendar.is_trading_day(day) or now.time() > SESSION_CLOSE:
+            day = self.calendar.next_trading_day(day, inclusive=False)
+        next_open = datetime.datetime.combine(day, SESSION_OPEN)
+        return max((next_open - now).total_seconds(), 0)
+
+    def next_delay(self, now, price=None, threshold_distance=None):
+        """
+        방금 조회한 가격과 알림 임계값까지의 거리(%p)로 다음 조회까지의 대기 시간(초)을 계산합니다.
+        장이 열려 있지 않으면 다음 개장 시각까지의 시간을 반환하고, 간격은 기본값으로 되돌립니다.
+        """
+        wait = self.seconds_until_open(now)
+        if wait > 0:
+            self.interval = self.base_interval
+            self.last_price = None
+            return wait
+
+        if price is not None:
+            if price == self.last_price:
+                self.interval = min(self.interval * self.backoff, self.max_interval)
+            else:
+                self.interval = self.base_interval
+            self.last_price = price
+
+        delay = self.interval
+        if threshold_distance is not None and threshold_distance <= self.near_pct:
+            delay = self.min_interval
+
+        # 장 마감 직후의 종가를 놓치지 않도록 마감 시각을 넘겨 기다리지 않음
+        until_close = (datetime.datetime.combine(now.date(), SESSION_CLOSE) - now).total_seconds()
+        if 0 < until_close < delay:
+            delay = until_close
+        return delay
@@ -0,0 +1,143 @@
+# ====================================================================
+# 백그라운드 차트 렌더링
+# ====================================================================
+# 긴 시계열을 그리는 동안 Tk 메인 스레드가 멈추지 않도록, 차트를 전용 렌더 스레드에서
+# Agg 캔버스로 그리고 완성된 이미지만 메인 스레드로 넘겨 PhotoImage로 표시합니다.
+# - 아티스트 관리는 PriceChart와 같은 ChartFigure를 사용합니다. (같은 다운샘플링/캔들 전환)
+# - 요청은 '최신 상태' 하나만 보관합니다. 렌더 중에 새 데이터나 다른 기간이 들어오면
+#   대기 중이던 요청은 덮어쓰이고, 이미 그리던 결과는 세대 번호가 달라 버려집니다.
+# - RGBA 버퍼의 알파 채널을 떼어 PPM으로 만드는 것까지 렌더 스레드에서 하고,
+#   메인 스레드는 PhotoImage 생성과 교체만 합니다.
+# - 확대/이동 도구 모음과 마우스 오버레이는 Tk 캔버스(PriceChart)에서만 지원합니다.
+
+import threading
+import tkinter as tk
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from sms_metrics import RENDER_SECONDS, timed
+from sms_plot import ChartFigure
+
+# 창 크기 변경 중에는 이벤트가 연달아 오므로 잠시 모았다가 한 번만 다시 그림
+RESIZE_DELAY_MS = 100
+
+
+def rgba_to_ppm(rgba):
+    """Agg 캔버스의 RGBA 버퍼(높이 x 너비 x 4)를 Tk PhotoImage가 읽을 수 있는 PPM 바이트로 바꿉니다."""
+    rgba = np.asarray(rgba)
+    height, width = rgba.shape[:2]
+    return b"P6 %d %d 255\n" % (width, height) + rgba[:, :, :3].tobytes()
+
+
+class OffscreenChart:
+
+    def __init__(self, master, figsize=(5, 4), dpi=100, lod_method='lttb', style='line', log=None):
+        self.dpi = dpi
+        self.log = log
+        # Figure는 여기서 만들지만, 이후에는 렌더 스레드에서만 다룸
+        self.figure = ChartFigure(figsize, dpi, lod_method, style)
+        self.agg = FigureCanvasAgg(self.figure.fig)
+
+        self.widget = tk.Label(master, background='white', borderwidth=0)
+        self.toolbar = None
+        self.image = None
+        self._resize_after_id = None
+
+        self._cond = threading.Condition()
+        self._state = {'series': None, 'style': style, 'size': None}
+        self._generation = 0   # 요청할 때마다 증가
+        self._rendered = 0     # 렌더 스레드가 마지막으로 시작한 세대
+        self._has_data = False
+        self._closed = False
+        self.widget.bind('<Configure>', self._on_configure)
+        self._thread = threading.Thread(target=self._run, name='chart-render', daemon=True)
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    # 메인 스레드 API (PriceChart와 같은 이름)
+    # ------------------------------------------------------------------
+    def update(self, timestamps, prices, title, xs=None, highs=None, lows=None, opens=None, volumes=None):
+        self._has_data = bool(prices)
+        self._request(series=(timestamps, prices, title, xs, highs, lows, opens, volumes))
+
+    def set_style(self, style):
+        self._request(style=style)
+
+    def show_message(self, title):
+        self.update([], [], title)
+
+    def has_data(self):
+        return self._has_data
+
+    def destroy(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self.widget.destroy()
+
+    def _request(self, **changes):
+        with self._cond:
+            self._state.update(changes)
+            self._generation += 1
+            self._cond.notify()
+
+    def _on_configure(self, event):
+        if self._resize_after_id is not None:
+            self.widget.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.widget.after(RESIZE_DELAY_MS, self._apply_size, event.width, event.height)
+
+    def _apply_size(self, width, height):
+        self._resize_after_id = None
+        if width > 1 and height > 1:
+            self._request(size=(width, height))
+
+    def _show(self, generation, ppm):
+        """렌더 결과를 표시합니다. (메인 스레드) 그사이 더 새로운 요청이 있었으면 버림"""
+        if self._closed or generation != self._generation:
+            return
+        self.image = tk.PhotoImage(data=ppm, format='PPM')
+        self.widget.configure(image=self.image)
+
+    # ------------------------------------------------------------------
+    # 렌더 스레드
+    # ------------------------------------------------------------------
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._closed and self._rendered == self._generation:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                generation = self._generation
+                state = dict(self._state)
+                self._rendered = generation
+            try:
+                with timed(RENDER_SECONDS, mode='offscreen'):
+                    ppm = self._render(state)
+            except Exception as e:
+                if self.log:
+                    self.log("ERROR", f"차트 렌더링 중 오류 발생: {e}")
+                continue
+            with self._cond:
+                stale = generation != self._generation or self._closed
+            if not stale:
+                self.widget.after(0, self._show, generation, ppm)
+
+    def _render(self, state):
+        figure = self.figure
+        resized = False
+        if state['size'] is not None:
+            width, height = state['size']
+            current = figure.fig.get_size_inches() * self.dpi
+            if (round(current[0]), round(current[1])) != (width, height):
+                figure.fig.set_size_inches(width / self.dpi, height / self.dpi)
+                resized = True
+        figure.apply_style(state['style'])
+        if state['series'] is not None:
+            figure.set_series(*state['series'])
+        if resized:
+            # 가로 픽셀 수가 바뀌면 다운샘플링 점 개수와 캔들 전환 기준도 바뀜
+            figure.refresh_visible()
+        self.agg.draw()
+        return rgba_to_ppm(self.agg.buffer_rgba())
@@ -0,0 +1,123 @@
+# ====================================================================
+# 공유 메모리 링 버퍼 (수집기 → GUI)
+# ====================================================================
+# 2-프로세스 모드에서 수집기 프로세스가 시세와 기간별 최고가/최저가를
+# 공유 메모리에 기록하고, GUI 프로세스가 이를 읽어 화면을 갱신합니다.
+# - 쓰는 쪽은 하나(수집기), 읽는 쪽은 여럿일 수 있습니다.
+# - 슬롯마다 시퀀스 번호를 두어(seqlock) 쓰는 중이거나 덮어쓰인 슬롯은 읽지 않습니다.
+# - 읽는 쪽이 capacity 이상 뒤처지면 오래된 기록은 건너뜁니다.
+
+import datetime
+import struct
+from multiprocessing import shared_memory
+
+_MAGIC = b'SMSQ'
+_VERSION = 1
+# magic, version, capacity, max_periods, write_seq
+_HEADER = struct.Struct('<4sIIIQ')
+# slot_seq, stock_code, timestamp(epoch), price, stat_count
+_SLOT_HEAD = struct.Struct('<Q8sdqI')
+# period, max_price, min_price
+_STAT = struct.Struct('<Iqq')
+
+
+class QuoteRingBuffer:
+
+    def __init__(self, block, capacity, max_periods, owner):
+        self._block = block
+        self.capacity = capacity
+        self.max_periods = max_periods
+        self._owner = owner
+        self._slot_size = _SLOT_HEAD.size + _STAT.size * max_periods
+
+    @property
+    def name(self):
+        return self._block.name
+
+    @classmethod
+    def create(cls, name=None, capacity=1024, max_periods=16):
+        """새 링 버퍼를 만듭니다. name이 없으면 임의의 이름이 붙습니다."""
+        slot_size = _SLOT_HEAD.size + _STAT.size * max_periods
+        block = shared_memory.SharedMemory(name=name, create=True, size=_HEADER.size + slot_size * capacity)
+        block.buf[:_HEADER.size + slot_size * capacity] = bytes(_HEADER.size + slot_size * capacity)
+        _HEADER.pack_into(block.buf, 0, _MAGIC, _VERSION, capacity, max_periods, 0)
+        return cls(block, capacity, max_periods, owner=True)
+
+    @classmethod
+    def attach(cls, name):
+        """다른 프로세스가 만든 링 버퍼에 연결합니다."""
+        block = shared_memory.SharedMemory(name=name)
+        magic, version, capacity, max_periods, _ = _HEADER.unpack_from(block.buf, 0)
+        if magic != _MAGIC or version != _VERSION:
+            block.close()
+            raise ValueError(f"SMS 링 버퍼가 아닙니다: {name}")
+        return cls(block, capacity, max_periods, owner=False)
+
+    def _slot_offset(self, seq):
+        return _HEADER.size + (seq % self.capacity) * self._slot_size
+
+    def write_seq(self):
+        """지금까지 기록된 레코드 수 (다음에 기록될 레코드 번호)"""
+        return _HEADER.unpack_from(self._block.buf, 0)[4]
+
+    def publish(self, stock_code, timestamp, price, window_stats=None):
+        """
+        시세 한 건을 기록합니다.
+        window_stats: {기간: (최고가, 최저가)} (max_periods개를 넘는 기간은 버려짐)
+        """
+        buf = self._block.buf
+        seq = self.write_seq()
+        offset = self._slot_offset(seq)
+        stats = sorted((window_stats or {}).items())[:self.max_periods]
+
+        # 홀수 시퀀스 = 쓰는 중
+        _SLOT_HEAD.pack_into(buf, offset, 2 * seq + 1, stock_code.encode('ascii')[:8], timestamp.timestamp(), int(price), len(stats))
+        stat_offset = offset + _SLOT_HEAD.size
+        for period, (max_price, min_price) in stats:
+            _STAT.pack_into(buf, stat_offset, period, int(max_price), int(min_price))
+            stat_offset += _STAT.size
+        struct.pack_into('<Q', buf, offset, 2 * seq + 2)
+        struct.pack_into('<Q', buf, _HEADER.size - 8, seq + 1)
+        return seq
+
+    def _read_slot(self, seq):
+        buf = self._block.buf
+        offset = self._slot_offset(seq)
+        slot_seq, code, ts, price, count = _SLOT_HEAD.unpack_from(buf, offset)
+        if slot_seq != 2 * seq + 2:
+            return None # 쓰는 중이거나 이미 덮어쓰임
+        stats = {}
+        stat_offset = offset + _SLOT_HEAD.size
+        for _ in range(min(count, self.max_periods)):
+            period, max_price, min_price = _STAT.unpack_from(buf, stat_offset)
+            stats[period] = (max_price, min_price)
+            stat_offset += _STAT.size
+        # 읽는 동안 덮어쓰이지 않았는지 다시 확인
+        if struct.unpack_from('<Q', buf, offset)[0] != slot_seq:
+            return None
+        return {
+            'seq': seq,
+            'stock_code': code.rstrip(b'\0').decode('ascii'),
+            'timestamp': datetime.datetime.fromtimestamp(ts),
+            'price': price,
+            'stats': stats,
+        }
+
+    def read_since(self, next_seq):
+        """
+        next_seq번 이후의 레코드 목록과 다음에 읽을 번호를 반환합니다.
+        반환값: (레코드 목록, 다음 next_seq)
+        """
+        end = self.write_seq()
+        start = max(next_seq, end - self.capacity)
+        records = []
+        for seq in range(start, end):
+            record = self._read_slot(seq)
+            if record is not None:
+                records.append(record)
+        return records, end
+
+    def close(self):
+        self._block.close()
+        if self._owner:
+            self._block.unlink()
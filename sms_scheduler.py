@@ -0,0 +1,179 @@
+# ====================================================================
+# 이벤트 기반 타이머 스케줄러
+# ====================================================================
+# 1초마다 깨어나 run_pending()을 호출하던 schedule 루프를 대체합니다.
+# - 예약 작업은 실행 시각 기준 힙(heap)에 보관하고, 다음 실행 시각까지만 잠듭니다.
+# - 작업이 추가/변경되면 대기 중인 스레드를 즉시 깨웁니다.
+# - 벽시계 변경이나 절전 복귀를 감지하기 위해 최대 MAX_SLEEP초마다 한 번은 깨어나
+#   벽시계 경과 시간과 monotonic 경과 시간을 비교합니다.
+
+import datetime
+import heapq
+import itertools
+import threading
+import time
+
+
+class ScheduledJob:
+    """예약된 작업 하나. daily_time이 있으면 매일 같은 시각(HH:MM)에 반복됩니다."""
+
+    def __init__(self, due, callback, tag=None, daily_time=None):
+        self.due = due
+        self.callback = callback
+        self.tag = tag
+        self.daily_time = daily_time
+        self.cancelled = False
+
+    def __repr__(self):
+        return f"ScheduledJob(due={self.due:%Y-%m-%d %H:%M:%S}, tag={self.tag!r})"
+
+
+def next_daily_occurrence(daily_time, now):
+    """now 이후(now 제외) 처음 돌아오는 daily_time(datetime.time) 시각을 반환합니다."""
+    due = datetime.datetime.combine(now.date(), daily_time)
+    if due <= now:
+        due += datetime.timedelta(days=1)
+    return due
+
+
+class TimerScheduler:
+    # 벽시계 점프/절전 복귀를 확인하기 위한 최대 대기 시간 (초)
+    MAX_SLEEP = 600
+    # 벽시계와 monotonic 경과 시간 차이가 이 값(초)을 넘으면 시계 점프로 간주
+    JUMP_TOLERANCE = 5
+
+    def __init__(self, now=datetime.datetime.now, log=None):
+        self._now = now
+        # log(level, message): 작업 실패 등을 기록할 함수
+        self._log = log
+        self._heap = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread = None
+        self._stopped = False
+        # 시계 점프 감지 시 호출: on_clock_jump(벽시계 경과 - monotonic 경과, 초)
+        self.on_clock_jump = None
+
+    # ------------------------------------------------------------------
+    # 작업 등록
+    # ------------------------------------------------------------------
+    def _push(self, job):
+        heapq.heappush(self._heap, (job.due, next(self._seq), job))
+
+    def call_at(self, due, callback, tag=None):
+        """due(datetime) 시각에 callback을 한 번 실행합니다."""
+        job = ScheduledJob(due, callback, tag)
+        with self._cond:
+            self._push(job)
+            self._cond.notify()
+        return job
+
+    def call_later(self, seconds, callback, tag=None):
+        """seconds초 후에 callback을 한 번 실행합니다."""
+        return self.call_at(self._now() + datetime.timedelta(seconds=seconds), callback, tag)
+
+    def set_daily_times(self, times, callback, tag='daily'):
+        """
+        tag로 등록된 기존 매일 작업을 모두 지우고, times('HH:MM' 목록)에 callback을 새로 예약합니다.
+        유효한 시간 문자열 목록을 반환합니다.
+        """
+        valid = []
+        now = self._now()
+        with self._cond:
+            self._cancel_locked(tag)
+            for t in times:
+                try:
+                    daily_time = datetime.datetime.strptime(t.strip(), '%H:%M').time()
+                except ValueError:
+                    continue
+                self._push(ScheduledJob(next_daily_occurrence(daily_time, now), callback, tag, daily_time))
+                valid.append(t.strip())
+            self._cond.notify()
+        return valid
+
+    def _cancel_locked(self, tag):
+        for _, _, job in self._heap:
+            if job.tag == tag:
+                job.cancelled = True
+        self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+        heapq.heapify(self._heap)
+
+    def cancel(self, tag):
+        """tag로 등록된 작업을 모두 취소합니다."""
+        with self._cond:
+            self._cancel_locked(tag)
+            self._cond.notify()
+
+    def jobs(self):
+        """예약된 작업 목록 (실행 시각 순)"""
+        with self._cond:
+            return [job for _, _, job in sorted(self._heap) if not job.cancelled]
+
+    def next_due(self):
+        with self._cond:
+            return self._heap[0][0] if self._heap else None
+
+    # ------------------------------------------------------------------
+    # 실행 루프
+    # ------------------------------------------------------------------
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name='TimerScheduler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+
+    def is_running(self):
+        return bool(self._thread and self._thread.is_alive())
+
+    def _pop_due_locked(self, now):
+        """실행할 작업을 꺼내고 매일 작업은 다음 실행 시각으로 다시 넣습니다."""
+        due_jobs = []
+        seen_callbacks = set()
+        while self._heap and self._heap[0][0] <= now:
+            _, _, job = heapq.heappop(self._heap)
+            if job.cancelled:
+                continue
+            if job.daily_time is not None:
+                self._push(ScheduledJob(next_daily_occurrence(job.daily_time, now), job.callback, job.tag, job.daily_time))
+                # 절전 등으로 여러 시각이 한꺼번에 밀린 경우 같은 콜백은 한 번만 실행
+                if job.callback in seen_callbacks:
+                    continue
+                seen_callbacks.add(job.callback)
+            due_jobs.append(job)
+        return due_jobs
+
+    def _run(self):
+        while True:
+            with self._cond:
+                if self._stopped:
+                    return
+                now = self._now()
+                due_jobs = self._pop_due_locked(now)
+                if not due_jobs:
+                    timeout = self.MAX_SLEEP
+                    if self._heap:
+                        timeout = min(timeout, max((self._heap[0][0] - now).total_seconds(), 0))
+                    wall_before, mono_before = time.time(), time.monotonic()
+                    self._cond.wait(timeout)
+                    drift = (time.time() - wall_before) - (time.monotonic() - mono_before)
+                else:
+                    drift = 0
+
+            if abs(drift) > self.JUMP_TOLERANCE and self.on_clock_jump:
+                self._safe_call(self.on_clock_jump, drift)
+            for job in due_jobs:
+                self._safe_call(job.callback)
+
+    def _safe_call(self, callback, *args):
+        # 작업 하나의 실패가 스케줄러 스레드를 멈추지 않도록 함
+        try:
+            callback(*args)
+        except Exception as e:
+            if self._log:
+                self._log("ERROR", f"예약 작업 실행 실패: {e}")
@@ -0,0 +1,308 @@
+# ====================================================================
+# 알림 전달 대상(싱크)과 영구 발신함
+# ====================================================================
+# 데스크톱 알림만으로는 서버에서 돌아가는 헤드리스 수집기의 알림을 받을 수 없으므로,
+# 알림을 여러 대상(싱크)으로 보낼 수 있게 합니다.
+# - DesktopSink: plyer 데스크톱 알림
+# - WebhookSink: JSON을 HTTP POST로 전송 (urllib, 추가 라이브러리 없음)
+# - SmtpSink: 이메일 전송 (smtplib)
+# - JsonlSink: 파일에 한 줄에 하나씩 JSON으로 추가 (append-only)
+# 발송은 AlertOutbox가 싱크마다 별도 스레드에서 수행하므로 느린 싱크가 주가 수집이나 다른 싱크를 막지 않습니다.
+# - 싱크마다 밀린 알림을 최대 max_batch개씩 묶어 한 번에 보냅니다. (웹훅 요청 하나, 이메일 한 통)
+# - 실패하면 RETRY_DELAYS 간격으로 다시 시도하고, 모두 실패하면 로그를 남기고 버립니다.
+# - 보내지 못한 알림은 발신함 파일(JSON)에 저장되어, 프로그램을 다시 시작해도 이어서 보냅니다.
+#
+# 설정 예 (sms_collector.json):
+#   "alert_sinks": [
+#     {"type": "webhook", "url": "http://127.0.0.1:8080/alerts"},
+#     {"type": "smtp", "host": "127.0.0.1", "port": 1025, "sender": "sms@localhost", "recipients": ["me@localhost"]},
+#     {"type": "jsonl", "path": "~/Documents/sms_alerts.jsonl"}
+#   ]
+
+import abc
+import datetime
+import json
+import os
+import smtplib
+import threading
+import time
+import urllib.request
+import uuid
+from email.message import EmailMessage
+
+from sms_core import send_notification
+from sms_metrics import REGISTRY
+
+SINK_DELIVERIES = REGISTRY.counter('sms_sink_deliveries_total', "싱크로 전송에 성공한 알림 수 (sink=이름)")
+SINK_FAILURES = REGISTRY.counter('sms_sink_failures_total', "싱크 전송 실패 횟수 (배치 단위)")
+
+# 실패한 배치를 다시 보내기까지 기다리는 시간(초). 마지막 값까지 실패하면 버림
+RETRY_DELAYS = (5, 30, 120, 600, 1800)
+
+
+class AlertSink(abc.ABC):
+    """알림 싱크의 공통 인터페이스. deliver()가 예외 없이 끝나면 배치 전체를 보낸 것으로 봅니다."""
+
+    name = 'sink'
+
+    @abc.abstractmethod
+    def deliver(self, notifications):
+        """notifications: [{'id', 'title', 'message', 'created'}] (created는 ISO 형식 문자열)"""
+
+
+class DesktopSink(AlertSink):
+
+    name = 'desktop'
+
+    def deliver(self, notifications):
+        for n in notifications:
+            send_notification(n['title'], n['message'])
+
+
+class JsonlSink(AlertSink):
+
+    def __init__(self, path):
+        self.path = os.path.expanduser(path)
+        self.name = f"jsonl:{self.path}"
+
+    def deliver(self, notifications):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            for n in notifications:
+                f.write(json.dumps(n, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class WebhookSink(AlertSink):
+
+    def __init__(self, url, headers=None, timeout=10):
+        self.url = url
+        self.headers = dict(headers or {})
+        self.timeout = timeout
+        self.name = f"webhook:{url}"
+
+    def deliver(self, notifications):
+        body = json.dumps({'notifications': notifications}, ensure_ascii=False).encode('utf-8')
+        request = urllib.request.Request(self.url, data=body, method='POST',
+                                         headers=dict({'Content-Type': 'application/json; charset=utf-8'}, **self.headers))
+        # 2xx가 아니면 urlopen이 HTTPError를 던지므로 재시도 대상이 됨
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+class SmtpSink(AlertSink):
+
+    def __init__(self, host, port, sender, recipients, username=None, password=None, starttls=False, timeout=10):
+        self.host = host
+        self.port = int(port)
+        self.sender = sender
+        self.recipients = [recipients] if isinstance(recipients, str) else list(recipients)
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self.name = f"smtp:{host}:{port}"
+
+    def build_message(self, notifications):
+        """배치 하나를 이메일 한 통으로 만듭니다."""
+        message = EmailMessage()
+        message['From'] = self.sender
+        message['To'] = ", ".join(self.recipients)
+        if len(notifications) == 1:
+            message['Subject'] = notifications[0]['title']
+        else:
+            message['Subject'] = f"주식 가격 알림 {len(notifications)}건"
+        message.set_content("\n\n".join(f"[{n['created']}] {n['title']}\n{n['message']}" for n in notifications))
+        return message
+
+    def deliver(self, notifications):
+        with smtplib.SMTP(self.host, self.port, timeout=self.timeout) as smtp:
+            if self.starttls:
+                smtp.starttls()
+            if self.username:
+                smtp.login(self.username, self.password)
+            smtp.send_message(self.build_message(notifications))
+
+
+SINK_TYPES = {
+    'desktop': lambda options: DesktopSink(),
+    'jsonl': lambda options: JsonlSink(options['path']),
+    'webhook': lambda options: WebhookSink(options['url'], options.get('headers'), options.get('timeout', 10)),
+    'smtp': lambda options: SmtpSink(options['host'], options.get('port', 25), options['sender'], options['recipients'],
+                                     options.get('username'), options.get('password'), options.get('starttls', False),
+                                     options.get('timeout', 10)),
+}
+
+
+def build_sinks(sink_configs):
+    """설정 목록 [{'type': ..., ...}]으로 싱크 목록을 만듭니다. 알 수 없는 종류는 ValueError"""
+    sinks = []
+    for options in sink_configs:
+        kind = options.get('type')
+        if kind not in SINK_TYPES:
+            raise ValueError(f"지원하지 않는 알림 싱크: {kind}")
+        sinks.append(SINK_TYPES[kind](options))
+    return sinks
+
+
+class AlertOutbox:
+
+    def __init__(self, sinks, path=None, max_batch=20, retry_delays=RETRY_DELAYS, log=None):
+        """
+        sinks: AlertSink 목록
+        path: 발신함 파일 경로 (None이면 메모리에만 보관)
+        """
+        self.sinks = {sink.name: sink for sink in sinks}
+        self.path = os.path.expanduser(path) if path else None
+        self.max_batch = max_batch
+        self.retry_delays = tuple(retry_delays)
+        self.log = log
+        self._cond = threading.Condition()
+        # 싱크 이름 -> [{'notification', 'attempts', 'next_try'}] (오래된 순)
+        self._pending = {name: [] for name in self.sinks}
+        self._threads = []
+        self._stopping = False
+        self._load()
+
+    # ------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------
+    def submit(self, title, message):
+        """알림 하나를 모든 싱크의 발신함에 넣고 바로 반환합니다. (NotificationDispatcher의 send로 사용)"""
+        notification = {
+            'id': uuid.uuid4().hex,
+            'title': title,
+            'message': message,
+            'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        }
+        with self._cond:
+            for entries in self._pending.values():
+                entries.append({'notification': notification, 'attempts': 0, 'next_try': 0})
+            self._save()
+            self._cond.notify_all()
+        return notification
+
+    def start(self):
+        """싱크마다 발송 스레드를 시작합니다. 발송 스레드가 아직 살아 있으면 아무것도 하지 않습니다."""
+        with self._cond:
+            if any(thread.is_alive() for thread in self._threads):
+                return
+            self._stopping = False
+            self._threads = [threading.Thread(target=self._run, args=(name,), name=f"AlertSink-{name}", daemon=True)
+                             for name in self.sinks]
+            for thread in self._threads:
+                thread.start()
+
+    def stop(self, timeout=5):
+        """발송 스레드를 멈춥니다. 보내지 못한 알림은 발신함 파일에 남아 다음 실행 때 보냅니다."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        # 전송 중이라 아직 끝나지 않은 스레드는 남겨 두어, 그동안 start()가 발송 스레드를 겹쳐 띄우지 않도록 함
+        self._threads = [thread for thread in self._threads if thread.is_alive()]
+
+    def pending_count(self):
+        with self._cond:
+            return sum(len(entries) for entries in self._pending.values())
+
+    def flush(self, timeout=10):
+        """지금 보낼 수 있는 알림이 모두 처리될 때까지 기다립니다. (재시도 대기 중인 것은 제외) 모두 끝났으면 True"""
+        deadline = time.time() + timeout
+        with self._cond:
+            while any(e['next_try'] <= time.time() for entries in self._pending.values() for e in entries):
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(min(remaining, 0.1))
+        return True
+
+    # ------------------------------------------------------------------
+    # 발송 스레드 (싱크마다 하나)
+    # ------------------------------------------------------------------
+    def _run(self, name):
+        sink = self.sinks[name]
+        while True:
+            with self._cond:
+                while True:
+                    if self._stopping:
+                        return
+                    entries = self._pending[name]
+                    now = time.time()
+                    batch = [e for e in entries if e['next_try'] <= now][:self.max_batch]
+                    if batch:
+                        break
+                    next_try = min((e['next_try'] for e in entries), default=None)
+                    self._cond.wait(None if next_try is None else max(next_try - now, 0.05))
+
+            try:
+                sink.deliver([e['notification'] for e in batch])
+                failed = None
+            except Exception as e:
+                failed = e
+
+            if failed is None:
+                SINK_DELIVERIES.inc(len(batch), sink=name)
+            else:
+                SINK_FAILURES.inc(sink=name)
+            with self._cond:
+                entries = self._pending[name]
+                if failed is None:
+                    delivered = {id(e) for e in batch}
+                    self._pending[name] = [e for e in entries if id(e) not in delivered]
+                else:
+                    self._retry_later(name, batch, failed)
+                self._save()
+                self._cond.notify_all()
+
+    def _retry_later(self, name, batch, error):
+        dropped = []
+        for entry in batch:
+            entry['attempts'] += 1
+            if entry['attempts'] > len(self.retry_delays):
+                dropped.append(entry)
+            else:
+                entry['next_try'] = time.time() + self.retry_delays[entry['attempts'] - 1]
+        if dropped:
+            ids = {id(e) for e in dropped}
+            self._pending[name] = [e for e in self._pending[name] if id(e) not in ids]
+            self._write_log("ERROR", f"알림 싱크 '{name}' 전송을 {len(dropped)}건 포기합니다: {error}")
+        else:
+            self._write_log("WARNING", f"알림 싱크 '{name}' 전송 실패, 다시 시도합니다. ({len(batch)}건): {error}")
+
+    # ------------------------------------------------------------------
+    # 발신함 파일
+    # ------------------------------------------------------------------
+    def _save(self):
+        """발신함을 파일에 저장합니다. (잠금을 잡은 상태에서 호출, 임시 파일에 쓴 뒤 교체)"""
+        if not self.path:
+            return
+        tmp_path = self.path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._pending, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self._write_log("WARNING", f"알림 발신함 저장 실패: {e}")
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError) as e:
+            self._write_log("WARNING", f"알림 발신함을 읽지 못했습니다: {e}")
+            return
+        # 설정에서 빠진 싱크의 알림은 버림
+        for name, entries in stored.items():
+            if name in self._pending:
+                self._pending[name] = entries
+        count = sum(len(entries) for entries in self._pending.values())
+        if count:
+            self._write_log("INFO", f"알림 발신함에서 보내지 못한 알림 {count}건을 불러왔습니다.")
+
+    def _write_log(self, level, message):
+        if self.log:
+            self.log(level, message)
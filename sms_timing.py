@@ -0,0 +1,67 @@
+# ====================================================================
+# 시작 시간 측정
+# ====================================================================
+# PyInstaller 단일 파일 빌드에서는 import 하나하나가 실행 시간에 더해지므로,
+# 무거운 모듈(matplotlib, requests, bs4, plyer)은 처음 쓰는 함수 안에서 importing()과 함께 불러오고
+# 그 시간을 기록합니다. import 문 자체는 그대로 두어야 PyInstaller가 모듈을 찾아 묶을 수 있습니다.
+# - mark(): 프로세스 시작 후 특정 시점(모듈 로드 완료, 첫 화면 표시 등)까지 걸린 시간을 기록합니다.
+# - timed(): 구간 하나의 소요 시간을 기록합니다.
+# - report(): 기록된 시간을 표 형태의 문자열로 반환합니다. (`--startup-report` 옵션)
+
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+PROCESS_START = time.perf_counter()
+
+_lock = threading.Lock()
+_records = []  # (구분, 이름, 초, 스레드 이름)
+
+
+def record(kind, name, seconds):
+    with _lock:
+        _records.append((kind, name, seconds, threading.current_thread().name))
+
+
+def mark(name):
+    """프로세스 시작부터 지금까지의 경과 시간을 기록합니다."""
+    record('mark', name, time.perf_counter() - PROCESS_START)
+
+
+@contextmanager
+def timed(name, kind='step'):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(kind, name, time.perf_counter() - started)
+
+
+@contextmanager
+def importing(*module_names):
+    """
+    함수 안의 지연 import를 감싸, 처음 불러올 때만 걸린 시간을 기록합니다.
+        with importing('requests', 'bs4'):
+            import requests
+            from bs4 import BeautifulSoup
+    """
+    if all(name in sys.modules for name in module_names):
+        yield
+        return
+    with timed(", ".join(module_names), kind='import'):
+        yield
+
+
+def records():
+    with _lock:
+        return list(_records)
+
+
+def report():
+    """기록된 시간을 사람이 읽기 쉬운 문자열로 반환합니다."""
+    lines = ["시작 시간 보고서 (ms)"]
+    for kind, name, seconds, thread_name in records():
+        label = {'mark': '시점', 'import': 'import', 'step': '구간'}.get(kind, kind)
+        lines.append(f"  [{label:6}] {name:<32} {seconds * 1000:9.1f}  ({thread_name})")
+    return "\n".join(lines)
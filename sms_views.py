@@ -0,0 +1,125 @@
+# ====================================================================
+# 기간별 차트 데이터 캐시
+# ====================================================================
+# 기간 버튼을 누를 때마다 CSV를 다시 읽고 윈도우를 계산하던 것을 없애기 위해,
+# 설정된 모든 기간(과 전체 기간)의 차트 데이터를 미리 준비해 둡니다.
+# - 캐시는 (종목 코드, 데이터 버전) 단위로 유지되며, 데이터 버전은 CSV 파일의 경로, 수정 시각, 크기입니다.
+#   파일이 바뀌면 버전이 달라지므로 오래된 데이터를 보여주지 않습니다.
+# - 업데이트 직후 작업자 스레드에서 rebuild()를 호출해 두면, 기간 전환은 캐시 조회만으로 끝납니다.
+# - 분석 기간 설정만 바뀐 경우에는 CSV를 다시 읽지 않고 저장된 시계열로 기간 윈도우만 다시 계산합니다.
+
+import threading
+
+from sms_alerts import compute_window_stats
+from sms_calendar import SeriesDateIndex
+from sms_core import data_version, get_historical_prices_from_csv
+from sms_metrics import ANALYSIS_SECONDS, REGISTRY, timed
+
+CACHE_LOOKUPS = REGISTRY.counter('sms_chart_cache_lookups_total', "차트 데이터 캐시 조회 수 (result=hit|miss)")
+
+
+def cache_hit_ratio():
+    hits = CACHE_LOOKUPS.value(result='hit')
+    total = hits + CACHE_LOOKUPS.value(result='miss')
+    return hits / total if total else None
+
+
+REGISTRY.gauge('sms_chart_cache_hit_ratio', "차트 데이터 캐시 적중률").set_function(cache_hit_ratio)
+
+
+def build_period_views(data, periods, x_converter=None, xs=None):
+    """
+    기간별 차트 데이터를 만듭니다.
+    반환값: {'last': 마지막 행, 'window_stats': {기간: (최고가, 최저가)},
+            'views': {기간 또는 None(전체): {'period', 'timestamps', 'prices', 'opens', 'highs', 'lows', 'volumes', 'xs'}}}
+    데이터가 기간보다 짧으면 그 기간의 뷰는 전체 기간 뷰와 같고 'period'가 None입니다.
+    xs를 넘기면 x좌표를 다시 변환하지 않고 그대로 사용합니다.
+    """
+    if not data:
+        return {'last': None, 'window_stats': {}, 'views': {}}
+
+    columns = {
+        'timestamps': [d['timestamp'] for d in data],
+        'prices': [d['price'] for d in data],
+        'opens': [d['open'] for d in data],
+        'highs': [d['high'] for d in data],
+        'lows': [d['low'] for d in data],
+        'volumes': [d['volume'] for d in data],
+    }
+    timestamps = columns['timestamps']
+    if xs is None and x_converter:
+        xs = x_converter(timestamps)
+    window_starts = SeriesDateIndex(timestamps).window_starts(periods)
+
+    full = dict(columns, period=None, xs=xs)
+    views = {None: full}
+    for period in periods:
+        start = window_starts.get(period)
+        if start is None:
+            views[period] = full
+        else:
+            views[period] = {name: values[start:] for name, values in columns.items()}
+            views[period]['period'] = period
+            views[period]['xs'] = xs[start:] if xs is not None else None
+    return {
+        'last': data[-1],
+        'window_stats': compute_window_stats(columns['prices'], periods, window_starts, columns['highs'], columns['lows']),
+        'views': views,
+    }
+
+
+class ChartViewCache:
+
+    def __init__(self, x_converter=None):
+        # x_converter: 타임스탬프 목록을 차트 x좌표 목록으로 바꾸는 함수 (변환까지 미리 해 둠)
+        self.x_converter = x_converter
+        self._lock = threading.Lock()
+        self._entries = {}  # 종목 코드 -> (데이터 버전, 기간 튜플, 준비된 데이터, 원본 데이터)
+
+    def get(self, stock_code, version, periods):
+        """
+        데이터 버전이 일치하는 준비된 데이터를 반환합니다. 없으면 None
+        기간 설정만 다르면 저장된 시계열로 기간 윈도우만 다시 계산합니다.
+        """
+        periods = tuple(sorted(periods))
+        with self._lock:
+            entry = self._entries.get(stock_code)
+        # 파일이 없으면 버전이 None이며, 이때는 '데이터 없음' 상태가 그대로 캐시됨
+        if entry is None or entry[0] != version:
+            CACHE_LOOKUPS.inc(result='miss')
+            return None
+        CACHE_LOOKUPS.inc(result='hit')
+        if entry[1] == periods:
+            return entry[2]
+
+        data = entry[3]
+        prepared = build_period_views(data, periods, xs=entry[2]['views'][None]['xs'] if data else None)
+        with self._lock:
+            if self._entries.get(stock_code) is entry:
+                self._entries[stock_code] = (version, periods, prepared, data)
+        return prepared
+
+    def rebuild(self, stock_code, file_path, periods):
+        """CSV를 읽어 모든 기간의 차트 데이터를 다시 준비하고 반환합니다. (어느 스레드에서나 호출 가능)"""
+        # 읽기 전에 버전을 잡아 두어, 읽는 동안 파일이 바뀌면 다음 조회에서 다시 만들도록 함
+        version = data_version(file_path)
+        periods = tuple(sorted(periods))
+        data = get_historical_prices_from_csv(file_path)
+        with timed(ANALYSIS_SECONDS, kind='chart_views'):
+            prepared = build_period_views(data, periods, self.x_converter)
+        with self._lock:
+            self._entries[stock_code] = (version, periods, prepared, data)
+        return prepared
+
+    def get_or_build(self, stock_code, file_path, periods):
+        prepared = self.get(stock_code, data_version(file_path), periods)
+        if prepared is None:
+            prepared = self.rebuild(stock_code, file_path, periods)
+        return prepared
+
+    def invalidate(self, stock_code=None):
+        with self._lock:
+            if stock_code is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(stock_code, None)
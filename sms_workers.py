@@ -0,0 +1,100 @@
+# ====================================================================
+# 업데이트 작업자 풀 (단일 실행 병합)
+# ====================================================================
+# 업데이트 요청마다 새 스레드를 만들던 방식을 대체합니다.
+# - 스레드 수는 max_workers로 고정되고, 대기열은 max_queue로 제한됩니다.
+# - 같은 종목(key)의 업데이트가 이미 대기 중이거나 실행 중이면 새 작업을 만들지 않고
+#   진행 중인 작업의 Future를 그대로 돌려줍니다. (single-flight)
+# - 따라서 업스트림이 느려져도 스레드 수와 대기열 길이는 일정하게 유지되며,
+#   같은 종목의 업데이트가 겹치지 않습니다.
+# - 초기 로드처럼 다른 key로 등록된 작업과의 CSV 동시 쓰기는 sms_core.csv_lock()이 막습니다.
+
+import queue
+import threading
+from concurrent.futures import Future
+
+
+class UpdateWorkerPool:
+
+    def __init__(self, max_workers=2, max_queue=8, log=None, name='UpdateWorker'):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._log = log
+        self._name = name
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._threads = []
+        self._shutdown = False
+
+    def submit(self, key, fn, *args, **kwargs):
+        """
+        key 단위로 작업을 등록하고 Future를 반환합니다.
+        같은 key의 작업이 진행 중이면 그 Future를, 대기열이 가득 차면 None을 반환합니다.
+        """
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("작업자 풀이 종료되었습니다.")
+            future = self._inflight.get(key)
+            if future is not None:
+                self._write_log("INFO", f"'{key}' 업데이트가 이미 진행 중이므로 기존 작업에 합류합니다.")
+                return future
+
+            future = Future()
+            try:
+                self._queue.put_nowait((key, future, fn, args, kwargs))
+            except queue.Full:
+                self._write_log("WARNING", f"업데이트 대기열이 가득 차 '{key}' 요청을 건너뜁니다. (최대 {self.max_queue}개)")
+                return None
+            self._inflight[key] = future
+            if len(self._threads) < self.max_workers:
+                thread = threading.Thread(target=self._worker, name=f"{self._name}-{len(self._threads) + 1}", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+            return future
+
+    def _worker(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            key, future, fn, args, kwargs = item
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(fn(*args, **kwargs))
+                    except BaseException as e:
+                        future.set_exception(e)
+                        self._write_log("ERROR", f"'{key}' 업데이트 작업 실패: {e}")
+            finally:
+                with self._lock:
+                    if self._inflight.get(key) is future:
+                        del self._inflight[key]
+                self._queue.task_done()
+
+    def _write_log(self, level, message):
+        if self._log:
+            self._log(level, message)
+
+    def queue_depth(self):
+        """실행을 기다리는 작업 수"""
+        return self._queue.qsize()
+
+    def thread_count(self):
+        return len(self._threads)
+
+    def inflight_keys(self):
+        """대기 중이거나 실행 중인 작업의 key 목록"""
+        with self._lock:
+            return list(self._inflight)
+
+    def shutdown(self, wait=False):
+        """새 작업 등록을 막고, 대기열의 작업이 끝나면 작업 스레드를 종료합니다."""
+        with self._lock:
+            self._shutdown = True
+            threads = list(self._threads)
+        for _ in threads:
+            self._queue.put(None)
+        if wait:
+            for thread in threads:
+                thread.join()
@@ -0,0 +1,7 @@
+# 테스트에서 저장소 최상위의 sms_* 모듈과 benchmarks/ 도우미를 가져올 수 있도록 경로를 추가합니다.
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
@@ -0,0 +1,70 @@
+# ====================================================================
+# sms_alerts 테스트: 기간별 최고가/최저가를 단순 구현과 비교
+# ====================================================================
+
+import random
+
+import pytest
+
+from sms_alerts import compile_alert_plan, compute_window_stats, pct_from_max, pct_from_min
+
+
+def naive_window_stats(prices, periods, window_starts=None, highs=None, lows=None):
+    highs = prices if highs is None else highs
+    lows = prices if lows is None else lows
+    stats = {}
+    for period in periods:
+        if window_starts is None:
+            start = len(prices) - period
+        elif period in window_starts:
+            start = window_starts[period]
+        else:
+            continue
+        if 0 <= start < len(prices):
+            stats[period] = (max(highs[start:]), min(lows[start:]))
+    return stats
+
+
+def random_series(count, seed):
+    rng = random.Random(seed)
+    prices, highs, lows = [], [], []
+    price = 10000
+    for _ in range(count):
+        price = max(100, price + rng.randint(-300, 300))
+        prices.append(price)
+        highs.append(price + rng.randint(0, 200))
+        lows.append(price - rng.randint(0, 200))
+    return prices, highs, lows
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_compute_window_stats_matches_naive_row_windows(seed):
+    prices, _, _ = random_series(300, seed)
+    periods = [1, 2, 5, 20, 20, 120, 300, 301]
+    assert compute_window_stats(prices, periods) == naive_window_stats(prices, periods)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_compute_window_stats_matches_naive_with_starts_and_highs_lows(seed):
+    prices, highs, lows = random_series(500, seed)
+    rng = random.Random(seed)
+    periods = [3, 10, 60, 250, 400]
+    window_starts = {period: rng.randrange(len(prices)) for period in periods[:-1]} # 400일은 데이터 부족
+    expected = naive_window_stats(prices, periods, window_starts, highs, lows)
+    assert compute_window_stats(prices, periods, window_starts, highs, lows) == expected
+    assert set(expected) == set(periods[:-1])
+
+
+def test_compute_window_stats_empty_input():
+    assert compute_window_stats([], [5]) == {}
+    assert compute_window_stats([100, 200], []) == {}
+
+
+def test_alert_plan_uses_window_extremes():
+    plan = compile_alert_plan([(3, 5.0, 5.0)])
+    prices = [100, 120, 110, 116]
+    alerts = plan.evaluate(prices, prices[-1])
+    # 3일 최고가 120 대비 3.33% 하락 → 최고가 근접 알림, 최저가 110 대비 5.45% 상승 → 알림 없음
+    assert [(a['kind'], a['ref_price']) for a in alerts] == [('max', 120)]
+    assert alerts[0]['pct'] == pytest.approx(pct_from_max(116, 120))
+    assert pct_from_min(116, 110) > 5.0
@@ -0,0 +1,68 @@
+# ====================================================================
+# sms_calendar 테스트: 휴장일을 건너뛰는 거래일 윈도우와 날짜 인덱스
+# ====================================================================
+
+import datetime
+
+import pytest
+
+from sms_calendar import KRX_CALENDAR, SeriesDateIndex, TradingCalendar
+
+D = datetime.date
+
+
+def daily_index(start, end, calendar=KRX_CALENDAR):
+    return SeriesDateIndex(calendar.trading_days_between(start, end), calendar)
+
+
+def test_window_start_date_skips_chuseok():
+    # 2024-09-16~18 추석 연휴: 9/23(월)부터 거슬러 5거래일은 9/23, 9/20, 9/19, 9/13, 9/12
+    assert KRX_CALENDAR.window_start_date(D(2024, 9, 23), 5) == D(2024, 9, 12)
+    assert KRX_CALENDAR.window_start_date(D(2024, 9, 23), 1) == D(2024, 9, 23)
+    # 휴장일을 끝으로 하면 그 전 거래일부터 셈
+    assert KRX_CALENDAR.window_start_date(D(2024, 9, 17), 1) == D(2024, 9, 13)
+
+
+def test_window_start_across_new_year_holidays():
+    # 2024-12-31 연말 휴장, 2025-01-01 신정
+    index = daily_index(D(2024, 12, 20), D(2025, 1, 3))
+    start = index.window_start(3)
+    assert index.ordinals[start] == D(2024, 12, 30).toordinal()
+
+
+def test_window_start_with_intraday_rows_counts_days():
+    stamps = [datetime.datetime.combine(day, datetime.time(hour, 0))
+              for day in KRX_CALENDAR.trading_days_between(D(2024, 9, 10), D(2024, 9, 23)) for hour in (9, 12, 15)]
+    index = SeriesDateIndex(stamps)
+    start = index.window_start(5)
+    assert stamps[start] == datetime.datetime(2024, 9, 12, 9, 0)
+    assert index.window_start(100) is None # 데이터가 구간 첫날까지 거슬러 올라가지 못함
+    assert index.window_starts([5, 100]) == {5: start}
+
+
+def test_row_window_starts_matches_window_start_per_row():
+    stamps = [datetime.datetime.combine(day, datetime.time(hour, 0))
+              for day in KRX_CALENDAR.trading_days_between(D(2024, 9, 2), D(2024, 10, 11)) for hour in (9, 15)]
+    full = SeriesDateIndex(stamps)
+    for period in (1, 3, 10):
+        starts = full.row_window_starts(period)
+        for row in range(len(stamps)):
+            assert starts[row] == SeriesDateIndex(stamps[:row + 1]).window_start(period)
+
+
+def test_append_rejects_out_of_order_rows():
+    index = SeriesDateIndex([D(2024, 9, 12), D(2024, 9, 13)])
+    with pytest.raises(ValueError):
+        index.append(D(2024, 9, 11))
+    with pytest.raises(ValueError):
+        index.replace_last(D(2024, 9, 11))
+    assert index.ordinals == [D(2024, 9, 12).toordinal(), D(2024, 9, 13).toordinal()]
+
+
+def test_fixed_holidays_outside_table():
+    calendar = TradingCalendar(holidays=('2024-01-01',))
+    assert not calendar.is_trading_day(D(2030, 1, 1))
+    assert not calendar.is_trading_day(D(2030, 3, 1))
+    assert not calendar.is_trading_day(D(2030, 12, 31))
+    assert calendar.is_trading_day(D(2030, 1, 2))
+    assert calendar.window_start_date(D(2030, 1, 2), 2) == D(2029, 12, 28)
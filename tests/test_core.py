@@ -0,0 +1,37 @@
+# ====================================================================
+# sms_core 테스트: 놓친 알림 시각 찾기
+# ====================================================================
+
+import datetime
+
+from sms_core import find_missed_slots
+
+DT = datetime.datetime
+TIMES = ['09:00', '12:00', '15:30']
+
+
+def test_find_missed_slots_skips_weekend():
+    missed = find_missed_slots(TIMES, DT(2026, 10, 14, 15, 30), DT(2026, 10, 19, 10, 0))
+    assert missed == [DT(2026, 10, 15, 9, 0), DT(2026, 10, 15, 12, 0), DT(2026, 10, 15, 15, 30),
+                      DT(2026, 10, 16, 9, 0), DT(2026, 10, 16, 12, 0), DT(2026, 10, 16, 15, 30),
+                      DT(2026, 10, 19, 9, 0)]
+
+
+def test_find_missed_slots_skips_holiday():
+    # 2026-10-09 한글날, 10-10~11 주말
+    missed = find_missed_slots(TIMES, DT(2026, 10, 8, 12, 0), DT(2026, 10, 12, 9, 30))
+    assert missed == [DT(2026, 10, 8, 15, 30), DT(2026, 10, 12, 9, 0)]
+
+
+def test_find_missed_slots_treats_daily_row_as_complete_day():
+    # 00:00 행은 그날의 종가이므로 그날의 알림 시각은 모두 반영된 것으로 봄
+    assert find_missed_slots(TIMES, DT(2026, 10, 15, 0, 0), DT(2026, 10, 16, 10, 0)) == [DT(2026, 10, 16, 9, 0)]
+    # 오늘 날짜의 00:00 행은 아직 장중이 아니므로 그대로 비교
+    assert find_missed_slots(TIMES, DT(2026, 10, 16, 0, 0), DT(2026, 10, 16, 9, 0)) == [DT(2026, 10, 16, 9, 0)]
+
+
+def test_find_missed_slots_boundaries_and_invalid_times():
+    assert find_missed_slots(['09:00', 'bad', ' 12:00 '], DT(2026, 10, 16, 9, 0), DT(2026, 10, 16, 12, 0)) == \
+        [DT(2026, 10, 16, 12, 0)]
+    assert find_missed_slots(TIMES, DT(2026, 10, 16, 12, 0), DT(2026, 10, 16, 12, 0)) == []
+    assert find_missed_slots([], DT(2026, 10, 1, 9, 0), DT(2026, 10, 16, 12, 0)) == []
@@ -0,0 +1,106 @@
+# ====================================================================
+# sms_notify 테스트: 에지 트리거, 히스테리시스, 쿨다운, 요약 묶음
+# ====================================================================
+
+import pytest
+
+from sms_alerts import compile_alert_plan, pct_from_max, pct_from_min
+from sms_notify import NotificationDispatcher, build_notifications
+
+# 20일 최고가 대비 2% 이내, 최저가 대비 3% 이내에서 알림
+PLAN = compile_alert_plan([(20, 2.0, 3.0)])
+HIGH, LOW = 10000, 8000
+
+
+class ManualClock:
+
+    def __init__(self):
+        self.value = 0.0
+
+    def __call__(self):
+        return self.value
+
+
+def make_result(price, stock_code='005930'):
+    stats = {20: (HIGH, LOW)}
+    return {
+        'stock_code': stock_code,
+        'company_name': '삼성전자',
+        'price': price,
+        'alerts': PLAN.evaluate([price], price, stats=stats),
+        'alert_levels': {20: (pct_from_max(price, HIGH), pct_from_min(price, LOW))},
+    }
+
+
+@pytest.fixture
+def dispatcher():
+    clock = ManualClock()
+    sent = []
+    dispatcher = NotificationDispatcher(lambda title, message: sent.append((title, message)),
+                                        cooldown=600, hysteresis=1.0, digest_window=0, clock=clock)
+    dispatcher.sent = sent
+    yield dispatcher
+    dispatcher.stop()
+
+
+def kinds(alerts):
+    return [alert['kind'] for alert in alerts]
+
+
+def test_alert_fires_only_on_edge(dispatcher):
+    assert kinds(dispatcher.submit(make_result(9900), PLAN)) == ['max'] # 1% 하락: 발동
+    assert dispatcher.submit(make_result(9850), PLAN) == []             # 계속 발동 중: 다시 알리지 않음
+    assert dispatcher.submit(make_result(9900), PLAN) == []
+
+
+def test_rearm_requires_hysteresis(dispatcher):
+    clock = dispatcher.clock
+    assert kinds(dispatcher.submit(make_result(9900), PLAN)) == ['max']
+    clock.value += 3600
+    # 2.5% 하락: 임계값(2%)은 벗어났지만 히스테리시스(1%p) 안이라 무장되지 않음
+    assert dispatcher.submit(make_result(9750), PLAN) == []
+    assert dispatcher.submit(make_result(9900), PLAN) == []
+    # 3.5% 하락: 다시 무장된 뒤 근접하면 알림
+    assert dispatcher.submit(make_result(9650), PLAN) == []
+    assert kinds(dispatcher.submit(make_result(9900), PLAN)) == ['max']
+
+
+def test_cooldown_blocks_quick_refire(dispatcher):
+    clock = dispatcher.clock
+    assert kinds(dispatcher.submit(make_result(9900), PLAN)) == ['max']
+    clock.value += 60
+    assert dispatcher.submit(make_result(9500), PLAN) == [] # 무장 해제
+    assert dispatcher.submit(make_result(9900), PLAN) == [] # 쿨다운(600초) 안
+    clock.value += 600
+    assert dispatcher.submit(make_result(9500), PLAN) == []
+    assert kinds(dispatcher.submit(make_result(9900), PLAN)) == ['max']
+
+
+def test_max_and_min_conditions_are_tracked_separately(dispatcher):
+    # 최저가 8000 대비 2.5% 상승: 최저가 근접 알림만
+    assert kinds(dispatcher.submit(make_result(8200), PLAN)) == ['min']
+    assert kinds(dispatcher.submit(make_result(9900), PLAN)) == ['max']
+    # 다른 종목은 상태를 따로 가짐
+    assert kinds(dispatcher.submit(make_result(9900, stock_code='000660'), PLAN)) == ['max']
+
+
+def test_reset_clears_state(dispatcher):
+    assert kinds(dispatcher.submit(make_result(9900), PLAN)) == ['max']
+    dispatcher.reset('005930')
+    assert kinds(dispatcher.submit(make_result(9900), PLAN)) == ['max']
+
+
+def test_notifications_are_delivered_on_sender_thread(dispatcher):
+    dispatcher.submit(make_result(9900), PLAN)
+    dispatcher.stop()
+    assert len(dispatcher.sent) == 1
+    assert dispatcher.sent[0][0] == "주식 가격 알림 - 삼성전자 (005930)"
+
+
+def test_build_notifications_digests_multiple_tickers():
+    alert = make_result(9900)['alerts']
+    notifications = build_notifications([('005930', '삼성전자', alert), ('000660', 'SK하이닉스', alert)])
+    assert len(notifications) == 1
+    title, message = notifications[0]
+    assert title == "주식 가격 알림 - 2개 종목"
+    assert message.splitlines()[0].startswith("삼성전자 (005930): 20일 최고가 대비 1.00%")
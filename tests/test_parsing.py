@@ -0,0 +1,42 @@
+# ====================================================================
+# 네이버 금융 페이지 해석 테스트 (benchmarks/fixtures의 페이지 사본 사용)
+# ====================================================================
+
+import datetime
+import os
+
+import pytest
+
+pytest.importorskip('bs4')
+
+from sms_core import make_row, parse_history_page, parse_quote_html, parse_quote_page
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks', 'fixtures')
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES, name), 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def test_parse_quote_page():
+    price, name, day = parse_quote_page(read_fixture('naver_item_main.html'))
+    assert (price, name) == (79600, '삼성전자')
+    assert day == {'open': 79700, 'high': 80100, 'low': 79000, 'volume': 15023553}
+    assert parse_quote_html(read_fixture('naver_item_main.html')) == (79600, '삼성전자')
+
+
+def test_parse_quote_page_without_quote_table():
+    assert parse_quote_page("<html><body></body></html>") == (None, "Unknown", None)
+
+
+def test_parse_history_page():
+    rows, oldest = parse_history_page(read_fixture('naver_sise_day.html'))
+    assert len(rows) == 10
+    assert oldest == datetime.date(2024, 6, 3)
+    assert rows[0] == make_row('2024-06-14 00:00', 79600, 79100, 80600, 78800, 18205640)
+    assert rows[-1] == make_row('2024-06-03 00:00', 81300, 81200, 81700, 81000, 10216044)
+    # 최신 날짜부터 내림차순, 모든 행은 00:00
+    assert [r['timestamp'] for r in rows] == sorted((r['timestamp'] for r in rows), reverse=True)
+    assert all(r['timestamp'].endswith(' 00:00') for r in rows)
+    assert all(r['low'] <= r['price'] <= r['high'] for r in rows)
@@ -0,0 +1,97 @@
+# ====================================================================
+# sms_ringbuffer 테스트: 읽기/쓰기, 뒤처진 독자, 찢어진 읽기(torn read) 거부
+# ====================================================================
+
+import datetime
+import struct
+
+import pytest
+
+import sms_ringbuffer
+from sms_ringbuffer import QuoteRingBuffer
+
+TS = datetime.datetime(2026, 10, 19, 10, 0)
+
+
+@pytest.fixture
+def ring():
+    ring = QuoteRingBuffer.create(capacity=4, max_periods=2)
+    yield ring
+    ring.close()
+
+
+def test_reader_sees_published_records(ring):
+    reader = QuoteRingBuffer.attach(ring.name)
+    try:
+        ring.publish('005930', TS, 79600, {20: (81000, 77000), 5: (80000, 79000), 120: (90000, 60000)})
+        records, next_seq = reader.read_since(0)
+    finally:
+        reader.close()
+    assert next_seq == 1
+    assert len(records) == 1
+    record = records[0]
+    assert (record['stock_code'], record['timestamp'], record['price']) == ('005930', TS, 79600)
+    assert record['stats'] == {5: (80000, 79000), 20: (81000, 77000)} # max_periods개까지만
+
+
+def test_lagging_reader_skips_overwritten_records(ring):
+    for i in range(6):
+        ring.publish('005930', TS, 1000 + i)
+    records, next_seq = ring.read_since(0)
+    assert next_seq == 6
+    assert [r['seq'] for r in records] == [2, 3, 4, 5]
+    assert ring.read_since(next_seq) == ([], 6)
+
+
+def test_slot_being_written_is_rejected(ring):
+    ring.publish('005930', TS, 1000)
+    ring.publish('005930', TS, 1001)
+    # 두 번째 슬롯을 쓰는 중(홀수 시퀀스)으로 되돌림
+    offset = ring._slot_offset(1)
+    struct.pack_into('<Q', ring._block.buf, offset, 2 * 1 + 1)
+    records, next_seq = ring.read_since(0)
+    assert [r['seq'] for r in records] == [0]
+    assert next_seq == 2
+
+
+def test_slot_overwritten_during_read_is_rejected(ring, monkeypatch):
+    for i in range(4):
+        ring.publish('005930', TS, 1000 + i, {20: (2000, 500)})
+
+    class OverwritingStat:
+        """첫 번째 기간을 읽는 순간 쓰는 쪽이 같은 슬롯을 덮어쓰도록 함"""
+        size = sms_ringbuffer._STAT.size
+
+        def __init__(self, stat):
+            self.stat = stat
+            self.fired = False
+
+        def unpack_from(self, buf, offset):
+            value = self.stat.unpack_from(buf, offset)
+            if not self.fired:
+                self.fired = True
+                ring.publish('000660', TS, 9999, {20: (1, 1)}) # seq 4 → 슬롯 0 덮어씀
+            return value
+
+        def pack_into(self, *args):
+            return self.stat.pack_into(*args)
+
+    monkeypatch.setattr(sms_ringbuffer, '_STAT', OverwritingStat(sms_ringbuffer._STAT))
+    records, next_seq = ring.read_since(0)
+    # 읽는 도중 덮어쓰인 seq 0은 버리고, 나머지는 그대로
+    assert [r['seq'] for r in records] == [1, 2, 3]
+    assert next_seq == 4
+    monkeypatch.undo()
+    records, _ = ring.read_since(4)
+    assert [(r['seq'], r['stock_code']) for r in records] == [(4, '000660')]
+
+
+def test_attach_rejects_foreign_block():
+    from multiprocessing import shared_memory
+    block = shared_memory.SharedMemory(create=True, size=64)
+    try:
+        with pytest.raises(ValueError):
+            QuoteRingBuffer.attach(block.name)
+    finally:
+        block.close()
+        block.unlink()
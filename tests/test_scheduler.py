@@ -0,0 +1,104 @@
+# ====================================================================
+# sms_scheduler 테스트: 시계 점프 감지와 밀린 매일 작업의 중복 제거
+# ====================================================================
+
+import datetime
+import threading
+import time
+
+import sms_scheduler
+from sms_scheduler import TimerScheduler
+
+
+class FakeClock:
+    """datetime.now 대신 쓰는 시계. 테스트가 시각을 직접 옮깁니다."""
+
+    def __init__(self, now):
+        self.value = now
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        with self.lock:
+            return self.value
+
+    def set(self, now):
+        with self.lock:
+            self.value = now
+
+
+class JumpingTime:
+    """sms_scheduler.time 대역: 벽시계(time)만 offset만큼 옮길 수 있고 monotonic은 그대로"""
+
+    def __init__(self):
+        self.offset = 0.0
+
+    def time(self):
+        return time.time() + self.offset
+
+    def monotonic(self):
+        return time.monotonic()
+
+
+def wait_until(predicate, timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_clock_jump_is_reported(monkeypatch):
+    fake_time = JumpingTime()
+    monkeypatch.setattr(sms_scheduler, 'time', fake_time)
+    scheduler = TimerScheduler()
+    scheduler.MAX_SLEEP = 0.05
+    drifts = []
+    scheduler.on_clock_jump = drifts.append
+    scheduler.start()
+    try:
+        time.sleep(0.15)
+        assert drifts == [] # 시계가 그대로면 보고하지 않음
+        fake_time.offset = 3600
+        assert wait_until(lambda: drifts)
+    finally:
+        scheduler.stop()
+    assert 3500 < drifts[0] < 3700
+
+
+def test_missed_daily_slots_run_once_and_rearm():
+    clock = FakeClock(datetime.datetime(2026, 10, 19, 8, 0))
+    scheduler = TimerScheduler(now=clock)
+    calls = []
+    assert scheduler.set_daily_times(['09:00', '12:00', '15:30', 'bad'], lambda: calls.append(clock())) == \
+        ['09:00', '12:00', '15:30']
+    scheduler.start()
+    try:
+        # 절전 복귀: 세 알림 시각이 한꺼번에 지나감
+        clock.set(datetime.datetime(2026, 10, 19, 16, 0))
+        scheduler.cancel('wake') # 대기 중인 스레드를 깨움
+        assert wait_until(lambda: calls)
+        time.sleep(0.1)
+    finally:
+        scheduler.stop()
+    assert len(calls) == 1
+    assert [job.due for job in scheduler.jobs()] == [
+        datetime.datetime(2026, 10, 20, 9, 0), datetime.datetime(2026, 10, 20, 12, 0),
+        datetime.datetime(2026, 10, 20, 15, 30)]
+
+
+def test_one_shot_jobs_are_not_deduplicated():
+    clock = FakeClock(datetime.datetime(2026, 10, 19, 8, 0))
+    scheduler = TimerScheduler(now=clock)
+    calls = []
+    callback = lambda: calls.append(1)
+    scheduler.call_at(datetime.datetime(2026, 10, 19, 8, 30), callback)
+    scheduler.call_at(datetime.datetime(2026, 10, 19, 8, 45), callback)
+    scheduler.start()
+    try:
+        clock.set(datetime.datetime(2026, 10, 19, 9, 0))
+        scheduler.cancel('wake')
+        assert wait_until(lambda: len(calls) == 2)
+    finally:
+        scheduler.stop()
+    assert scheduler.jobs() == []
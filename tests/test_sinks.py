@@ -0,0 +1,191 @@
+# ====================================================================
+# sms_sinks 테스트: 웹훅 재시도, SMTP 배치 전송, 발신함 파일 복원
+# ====================================================================
+# 외부 서버 대신 로컬 http.server / socketserver로 만든 대역을 사용합니다.
+
+import email
+import email.policy
+import http.server
+import json
+import socketserver
+import threading
+import time
+
+import pytest
+
+from sms_sinks import AlertOutbox, AlertSink, SmtpSink, WebhookSink
+
+FAST_RETRY = (0.05, 0.05, 0.05)
+
+
+def wait_until(predicate, timeout=5):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+class RecordingSink(AlertSink):
+
+    def __init__(self, name='recording'):
+        self.name = name
+        self.batches = []
+
+    def deliver(self, notifications):
+        self.batches.append(list(notifications))
+
+
+@pytest.fixture
+def webhook_server():
+    """응답 코드 목록을 차례로 돌려주고, 받은 요청 본문을 기록하는 HTTP 서버"""
+    state = {'codes': [], 'bodies': []}
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers['Content-Length']))
+            state['bodies'].append(json.loads(body))
+            code = state['codes'].pop(0) if state['codes'] else 204
+            self.send_response(code)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    state['url'] = f"http://127.0.0.1:{server.server_address[1]}/alerts"
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def smtp_server():
+    """DATA로 받은 메시지를 기록하는 최소한의 SMTP 대역"""
+    messages = []
+
+    class Handler(socketserver.StreamRequestHandler):
+        def reply(self, line):
+            self.wfile.write(line.encode('ascii') + b"\r\n")
+
+        def handle(self):
+            self.reply("220 localhost ready")
+            while True:
+                line = self.rfile.readline()
+                if not line:
+                    return
+                command = line.decode('ascii').strip().upper()
+                if command.startswith('DATA'):
+                    self.reply("354 end with <CRLF>.<CRLF>")
+                    lines = []
+                    while True:
+                        data = self.rfile.readline()
+                        if data in (b".\r\n", b""):
+                            break
+                        lines.append(data[1:] if data.startswith(b"..") else data)
+                    messages.append(email.message_from_bytes(b"".join(lines), policy=email.policy.default))
+                    self.reply("250 queued")
+                elif command.startswith('QUIT'):
+                    self.reply("221 bye")
+                    return
+                else:
+                    self.reply("250 ok")
+
+    server = socketserver.ThreadingTCPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address[1], messages
+    server.shutdown()
+    server.server_close()
+
+
+def test_alert_sink_requires_deliver():
+    with pytest.raises(TypeError):
+        AlertSink()
+
+
+def test_webhook_retries_after_server_errors(webhook_server):
+    webhook_server['codes'] = [500, 500, 204]
+    outbox = AlertOutbox([WebhookSink(webhook_server['url'], timeout=2)], retry_delays=FAST_RETRY)
+    notification = outbox.submit("삼성전자 알림", "최고가 대비 1%")
+    outbox.start()
+    try:
+        assert wait_until(lambda: outbox.pending_count() == 0)
+    finally:
+        outbox.stop()
+    assert len(webhook_server['bodies']) == 3
+    assert all(body['notifications'] == [notification] for body in webhook_server['bodies'])
+
+
+def test_webhook_gives_up_after_last_retry(webhook_server):
+    webhook_server['codes'] = [500] * 10
+    logs = []
+    outbox = AlertOutbox([WebhookSink(webhook_server['url'], timeout=2)], retry_delays=(0.05,),
+                         log=lambda level, message: logs.append(level))
+    outbox.submit("알림", "내용")
+    outbox.start()
+    try:
+        assert wait_until(lambda: outbox.pending_count() == 0)
+    finally:
+        outbox.stop()
+    assert len(webhook_server['bodies']) == 2
+    assert logs == ["WARNING", "ERROR"]
+
+
+def test_smtp_sends_backlog_as_one_message(smtp_server):
+    port, messages = smtp_server
+    sink = SmtpSink('127.0.0.1', port, 'sms@localhost', ['me@localhost'], timeout=2)
+    outbox = AlertOutbox([sink], max_batch=20, retry_delays=FAST_RETRY)
+    titles = [f"알림 {i}" for i in range(3)]
+    for title in titles:
+        outbox.submit(title, "내용")
+    outbox.start()
+    try:
+        assert wait_until(lambda: outbox.pending_count() == 0)
+    finally:
+        outbox.stop()
+    assert len(messages) == 1
+    assert messages[0]['Subject'] == "주식 가격 알림 3건"
+    body = messages[0].get_content()
+    assert all(title in body for title in titles)
+
+
+def test_outbox_reloads_pending_after_restart(tmp_path):
+    path = str(tmp_path / 'outbox.json')
+    first = AlertOutbox([RecordingSink('a'), RecordingSink('b')], path=path)
+    sent = [first.submit("알림 1", "내용"), first.submit("알림 2", "내용")]
+
+    # 다시 시작한 프로그램: 설정에서 빠진 싱크 'b'의 알림은 버림
+    sink = RecordingSink('a')
+    second = AlertOutbox([sink], path=path)
+    assert second.pending_count() == 2
+    second.start()
+    try:
+        assert wait_until(lambda: second.pending_count() == 0)
+    finally:
+        second.stop()
+    assert [n['id'] for batch in sink.batches for n in batch] == [n['id'] for n in sent]
+    assert AlertOutbox([RecordingSink('a')], path=path).pending_count() == 0
+
+
+def test_start_is_noop_while_running_and_restarts_after_stop():
+    sink = RecordingSink()
+    outbox = AlertOutbox([sink])
+    outbox.start()
+    threads = list(outbox._threads)
+    outbox.start()
+    assert outbox._threads == threads
+
+    outbox.stop()
+    outbox.start()
+    try:
+        outbox.submit("알림", "내용")
+        assert wait_until(lambda: outbox.pending_count() == 0)
+    finally:
+        outbox.stop()
+    assert len(sink.batches) == 1